@@ -0,0 +1,272 @@
+"""In-process cache for catalog reads.
+
+Destinations, packages, UMKM, contents, guides and camping equipment change
+rarely but every public page view fetches them. ``cached_rows`` and
+``cached_row`` keep the encoded JSON of those reads in a bounded LRU with a
+TTL. Each table has a version counter; an entry is only served while its
+table's version is unchanged.
+
+Invalidation is write-through and needs nothing from the write handlers: a
+Session listener notes which tables a flush touched and bumps their versions
+once the transaction commits (including commits from the write queue thread).
+
+Other workers learn about a write through the ``change_versions`` table: the
+same flush bumps the touched tables' rows inside the writing transaction, and
+every worker polls that table (``watch_change_versions``, every
+``CHANGE_POLL_INTERVAL`` seconds) and invalidates whatever moved. The TTL only
+bounds staleness for writes made outside the app entirely.
+
+``cached_aggregate`` keeps figures computed across several tables (the admin
+dashboard) the same way, keyed by all of their versions.
+
+Catalog collections get strong ETags from their ``change_versions`` row
+(``catalog_etag``), so every worker, before and after a restart, tags an
+unchanged list the same way, and a client revalidating it gets ``304 Not
+Modified`` before any query runs or anything is serialized. Each worker loads
+the rows at startup and keeps them current from its own commits and the poll.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from fastapi import HTTPException, Request, Response
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from backend import database
+from backend.compression import GZIP_ETAG_SUFFIX
+from backend.pagination import NEXT_CURSOR_HEADER
+from backend.projection import RowsResponse, row_dicts
+
+logger = logging.getLogger(__name__)
+
+CACHE_SIZE = int(os.getenv("CATALOG_CACHE_SIZE", "512"))
+CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL", "30"))  # seconds; 0 disables the cache
+CHANGE_POLL_INTERVAL = float(os.getenv("CHANGE_POLL_INTERVAL", "1"))  # seconds; 0 disables polling
+
+class CatalogCache:
+    def __init__(self, maxsize=512, ttl=30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # (table, key) -> (expires_at, version, body)
+        self._versions = {}
+        self._db_versions = {}  # last change_versions seen per table
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def version(self, table):
+        return self._versions.get(table, 0)
+
+    def db_version(self, table):
+        """``table``'s last seen ``change_versions`` version (0 if it was never written)."""
+        return self._db_versions.get(table, 0)
+
+    def get(self, table, key):
+        """Cached body for ``key``, or None when missing, expired or invalidated."""
+        with self._lock:
+            entry = self._entries.get((table, key))
+            if entry is not None:
+                expires_at, version, body = entry
+                if expires_at > time.monotonic() and version == self.version(table):
+                    self._entries.move_to_end((table, key))
+                    self.hits += 1
+                    return body
+                del self._entries[(table, key)]
+            self.misses += 1
+            return None
+
+    def set(self, table, key, body, version):
+        """Store ``body`` read at table ``version``; dropped if the table changed meanwhile."""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            if version != self.version(table):
+                return
+            self._entries[(table, key)] = (time.monotonic() + self.ttl, version, body)
+            self._entries.move_to_end((table, key))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *tables):
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self.version(table) + 1
+            self.invalidations += len(tables)
+
+    def observe(self, db_versions):
+        """Record ``change_versions`` rows and invalidate the tables whose version moved; return those.
+
+        Both happen under the lock, so no reader sees a table's new ETag
+        while its old entries are still served.
+        """
+        with self._lock:
+            moved = [table for table, version in db_versions.items()
+                     if version != self._db_versions.get(table)]
+            for table in moved:
+                self._db_versions[table] = db_versions[table]
+                self._versions[table] = self.version(table) + 1
+            self.invalidations += len(moved)
+            return moved
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._db_versions.clear()
+            self.hits = self.misses = self.invalidations = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "invalidations": self.invalidations,
+                "versions": dict(self._versions),
+            }
+
+catalog_cache = CatalogCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
+
+def _json(body, etag=None):
+    headers = {"ETag": etag, "Cache-Control": "no-cache"} if etag else None
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _plain_etag(tag):
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored; a
+    # "-gz" suffix marks the gzipped variant (backend/compression.py)
+    tag = tag.strip().removeprefix("W/")
+    suffix = f'{GZIP_ETAG_SUFFIX}"'
+    return tag[:-len(suffix)] + '"' if tag.endswith(suffix) else tag
+
+def etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in {_plain_etag(tag) for tag in if_none_match.split(",")}
+
+def catalog_etag(model):
+    """Dependency: the ETag of ``model``'s collection at its current ``change_versions`` version.
+
+    Answers ``304 Not Modified`` right away when the request's ``If-None-Match``
+    already holds it. The query string is part of the tag, since each page or
+    filter is a different representation.
+    """
+    table = model.__tablename__
+
+    def check(request: Request):
+        variant = zlib.crc32(request.url.query.encode())
+        etag = f'"{table}.{catalog_cache.db_version(table)}.{variant:x}"'
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers={"ETag": etag})
+        return etag
+    return check
+
+def _page_entry(rows, page):
+    """Cache entry for a list: its body and, with a ``Page``, the next page's cursor."""
+    next_cursor = page.next_cursor(rows) if page else None
+    return RowsResponse(rows).body, next_cursor
+
+async def cached_rows(db, model, key, query, etag=None, page=None):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """JSON list of ``query``'s rows, served from the cache while ``model``'s table is unchanged.
+
+    ``etag`` (from ``catalog_etag``) is sent back on the response. With ``page``,
+    ``query`` must come from ``page.apply``; the response then carries
+    ``X-Next-Cursor`` when more rows follow.
+    """
+    table = model.__tablename__
+    entry = catalog_cache.get(table, key)
+    if entry is None:
+        version = catalog_cache.version(table)
+        entry = _page_entry(row_dicts(await db.execute(query)), page)
+        catalog_cache.set(table, key, entry, version)
+    body, next_cursor = entry
+    response = _json(body, etag)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return response
+
+async def cached_row(db, model, key, query):
+    """Like ``cached_rows`` for a single row; None when ``query`` finds nothing."""
+    table = model.__tablename__
+    body = catalog_cache.get(table, key)
+    if body is None:
+        version = catalog_cache.version(table)
+        rows = row_dicts(await db.execute(query))
+        if not rows:
+            return None
+        body = RowsResponse(rows[0]).body
+        catalog_cache.set(table, key, body, version)
+    return _json(body)
+
+async def cached_aggregate(name, models, build):
+    """JSON of ``await build()``, cached until one of ``models``' tables changes (or the TTL ends).
+
+    For figures computed across several tables; the key holds their versions,
+    so any write to one of them makes the next read rebuild.
+    """
+    key = (name, *(catalog_cache.version(model.__tablename__) for model in models))
+    body = catalog_cache.get("aggregates", key)
+    if body is None:
+        body = RowsResponse(await build()).body
+        catalog_cache.set("aggregates", key, body, catalog_cache.version("aggregates"))
+    return _json(body)
+
+_BUMP_VERSION = text(
+    "INSERT INTO change_versions (table_name, version) VALUES (:table, 1) "
+    "ON CONFLICT (table_name) DO UPDATE SET version = version + 1 RETURNING version"
+)
+
+def mark_changed(session, *tables):
+    """Bump ``tables``' versions with ``session``'s transaction, for writes the ORM doesn't see."""
+    # Bumped inside the writing transaction: other workers see the row change
+    # exactly when they can see the data.
+    conn = session.connection()
+    changed = session.info.setdefault("changed_versions", {})
+    for table in sorted(tables):
+        changed[table] = conn.execute(_BUMP_VERSION, {"table": table}).scalar_one()
+
+@event.listens_for(Session, "after_flush")
+def _record_changed_tables(session, flush_context):
+    tables = {
+        obj.__tablename__ for obj in (*session.new, *session.dirty, *session.deleted)
+        if hasattr(obj, "__tablename__")
+    }
+    if tables:
+        mark_changed(session, *tables)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_tables(session):
+    changed = session.info.pop("changed_versions", None)
+    if changed:
+        catalog_cache.observe(changed)  # the poll then finds nothing new for these
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed_tables(session):
+    session.info.pop("changed_versions", None)
+
+async def sync_change_versions():
+    """Invalidate the tables other workers changed since the last check; returns them."""
+    async with database.async_read_engine.connect() as conn:
+        rows = (await conn.execute(text("SELECT table_name, version FROM change_versions"))).all()
+    return catalog_cache.observe(dict(rows))
+
+async def watch_change_versions(interval=CHANGE_POLL_INTERVAL):
+    """Poll ``change_versions`` until cancelled (run from the app lifespan)."""
+    while True:
+        try:
+            await sync_change_versions()
+        except OperationalError as exc:
+            logger.warning("Could not poll change_versions: %s", exc)
+        await asyncio.sleep(interval)
@@ -0,0 +1,58 @@
+"""Append-only change log behind ``GET /changes`` (delta sync).
+
+Every flush that inserts, updates or deletes a row of a ``LOGGED_TABLES`` table
+appends one ``change_log`` entry per row in the same transaction, so the log
+never disagrees with the data. The entry id is the change version clients pass
+back as ``since``.
+
+``compact_change_log`` keeps only the newest entry per row (deletes stay as
+tombstones). A client syncing from any version still sees the latest change of
+every row touched after it, and the log stays bounded by the number of rows
+rather than the number of writes.
+"""
+import asyncio
+import logging
+import os
+
+from sqlalchemy import event, insert, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from backend import database, models
+
+logger = logging.getLogger(__name__)
+
+LOGGED_TABLES = {
+    "destinations", "packages", "bookings", "tickets",
+    "camping_equipment", "equipment_rentals", "feedbacks",
+}
+COMPACT_INTERVAL = float(os.getenv("CHANGE_LOG_COMPACT_INTERVAL", "3600"))  # seconds; 0 disables
+
+@event.listens_for(Session, "after_flush")
+def _log_changes(session, flush_context):
+    entries = []
+    for op, objects in (("insert", session.new), ("update", session.dirty), ("delete", session.deleted)):
+        for obj in objects:
+            table = getattr(obj, "__tablename__", None)
+            if table in LOGGED_TABLES and (op != "update" or session.is_modified(obj)):
+                entries.append({"table_name": table, "row_id": obj.id, "op": op})
+    if entries:
+        session.connection().execute(insert(models.ChangeLog), entries)
+
+def compact_change_log(bind=None):
+    """Drop all but the newest entry per row; returns the number of entries removed."""
+    with (bind or database.engine).begin() as conn:
+        return conn.execute(text(
+            "DELETE FROM change_log WHERE id NOT IN "
+            "(SELECT MAX(id) FROM change_log GROUP BY table_name, row_id)"
+        )).rowcount
+
+async def compact_periodically(interval=COMPACT_INTERVAL):
+    """Compact the change log every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            removed = await asyncio.to_thread(compact_change_log)
+            logger.info("Compacted change log: %d entries removed", removed)
+        except OperationalError as exc:
+            logger.warning("Could not compact change log: %s", exc)
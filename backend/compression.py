@@ -0,0 +1,165 @@
+"""gzip for API responses, compressing each catalog version only once.
+
+Catalog collections are a few hundred KB of JSON and most of their readers
+sit behind the Cloudflare tunnel or a slow island mobile link, where transfer
+time dominates. ``CompressionMiddleware`` gzips any complete response body of
+at least ``GZIP_MIN_SIZE`` bytes for clients that accept it.
+
+Responses that carry an ``ETag`` (the catalog lists and ``/catalog/``, whose
+tags change with their table versions, see ``backend/cache.py``) are the
+same bytes until the data changes, so their compressed body is kept in a small
+LRU keyed by URL and ETag. Repeat requests for an unchanged collection then
+cost a dict lookup and a CRC32 of the body instead of another gzip pass; a
+write gives the collection a new ETag, and the stale entry ages out. The CRC
+guards against bodies that changed under the same tag (rows written outside
+the app, picked up when the catalog cache's TTL runs out). Streaming
+responses (``/export``) pass through uncompressed.
+
+The gzipped bytes are a different representation from the plain ones, so
+their strong ETag gets a ``-gz`` suffix (``etag_matches`` strips it when a
+client revalidates, and a ``304`` for such a tag carries it back).
+"""
+import gzip
+import os
+import threading
+import zlib
+from collections import OrderedDict
+
+GZIP_MIN_SIZE = int(os.getenv("GZIP_MIN_SIZE", "1024"))  # bytes
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+COMPRESSED_CACHE_SIZE = int(os.getenv("COMPRESSED_CACHE_SIZE", "256"))  # entries; 0 disables the cache
+GZIP_ETAG_SUFFIX = "-gz"
+
+class CompressedCache:
+    """LRU of ``(crc32 of the raw body, gzipped body)`` keyed by (URL, ETag)."""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, checksum):
+        """The compressed body stored for ``key``, if it was made from a body with ``checksum``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != checksum:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, checksum, compressed):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (checksum, compressed)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {"size": len(self._entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+compressed_cache = CompressedCache(maxsize=COMPRESSED_CACHE_SIZE)
+
+def _header(scope, name):
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+def _accepts_gzip(scope):
+    """Whether ``Accept-Encoding`` gives gzip (by name, else through ``*``) a non-zero q-value."""
+    qualities = {}
+    for coding in (_header(scope, b"accept-encoding") or "").lower().split(","):
+        name, *params = (part.strip() for part in coding.split(";"))
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+def _gzip_etag(etag):
+    return etag[:-1] + GZIP_ETAG_SUFFIX.encode() + b'"'  # inside the closing quote
+
+class CompressionMiddleware:
+    """ASGI middleware: gzip complete bodies, reusing the compressed bytes of ETagged ones."""
+
+    def __init__(self, app, minimum_size=GZIP_MIN_SIZE, level=GZIP_LEVEL, cache=compressed_cache):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        self.cache = cache
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not _accepts_gzip(scope):
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+            elif message["type"] == "http.response.start":
+                if message["status"] == 304:
+                    message = self._not_modified(scope, message)
+                start = message  # held until we know whether the body gets compressed
+            elif message.get("more_body", False):
+                passthrough = True  # streaming: send as it comes
+                await send(start)
+                await send(message)
+            else:
+                await self._send_whole(scope, start, message.get("body", b""), send)
+
+        await self.app(scope, receive, send_compressed)
+
+    @staticmethod
+    def _not_modified(scope, start):
+        """A 304 for the ``-gz`` tag the client revalidated carries that tag, not the plain one."""
+        headers = start["headers"]
+        etag = dict((name.lower(), value) for name, value in headers).get(b"etag")
+        if etag is None or _gzip_etag(etag).decode("latin-1") not in (_header(scope, b"if-none-match") or ""):
+            return start
+        return {**start, "headers": [(name, _gzip_etag(value) if name.lower() == b"etag" else value)
+                                     for name, value in headers]}
+
+    async def _send_whole(self, scope, start, body, send):
+        headers = {name.lower(): value for name, value in start["headers"]}
+        if len(body) < self.minimum_size or b"content-encoding" in headers or start["status"] != 200:
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+            return
+        etag = headers.get(b"etag")
+        key = (scope["path"], scope["query_string"], etag) if etag else None
+        checksum = zlib.crc32(body) if key else None
+        compressed = self.cache.get(key, checksum) if key else None
+        if compressed is None:
+            compressed = gzip.compress(body, compresslevel=self.level, mtime=0)
+            if key:
+                self.cache.set(key, checksum, compressed)
+        raw_headers = [(name, _gzip_etag(value) if name.lower() == b"etag" else value)
+                       for name, value in start["headers"] if name.lower() not in (b"content-length", b"vary")]
+        vary = headers.get(b"vary", b"")
+        if b"accept-encoding" not in vary.lower():
+            vary = b", ".join(filter(None, (vary, b"Accept-Encoding")))
+        raw_headers += [(b"content-encoding", b"gzip"), (b"content-length", str(len(compressed)).encode()),
+                        (b"vary", vary)]
+        await send({**start, "headers": raw_headers})
+        await send({"type": "http.response.body", "body": compressed})
@@ -1,16 +1,123 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import StaticPool
 
 import os
 
 DATABASE_PATH = os.environ.get("DATABASE_PATH", "./backend/tourism.db")
 SQLALCHEMY_DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
-engine = create_engine(
+# --- SQLite tuning profile ---
+# "production" applies the pragmas below on every new connection,
+# "default" leaves SQLite's stock settings (rollback journal, full fsync).
+SQLITE_PROFILE = os.environ.get("SQLITE_PROFILE", "production")
+
+SQLITE_PRAGMAS = {
+    "journal_mode": os.environ.get("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", 5000)),
+    "cache_size": int(os.environ.get("SQLITE_CACHE_SIZE", -64000)),  # negative = KiB, so 64 MB
+    "mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", 268435456)),  # 256 MB
+    "temp_store": os.environ.get("SQLITE_TEMP_STORE", "MEMORY"),
+}
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas=None):
+    """Run the tuning pragmas on a raw sqlite3 connection."""
+    pragmas = SQLITE_PRAGMAS if pragmas is None else pragmas
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+def configure_engine(target_engine, profile=None, read_only=False):
+    """Attach the connect hook for the selected profile to an engine.
+
+    Read-only engines skip ``journal_mode`` (it's a write, and persistent anyway)
+    and always get ``query_only`` as a second guard against accidental writes.
+    """
+    profile = SQLITE_PROFILE if profile is None else profile
+    if target_engine.dialect.name != "sqlite":
+        return target_engine
+    pragmas = dict(SQLITE_PRAGMAS) if profile == "production" else {}
+    if read_only:
+        pragmas.pop("journal_mode", None)
+        pragmas["query_only"] = "ON"
+    if not pragmas:
+        return target_engine
+
+    @event.listens_for(target_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection, pragmas)
+
+    return target_engine
+
+engine = configure_engine(create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# --- Read-only engine ---
+# GET routes use their own pool of read-only connections, so under WAL list and
+# dashboard reads run alongside writers and can never take the write lock.
+READ_POOL_SIZE = int(os.environ.get("DB_READ_POOL_SIZE", 10))
+READ_MAX_OVERFLOW = int(os.environ.get("DB_READ_MAX_OVERFLOW", 20))
+
+def create_read_engine(path=DATABASE_PATH):
+    return configure_engine(create_engine(
+        f"sqlite:///file:{path}?mode=ro&uri=true",
+        connect_args={"check_same_thread": False},
+        pool_size=READ_POOL_SIZE,
+        max_overflow=READ_MAX_OVERFLOW,
+    ), read_only=True)
+
+read_engine = create_read_engine()
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# --- Async engines ---
+# Hot endpoints are ``async def`` handlers on aiosqlite, so waiting on SQLite
+# doesn't hold one of the threadpool slots that sync handlers run in.
+def create_async_engines(path=DATABASE_PATH):
+    """Return ``(read_write, read_only)`` aiosqlite engines for ``path``."""
+    async_rw = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async_ro = create_async_engine(
+        f"sqlite+aiosqlite:///file:{path}?mode=ro&uri=true",
+        pool_size=READ_POOL_SIZE,
+        max_overflow=READ_MAX_OVERFLOW,
+    )
+    configure_engine(async_rw.sync_engine)
+    configure_engine(async_ro.sync_engine, read_only=True)
+    return async_rw, async_ro
+
+async_engine, async_read_engine = create_async_engines()
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False)
+
+# --- Write queue ---
+# DB_WRITE_QUEUE=1 routes router mutations through a single writer thread that
+# group-commits them (see backend/write_queue.py).
+WRITE_QUEUE_ENABLED = os.environ.get("DB_WRITE_QUEUE", "0") == "1"
+WRITE_QUEUE_MAX_BATCH = int(os.environ.get("DB_WRITE_BATCH", 64))
+
+def create_writer_engine(url=SQLALCHEMY_DATABASE_URL):
+    """Single-connection engine for the writer thread.
+
+    pysqlite's implicit transactions break SAVEPOINT, so the driver is put in
+    autocommit mode and SQLAlchemy emits BEGIN IMMEDIATE itself; that also takes
+    the write lock up front instead of upgrading from a read lock mid-batch.
+    """
+    writer_engine = configure_engine(create_engine(
+        url, connect_args={"check_same_thread": False, "isolation_level": None}, poolclass=StaticPool
+    ))
+
+    @event.listens_for(writer_engine, "begin")
+    def _on_begin(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return writer_engine
+
 Base = declarative_base()
 
 def get_db():
@@ -19,3 +126,23 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def get_read_db():
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def get_async_read_db():
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+async def dispose_async_engines():
+    """Close pooled aiosqlite connections; they are bound to the running event loop."""
+    await async_engine.dispose()
+    await async_read_engine.dispose()
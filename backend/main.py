@@ -1,15 +1,42 @@
-from fastapi import FastAPI
+import asyncio
+import contextlib
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from backend.database import engine, Base
-from backend.routers import destinations, packages, bookings, umkm, facilities, contents, tickets, products, feedback, events, rentals, guides, users
+from fastapi.responses import JSONResponse
+from backend.cache import CHANGE_POLL_INTERVAL, catalog_cache, watch_change_versions
+from backend.change_log import COMPACT_INTERVAL, compact_periodically
+from backend.compression import CompressionMiddleware, compressed_cache
+from backend.database import dispose_async_engines
+from backend.pagination import NEXT_CURSOR_HEADER
+from backend.warmup import warm_up
+from backend.routers import destinations, packages, bookings, umkm, facilities, contents, tickets, products, feedback, events, rentals, guides, users, catalog, changes, stats, exports
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+# Tables are created and migrated by `python -m backend.migrations`, not at import.
+
+@asynccontextmanager
+async def lifespan(fastapi_app: FastAPI):
+    fastapi_app.state.ready = await warm_up()
+    background = []
+    if fastapi_app.state.ready:
+        # Picks up writes made by the other workers (see backend/cache.py)
+        if CHANGE_POLL_INTERVAL > 0:
+            background.append(asyncio.create_task(watch_change_versions(CHANGE_POLL_INTERVAL)))
+        if COMPACT_INTERVAL > 0:
+            background.append(asyncio.create_task(compact_periodically(COMPACT_INTERVAL)))
+    yield
+    fastapi_app.state.ready = False
+    for task in background:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    await dispose_async_engines()
 
 app = FastAPI(
     title="Pulau Harapan Tourism API",
     description="API untuk platform manajemen pariwisata Pulau Harapan",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 # CORS
@@ -19,7 +46,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
+# gzip, compressing each version of a catalog collection once (see backend/compression.py)
+app.add_middleware(CompressionMiddleware)
 
 # Routers
 app.include_router(users.router)
@@ -35,6 +65,22 @@ app.include_router(feedback.router)
 app.include_router(events.router)
 app.include_router(rentals.router)
 app.include_router(guides.router)
+app.include_router(catalog.router)
+app.include_router(changes.router)
+app.include_router(stats.router)
+app.include_router(exports.router)
+
+@app.get("/ready")
+def read_ready(request: Request):
+    """Readiness probe: 200 once the schema is current and pools/caches are warm."""
+    if not getattr(request.app.state, "ready", False):
+        return JSONResponse(status_code=503, content={"status": "starting"})
+    return {"status": "ready"}
+
+@app.get("/cache/stats")
+def read_cache_stats():
+    """Catalog cache size, hit/miss counters and per-table versions, plus the compressed body cache."""
+    return {**catalog_cache.stats(), "compressed": compressed_cache.stats()}
 
 @app.get("/")
 def read_root():
@@ -47,6 +93,10 @@ def read_root():
             "/bookings",
             "/umkm",
             "/facilities",
-            "/contents"
+            "/contents",
+            "/catalog",
+            "/changes",
+            "/stats",
+            "/export"
         ]
     }
@@ -0,0 +1,215 @@
+"""Schema management: ``python -m backend.migrations``.
+
+Run this before starting the API (the Dockerfile, render.yaml and start_app.sh
+do); the app itself never creates or alters tables at import or startup.
+
+``migrate`` creates missing tables from the models, then applies versioned
+migrations: ``create_all`` alone never changes a table that already exists,
+so changes to live databases go here as numbered steps recorded in
+``schema_migrations``. Each step is applied once, in order, inside its own
+transaction.
+
+A step is a list of SQL strings or callables taking the connection. Steps must
+also be safe on a database that ``create_all`` just built from the current
+models (hence ``IF NOT EXISTS``).
+"""
+import logging
+import re
+from datetime import date, datetime
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from backend import models  # registers the tables on Base.metadata
+from backend.database import Base, engine
+
+logger = logging.getLogger(__name__)
+
+# Legacy free-text dates seen besides ISO; day-first, as entered in Indonesia.
+LEGACY_DATE_FORMATS = ("%d/%m/%Y", "%d-%m-%Y", "%Y/%m/%d")
+
+def _parse_legacy_date(value):
+    """ISO string for a legacy date value, or None when it can't be parsed."""
+    value = str(value).strip()
+    try:
+        return date.fromisoformat(value[:10]).isoformat()
+    except ValueError:
+        pass
+    for fmt in LEGACY_DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+def _retype_as_date(table, *columns):
+    """Step: backfill ``columns`` of ``table`` as ISO dates and declare them DATE.
+
+    SQLite can't change a column type in place, so the table is recreated from
+    its own stored DDL with the types swapped, the rows copied over and the
+    indexes re-created. Values that don't parse become NULL; their raw text is
+    kept in ``legacy_date_values`` and the row ids are logged for cleanup.
+    """
+    def step(conn):
+        backup = models.LegacyDateValue.__table__
+        backup.create(conn, checkfirst=True)
+        for column in columns:
+            rows = conn.execute(text(f"SELECT id, {column} FROM {table} WHERE {column} IS NOT NULL")).all()
+            unparseable = []
+            for row_id, value in rows:
+                parsed = _parse_legacy_date(value)
+                if parsed is None:
+                    unparseable.append({"table_name": table, "column_name": column,
+                                        "row_id": row_id, "raw_value": str(value)})
+                if parsed != value:
+                    conn.execute(text(f"UPDATE {table} SET {column} = :value WHERE id = :id"),
+                                 {"value": parsed, "id": row_id})
+            if unparseable:
+                conn.execute(backup.insert(), unparseable)
+                logger.warning("%s.%s: %d unparseable dates set to NULL, raw text kept in %s (ids %s)",
+                               table, column, len(unparseable), backup.name,
+                               ", ".join(str(row["row_id"]) for row in unparseable))
+
+        ddl = conn.execute(text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :t"),
+                           {"t": table}).scalar()
+        new_ddl = ddl
+        for column in columns:
+            new_ddl = re.sub(rf"\b({column}\s+)VARCHAR\b", r"\1DATE", new_ddl)
+        if new_ddl == ddl:  # already created from the current models
+            return
+
+        indexes = conn.execute(text(
+            "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = :t AND sql IS NOT NULL"
+        ), {"t": table}).scalars().all()
+        new_ddl = re.sub(rf'^CREATE TABLE\s+"?{table}"?', f"CREATE TABLE {table}__new", new_ddl)
+        conn.execute(text(new_ddl))
+        conn.execute(text(f"INSERT INTO {table}__new SELECT * FROM {table}"))
+        conn.execute(text(f"DROP TABLE {table}"))
+        conn.execute(text(f"ALTER TABLE {table}__new RENAME TO {table}"))
+        for index_sql in indexes:
+            conn.execute(text(index_sql))
+    return step
+
+def _add_column(table, column, ddl):
+    """Step: ``ALTER TABLE ... ADD COLUMN`` unless ``create_all`` already made it."""
+    def step(conn):
+        existing = {row[1] for row in conn.execute(text(f"PRAGMA table_info({table})"))}
+        if column not in existing:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+    return step
+
+# Visitor rollups for the history recorded before backend/rollups.py existed:
+# check-ins count at their check-in hour, confirmed bookings' revenue at the hour
+# they were created, as ``rollups._booked_at`` files it live.
+_BACKFILL_VISITOR_STATS = """
+INSERT INTO visitor_stats (destination_id, date, hour, visitor_count, revenue)
+SELECT destination_id, day, hour, SUM(visitors), SUM(revenue) FROM (
+    SELECT p.destination_id, date(t.check_in_time) AS day, CAST(strftime('%H', t.check_in_time) AS INTEGER) AS hour,
+           COALESCE(b.num_visitors, 1) AS visitors, 0 AS revenue
+    FROM tickets t JOIN bookings b ON b.id = t.booking_id LEFT JOIN packages p ON p.id = b.package_id
+    WHERE t.status = 'used' AND t.check_in_time IS NOT NULL
+    UNION ALL
+    SELECT p.destination_id, date(COALESCE(b.created_at, b.date)),
+           CAST(COALESCE(strftime('%H', b.created_at), 0) AS INTEGER), 0,
+           COALESCE(b.total_price, p.price * COALESCE(b.num_visitors, 1), 0)
+    FROM bookings b LEFT JOIN packages p ON p.id = b.package_id
+    WHERE b.status = 'confirmed'
+)
+WHERE day IS NOT NULL AND NOT EXISTS (SELECT 1 FROM visitor_stats)
+GROUP BY destination_id, day, hour
+"""
+
+MIGRATIONS = [
+    (1, "foreign key and filter indexes", [
+        "CREATE INDEX IF NOT EXISTS ix_tickets_booking_id ON tickets (booking_id)",
+        "CREATE INDEX IF NOT EXISTS ix_bookings_package_id ON bookings (package_id)",
+        "CREATE INDEX IF NOT EXISTS ix_packages_destination_id ON packages (destination_id)",
+        "CREATE INDEX IF NOT EXISTS ix_products_umkm_id ON products (umkm_id)",
+        "CREATE INDEX IF NOT EXISTS ix_facilities_destination_id ON facilities (destination_id)",
+        "CREATE INDEX IF NOT EXISTS ix_events_destination_id ON events (destination_id)",
+        "CREATE INDEX IF NOT EXISTS ix_events_event_date ON events (event_date)",
+        "CREATE INDEX IF NOT EXISTS ix_feedbacks_created_at ON feedbacks (created_at)",
+        "CREATE INDEX IF NOT EXISTS ix_feedbacks_type_created_at ON feedbacks (type, created_at)",
+        "CREATE INDEX IF NOT EXISTS ix_visitor_stats_destination_id ON visitor_stats (destination_id)",
+        "CREATE INDEX IF NOT EXISTS ix_equipment_rentals_status ON equipment_rentals (status)",
+        "CREATE INDEX IF NOT EXISTS ix_equipment_rentals_equipment_id_status "
+        "ON equipment_rentals (equipment_id, status)",
+        "CREATE INDEX IF NOT EXISTS ix_guide_bookings_guide_id ON guide_bookings (guide_id)",
+    ]),
+    (2, "typed date columns", [
+        _retype_as_date("bookings", "date"),
+        _retype_as_date("equipment_rentals", "rental_date", "return_date"),
+        _retype_as_date("guide_bookings", "booking_date"),
+        "CREATE INDEX IF NOT EXISTS ix_bookings_date ON bookings (date)",
+        "CREATE INDEX IF NOT EXISTS ix_equipment_rentals_rental_date ON equipment_rentals (rental_date)",
+        "CREATE INDEX IF NOT EXISTS ix_guide_bookings_booking_date ON guide_bookings (booking_date)",
+    ]),
+    (3, "change versions", [
+        "CREATE TABLE IF NOT EXISTS change_versions "
+        "(table_name VARCHAR NOT NULL PRIMARY KEY, version INTEGER NOT NULL)",
+    ]),
+    (4, "change log", [
+        "CREATE TABLE IF NOT EXISTS change_log (id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT, "
+        "table_name VARCHAR NOT NULL, row_id INTEGER NOT NULL, op VARCHAR NOT NULL, changed_at DATETIME)",
+        "CREATE INDEX IF NOT EXISTS ix_change_log_table_name_row_id ON change_log (table_name, row_id)",
+    ]),
+    (5, "dashboard indexes", [
+        "CREATE INDEX IF NOT EXISTS ix_bookings_status ON bookings (status)",
+        "CREATE INDEX IF NOT EXISTS ix_umkm_rating ON umkm (rating)",
+    ]),
+    (6, "hourly visitor rollups", [
+        _add_column("visitor_stats", "hour", "INTEGER DEFAULT 0"),
+        _retype_as_date("visitor_stats", "date"),
+        "CREATE INDEX IF NOT EXISTS ix_visitor_stats_date_destination_id_hour "
+        "ON visitor_stats (date, destination_id, hour)",
+        _BACKFILL_VISITOR_STATS,
+    ]),
+]
+
+def applied_versions(conn):
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_migrations "
+        "(version INTEGER PRIMARY KEY, name VARCHAR, applied_at DATETIME)"
+    ))
+    return {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+
+def run_migrations(bind):
+    """Apply pending migrations to ``bind`` and return the versions applied."""
+    with bind.begin() as conn:
+        done = applied_versions(conn)
+
+    applied = []
+    for version, name, steps in MIGRATIONS:
+        if version in done:
+            continue
+        with bind.begin() as conn:
+            for step in steps:
+                if isinstance(step, str):
+                    conn.execute(text(step))
+                else:
+                    step(conn)  # pylint: disable=not-callable
+            # OR IGNORE: another worker may have applied the same idempotent step
+            conn.execute(
+                text("INSERT OR IGNORE INTO schema_migrations (version, name, applied_at) VALUES (:v, :n, :t)"),
+                {"v": version, "n": name, "t": datetime.utcnow()},
+            )
+        applied.append(version)
+    return applied
+
+def pending_versions(bind):
+    """Versions not yet applied to ``bind``; read-only, so safe on a read-only engine."""
+    with bind.connect() as conn:
+        try:
+            done = {row[0] for row in conn.execute(text("SELECT version FROM schema_migrations"))}
+        except OperationalError:  # never migrated
+            done = set()
+    return [version for version, _, _ in MIGRATIONS if version not in done]
+
+def migrate(bind=engine):
+    """Create missing tables, then apply pending migrations."""
+    Base.metadata.create_all(bind=bind)
+    return run_migrations(bind)
+
+if __name__ == "__main__":
+    applied = migrate()
+    print(f"Applied migrations: {applied}" if applied else "Schema is up to date")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Text, Boolean, Date, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from backend.database import Base
 from datetime import datetime
@@ -43,7 +43,7 @@ class Destination(Base):
 class Facility(Base):
     __tablename__ = "facilities"
     id = Column(Integer, primary_key=True, index=True)
-    destination_id = Column(Integer, ForeignKey("destinations.id"))
+    destination_id = Column(Integer, ForeignKey("destinations.id"), index=True)
     name = Column(String)
     type = Column(String)  # toilet, parking, mushola, umkm_zone
     coordinates = Column(String, nullable=True)  # JSON string for lat/lng
@@ -53,10 +53,10 @@ class Facility(Base):
 class Event(Base):
     __tablename__ = "events"
     id = Column(Integer, primary_key=True, index=True)
-    destination_id = Column(Integer, ForeignKey("destinations.id"))
+    destination_id = Column(Integer, ForeignKey("destinations.id"), index=True)
     title = Column(String)
     description = Column(Text)
-    event_date = Column(DateTime)
+    event_date = Column(DateTime, index=True)
     image_url = Column(String, nullable=True)
     
     destination = relationship("Destination", back_populates="events")
@@ -68,12 +68,12 @@ class Package(Base):
     name = Column(String, index=True)
     price = Column(Float)
     features = Column(Text)
-    destination_id = Column(Integer, ForeignKey("destinations.id"), nullable=True)
+    destination_id = Column(Integer, ForeignKey("destinations.id"), nullable=True, index=True)
 
 class Ticket(Base):
     __tablename__ = "tickets"
     id = Column(Integer, primary_key=True, index=True)
-    booking_id = Column(Integer, ForeignKey("bookings.id"))
+    booking_id = Column(Integer, ForeignKey("bookings.id"), index=True)
     qr_code = Column(String, unique=True)
     status = Column(String, default="valid")  # valid, used, expired
     check_in_time = Column(DateTime, nullable=True)
@@ -85,9 +85,9 @@ class Booking(Base):
     id = Column(Integer, primary_key=True, index=True)
     customer_name = Column(String)
     email = Column(String)
-    package_id = Column(Integer, ForeignKey("packages.id"))
-    date = Column(String)
-    status = Column(String, default="pending")  # pending, confirmed, cancelled, completed
+    package_id = Column(Integer, ForeignKey("packages.id"), index=True)
+    date = Column(Date, index=True)
+    status = Column(String, default="pending", index=True)  # pending, confirmed, cancelled, completed
     num_visitors = Column(Integer, default=1)
     total_price = Column(Float, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -104,13 +104,13 @@ class UMKM(Base):
     category = Column(String)  # kuliner, souvenir, guide, homestay, workshop
     image_url = Column(String, nullable=True)
     location = Column(String, nullable=True)
-    rating = Column(Float, default=0.0)
+    rating = Column(Float, default=0.0, index=True)
     is_verified = Column(Boolean, default=False)
 
 class Product(Base):
     __tablename__ = "products"
     id = Column(Integer, primary_key=True, index=True)
-    umkm_id = Column(Integer, ForeignKey("umkm.id"))
+    umkm_id = Column(Integer, ForeignKey("umkm.id"), index=True)
     name = Column(String)
     description = Column(Text)
     price = Column(Float)
@@ -131,6 +131,9 @@ class Content(Base):
 # --- Feedback & Safety ---
 class Feedback(Base):
     __tablename__ = "feedbacks"
+    __table_args__ = (
+        Index("ix_feedbacks_type_created_at", "type", "created_at"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     type = Column(String)  # complaint, suggestion, emergency, review
     subject = Column(String)
@@ -138,14 +141,19 @@ class Feedback(Base):
     destination_id = Column(Integer, ForeignKey("destinations.id"), nullable=True)
     status = Column(String, default="open")  # open, in_progress, resolved
     priority = Column(String, default="normal")  # low, normal, high, critical
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
 
 # --- Analytics (for storing aggregated data) ---
 class VisitorStats(Base):
+    """Hourly rollup per destination, maintained by ``backend/rollups.py``."""
     __tablename__ = "visitor_stats"
+    __table_args__ = (
+        Index("ix_visitor_stats_date_destination_id_hour", "date", "destination_id", "hour"),
+    )
     id = Column(Integer, primary_key=True, index=True)
-    destination_id = Column(Integer, ForeignKey("destinations.id"))
-    date = Column(String)
+    destination_id = Column(Integer, ForeignKey("destinations.id"), index=True)
+    date = Column(Date)
+    hour = Column(Integer, default=0)  # 0-23, UTC
     visitor_count = Column(Integer, default=0)
     revenue = Column(Float, default=0.0)
 
@@ -164,15 +172,18 @@ class CampingEquipment(Base):
 
 class EquipmentRental(Base):
     __tablename__ = "equipment_rentals"
+    __table_args__ = (
+        Index("ix_equipment_rentals_equipment_id_status", "equipment_id", "status"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     equipment_id = Column(Integer, ForeignKey("camping_equipment.id"))
     customer_name = Column(String)
     customer_phone = Column(String)
-    rental_date = Column(String)
-    return_date = Column(String)
+    rental_date = Column(Date, index=True)
+    return_date = Column(Date)
     quantity = Column(Integer, default=1)
     total_price = Column(Float)
-    status = Column(String, default="pending")  # pending, active, returned, cancelled
+    status = Column(String, default="pending", index=True)  # pending, active, returned, cancelled
     created_at = Column(DateTime, default=datetime.utcnow)
     
     equipment = relationship("CampingEquipment")
@@ -194,10 +205,10 @@ class TourGuide(Base):
 class GuideBooking(Base):
     __tablename__ = "guide_bookings"
     id = Column(Integer, primary_key=True, index=True)
-    guide_id = Column(Integer, ForeignKey("tour_guides.id"))
+    guide_id = Column(Integer, ForeignKey("tour_guides.id"), index=True)
     customer_name = Column(String)
     customer_phone = Column(String)
-    booking_date = Column(String)
+    booking_date = Column(Date, index=True)
     duration_days = Column(Integer, default=1)
     notes = Column(Text, nullable=True)
     total_price = Column(Float)
@@ -205,3 +216,35 @@ class GuideBooking(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     
     guide = relationship("TourGuide")
+
+# --- Cross-worker cache invalidation ---
+class ChangeVersion(Base):
+    """Per-table write counter, bumped in the writing transaction and polled by every worker."""
+    __tablename__ = "change_versions"
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+class ChangeLog(Base):
+    """Append-only log of row changes for delta sync; ``id`` is the change version."""
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_table_name_row_id", "table_name", "row_id"),
+        {"sqlite_autoincrement": True},  # versions are never reused
+    )
+    id = Column(Integer, primary_key=True)
+    table_name = Column(String, nullable=False)
+    row_id = Column(Integer, nullable=False)
+    op = Column(String, nullable=False)  # insert, update, delete
+    changed_at = Column(DateTime, default=datetime.utcnow)
+
+class LegacyDateValue(Base):
+    """Raw text of a legacy date the DATE migration couldn't parse (the column itself was set to NULL)."""
+    __tablename__ = "legacy_date_values"
+    id = Column(Integer, primary_key=True, index=True)
+    table_name = Column(String, nullable=False)
+    column_name = Column(String, nullable=False)
+    row_id = Column(Integer, nullable=False)
+    raw_value = Column(String, nullable=False)
+
+# Anything that writes through these models keeps visitor_stats current (see backend/rollups.py)
+from backend import rollups
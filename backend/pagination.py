@@ -0,0 +1,143 @@
+"""Keyset (cursor) pagination for list endpoints.
+
+``offset(skip)`` makes SQLite read and throw away every skipped row, so deep
+pages get slower the deeper they are. A cursor holds the sort key of the last
+row served instead, and the next page starts right after it with a range
+condition on an indexed column: every page costs the same.
+
+List endpoints take ``Page`` as a dependency: ``limit`` (capped at
+``MAX_PAGE_SIZE``), ``cursor``, and the old ``skip`` for existing clients.
+When more rows follow, the response carries ``X-Next-Cursor``; send it back as
+``cursor`` for the next page. Cursors are opaque (base64 JSON of the key).
+
+The leading sort column may hold NULLs (an event without a date). SQLite sorts
+them first ascending and last descending, and a row-value comparison is NULL
+for them, so a cursor in the NULL rows gets its own predicate, and a
+descending walk that runs out of non-NULL keys continues into the NULL rows
+(``Page.rows``).
+"""
+import base64
+import binascii
+import json
+import os
+from datetime import date, datetime
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import Select, and_, or_, tuple_
+
+from backend.projection import row_dicts
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "500"))
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+def encode_cursor(values):
+    raw = json.dumps([value.isoformat() if isinstance(value, (date, datetime)) else value for value in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    if not isinstance(values, list) or not values:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+def _typed(column, value):
+    if value is None and column.nullable:
+        return None
+    python_type = column.type.python_type
+    try:
+        if python_type in (date, datetime) and isinstance(value, str):
+            return python_type.fromisoformat(value)
+        return python_type(value)
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+def _with_keys(query, columns):
+    if isinstance(query, Select):
+        # A sparse ``?fields=`` select still needs the key columns for the cursor
+        selected = {column.key for column in query.selected_columns}
+        query = query.add_columns(*(column for column in columns if column.key not in selected))
+    return query
+
+class Page:
+    """``limit``, ``cursor`` and legacy ``skip`` query parameters of a list endpoint."""
+
+    def __init__(self, limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None, skip: int = 0):
+        self.limit = max(1, min(limit, MAX_PAGE_SIZE))
+        self.cursor = cursor
+        self.after = decode_cursor(cursor) if cursor else None
+        self.skip = max(skip, 0)
+        self.keys = ("id",)
+
+    @property
+    def key(self):
+        """Distinguishes this page in cache keys."""
+        return (self.limit, self.cursor, self.skip)
+
+    def apply(self, query, *columns, descending=False):
+        """Order ``query`` by ``columns`` (the last one unique, usually id) and select this page.
+
+        One row more than ``limit`` is selected, so ``next_cursor`` can tell
+        whether another page follows.
+        """
+        self.keys = tuple(column.key for column in columns)
+        query = _with_keys(query, columns)
+        if self.after is not None:
+            query = query.where(self._seek(columns, descending))
+        query = query.order_by(*(column.desc() if descending else column for column in columns))
+        if self.after is None and self.skip:
+            query = query.offset(self.skip)
+        return query.limit(self.limit + 1)
+
+    def _seek(self, columns, descending):
+        """The condition for rows after the cursor in ``columns`` order."""
+        if len(self.after) != len(columns):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        after = [_typed(column, value) for column, value in zip(columns, self.after)]
+        if len(columns) == 1:
+            key, bound = columns[0], after[0]
+        else:
+            key, bound = tuple_(*columns), tuple_(*after)
+        if after[0] is not None:
+            return key < bound if descending else key > bound
+        # Cursor among the NULL keys, which are ordered by the remaining columns
+        rest = tuple_(*columns[1:]) if len(columns) > 2 else columns[1]
+        rest_bound = tuple_(*after[1:]) if len(columns) > 2 else after[1]
+        if descending:  # NULLs come last
+            return and_(columns[0].is_(None), rest < rest_bound)
+        return or_(and_(columns[0].is_(None), rest > rest_bound), columns[0].isnot(None))
+
+    def rows(self, db, query, *columns, descending=False):
+        """Run ``apply``'s query on ``db``; the row dicts of this page, for ``next_cursor``.
+
+        A descending page on a nullable leading column that runs out of
+        non-NULL keys is topped up from the NULL rows with a second query; the
+        seek itself can't include them without giving up the index range.
+        """
+        rows = row_dicts(db.execute(self.apply(query, *columns, descending=descending)))
+        leading = columns[0]
+        past_non_null_key = (self.after or [None])[0] is not None
+        if descending and len(columns) > 1 and leading.nullable and past_non_null_key and len(rows) <= self.limit:
+            nulls = _with_keys(query, columns).where(leading.is_(None))
+            nulls = nulls.order_by(*(column.desc() for column in columns[1:])).limit(self.limit + 1 - len(rows))
+            rows += row_dicts(db.execute(nulls))
+        return rows
+
+    def next_cursor(self, rows):
+        """Drop the look-ahead row from ``rows`` (dicts or objects); the cursor after them, or None."""
+        if len(rows) <= self.limit:
+            return None
+        del rows[self.limit:]
+        last = rows[-1]
+        if isinstance(last, dict):
+            return encode_cursor([last[key] for key in self.keys])
+        return encode_cursor([getattr(last, key) for key in self.keys])
+
+    def headers(self, rows):
+        """Trim ``rows`` like ``next_cursor``; the ``X-Next-Cursor`` header for them ({} on the last page)."""
+        cursor = self.next_cursor(rows)
+        return {NEXT_CURSOR_HEADER: cursor} if cursor else {}
@@ -0,0 +1,89 @@
+"""Core column projections for read-only list endpoints.
+
+Loading ORM objects for a listing fills the session's identity map and then
+Pydantic re-reads every attribute through ``from_attributes``. For plain
+listings ``project`` selects only the columns the response schema exposes,
+``row_dicts`` turns the row tuples into dicts and ``RowsResponse`` writes them
+straight to JSON. The route keeps its ``response_model`` for the OpenAPI docs;
+FastAPI skips validation when a handler returns a ``Response``.
+
+The rows come straight from our own tables, so they need no re-validation;
+``to_json`` encodes them with orjson when it is installed (several times
+faster than the stdlib ``json`` module on large lists) and falls back to
+``json`` otherwise, with the same output for these rows.
+
+List endpoints also take ``?fields=id,name,status`` (``Fields``): ``project``
+then selects only those columns, so long ``Text`` columns such as
+descriptions are neither read from SQLite nor serialized for card grids and
+dropdowns that don't show them.
+"""
+import datetime
+import json
+from typing import Optional
+
+from fastapi import HTTPException, Response
+from sqlalchemy import select
+
+try:
+    import orjson
+except ImportError:  # optional; to_json falls back to the json module
+    orjson = None
+
+def columns_for(model, schema):
+    """The ``model`` columns named by ``schema``'s fields, in schema order."""
+    table_columns = model.__table__.columns
+    return [table_columns[name] for name in schema.model_fields if name in table_columns]
+
+class Fields:
+    """``fields`` query parameter of a list endpoint: a comma-separated subset of its columns.
+
+    ``id`` is always included, and so are the columns the list is paged by.
+    """
+
+    def __init__(self, fields: Optional[str] = None):
+        self.names = frozenset(name.strip() for name in (fields or "").split(",") if name.strip()) or None
+
+    @property
+    def key(self):
+        """Distinguishes this field set in cache keys (None for all fields)."""
+        return tuple(sorted(self.names)) if self.names else None
+
+    def pick(self, columns):
+        """The requested ``columns``; 400 for names that aren't among them."""
+        if not self.names:
+            return columns
+        unknown = self.names - {column.key for column in columns}
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+        return [column for column in columns if column.key in self.names or column.key == "id"]
+
+def project(model, schema, fields: Optional[Fields] = None, joined=()):
+    """``select()`` of just the columns ``schema`` serializes, or of ``fields`` of them.
+
+    ``joined`` are labelled columns of related tables (``Destination.name.label("destination_name")``)
+    for the schema fields that aren't columns of ``model``; the caller adds the join.
+    """
+    columns = columns_for(model, schema) + list(joined)
+    return select(*(fields.pick(columns) if fields else columns))
+
+def row_dicts(result):
+    keys = list(result.keys())
+    return [dict(zip(keys, row)) for row in result]
+
+def _encode(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def to_json(content) -> bytes:
+    """Compact UTF-8 JSON for plain dicts and lists; dates as ISO strings."""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_encode, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+class RowsResponse(Response):
+    """JSON response for lists of plain dicts, encoded like FastAPI's default."""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return to_json(content)
@@ -0,0 +1,98 @@
+"""Incremental visitor and revenue rollups in ``visitor_stats``.
+
+One row per destination, day and hour (UTC). A flush that checks a ticket in
+adds its booking's visitors at the check-in hour. A flush that confirms a
+booking adds its revenue at the hour the booking was made (``created_at``, or
+midnight of its visit date for legacy rows without one), the same hour
+migration 6 backfills it at; cancelling, re-pricing or deleting a confirmed
+booking later subtracts it from that same hour. Revenue is the booking's
+``total_price``, or the package price per visitor when it has none.
+
+The rollup rows are written in the same transaction as the change, so they
+never disagree with bookings and tickets, and the analytics endpoints
+(``/stats/visitors``) read nothing else. ``roll_up`` is registered as a
+``Session`` ``after_flush`` listener on import, and ``backend/models.py``
+imports this module, so every writer (the API, ``seed_db.py``, one-off
+scripts) keeps the rollups current.
+"""
+from collections import defaultdict
+from datetime import datetime
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.orm import Session
+
+from backend import models
+from backend.cache import mark_changed
+
+_PACKAGE = text("SELECT price, destination_id FROM packages WHERE id = :id")
+_TICKET_BOOKING = text(
+    "SELECT b.num_visitors, p.destination_id FROM bookings b "
+    "LEFT JOIN packages p ON p.id = b.package_id WHERE b.id = :id"
+)
+_ADD = text(
+    "UPDATE visitor_stats SET visitor_count = visitor_count + :visitors, revenue = revenue + :revenue "
+    "WHERE destination_id IS :destination_id AND date = :date AND hour = :hour"
+)
+_INSERT = text(
+    "INSERT INTO visitor_stats (destination_id, date, hour, visitor_count, revenue) "
+    "VALUES (:destination_id, :date, :hour, :visitors, :revenue)"
+)
+
+def _before(obj, attr):
+    """Value of ``attr`` as of the last load, before this flush's changes."""
+    history = inspect(obj).attrs[attr].history
+    return history.deleted[0] if history.deleted else getattr(obj, attr)
+
+def _revenue(status, total_price, num_visitors, package_price):
+    if status != "confirmed":
+        return 0.0
+    if total_price is not None:
+        return total_price
+    return (package_price or 0.0) * (num_visitors or 1)
+
+def _booking_delta(conn, booking, op):
+    price, destination_id = conn.execute(_PACKAGE, {"id": booking.package_id}).first() or (None, None)
+    after = 0.0 if op == "delete" else _revenue(
+        booking.status, booking.total_price, booking.num_visitors, price)
+    before = 0.0 if op == "insert" else _revenue(
+        _before(booking, "status"), _before(booking, "total_price"), _before(booking, "num_visitors"), price)
+    return destination_id, after - before
+
+def _booked_at(booking, now):
+    """Day and hour a booking's revenue is filed at; matches ``_BACKFILL_VISITOR_STATS``."""
+    if booking.created_at is not None:
+        return booking.created_at.date(), booking.created_at.hour
+    if booking.date is not None:
+        return booking.date, 0
+    return now.date(), now.hour
+
+def _checked_in(ticket, op):
+    return ticket.status == "used" and (op == "insert" or _before(ticket, "status") != "used")
+
+@event.listens_for(Session, "after_flush")
+def roll_up(session, flush_context):
+    """``after_flush``: add this flush's check-ins and revenue changes to ``visitor_stats``."""
+    conn = None
+    buckets = defaultdict(lambda: [0, 0.0])  # (destination_id, date, hour) -> [visitors, revenue]
+    now = datetime.utcnow()
+    for op, objects in (("insert", session.new), ("update", session.dirty), ("delete", session.deleted)):
+        for obj in objects:
+            if isinstance(obj, models.Booking):
+                conn = conn or session.connection()
+                destination_id, revenue = _booking_delta(conn, obj, op)
+                if revenue:
+                    buckets[(destination_id, *_booked_at(obj, now))][1] += revenue
+            elif isinstance(obj, models.Ticket) and op != "delete" and _checked_in(obj, op):
+                conn = conn or session.connection()
+                num_visitors, destination_id = conn.execute(_TICKET_BOOKING, {"id": obj.booking_id}).first() \
+                    or (None, None)
+                at = obj.check_in_time or now
+                buckets[(destination_id, at.date(), at.hour)][0] += num_visitors or 1
+    if not buckets:
+        return
+    for (destination_id, day, hour), (visitors, revenue) in buckets.items():
+        params = {"destination_id": destination_id, "date": day.isoformat(), "hour": hour,
+                  "visitors": visitors, "revenue": revenue}
+        if conn.execute(_ADD, params).rowcount == 0:
+            conn.execute(_INSERT, params)
+    mark_changed(session, models.VisitorStats.__tablename__)
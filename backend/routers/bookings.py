@@ -1,8 +1,12 @@
+import datetime
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
 from backend import models, database
+from backend.pagination import Page
+from backend.projection import Fields, RowsResponse, project, row_dicts
+from backend.write_queue import run_write
 
 router = APIRouter(prefix="/bookings", tags=["bookings"])
 
@@ -10,7 +14,7 @@ class BookingBase(BaseModel):
     customer_name: str
     email: str
     package_id: int
-    date: str
+    date: datetime.date
     status: str = "pending"
     num_visitors: Optional[int] = 1
     total_price: Optional[float] = None
@@ -23,25 +27,46 @@ class BookingStatusUpdate(BaseModel):
 
 class Booking(BookingBase):
     id: int
+    date: Optional[datetime.date] = None  # NULL for legacy rows whose text date didn't parse
 
     class Config:
         from_attributes = True
 
-@router.post("/", response_model=Booking)
-def create_booking(booking: BookingCreate, db: Session = Depends(database.get_db)):
+def _create_booking(db: Session, booking: BookingCreate):
     db_booking = models.Booking(**booking.dict())
     db.add(db_booking)
-    db.commit()
-    db.refresh(db_booking)
     return db_booking
 
+def _update_booking_status(db: Session, booking_id: int, status: str):
+    booking = db.query(models.Booking).filter(models.Booking.id == booking_id).first()
+    if not booking:
+        raise HTTPException(status_code=404, detail="Booking not found")
+    booking.status = status
+    return booking
+
+@router.post("/", response_model=Booking)
+def create_booking(booking: BookingCreate, db: Session = Depends(database.get_db)):
+    return run_write(db, _create_booking, booking)
+
 @router.get("/", response_model=List[Booking])
-def read_bookings(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_db)):
-    bookings = db.query(models.Booking).offset(skip).limit(limit).all()
-    return bookings
+def read_bookings(page: Page = Depends(), fields: Fields = Depends(),
+                  date_from: Optional[datetime.date] = None, date_to: Optional[datetime.date] = None,
+                  db: Session = Depends(database.get_read_db)):
+    return booking_list(db, page, fields, date_from, date_to)
+
+def booking_list(db: Session, page: Page, fields: Fields, date_from: Optional[datetime.date] = None,
+                 date_to: Optional[datetime.date] = None):
+    """Bookings by id; also called in-process by the embedded frontend (backend/services.py)."""
+    query = project(models.Booking, Booking, fields)
+    if date_from:
+        query = query.where(models.Booking.date >= date_from)
+    if date_to:
+        query = query.where(models.Booking.date <= date_to)
+    rows = row_dicts(db.execute(page.apply(query, models.Booking.id)))
+    return RowsResponse(rows, headers=page.headers(rows))
 
 @router.get("/{booking_id}", response_model=Booking)
-def read_booking(booking_id: int, db: Session = Depends(database.get_db)):
+def read_booking(booking_id: int, db: Session = Depends(database.get_read_db)):
     booking = db.query(models.Booking).filter(models.Booking.id == booking_id).first()
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
@@ -49,10 +74,4 @@ def read_booking(booking_id: int, db: Session = Depends(database.get_db)):
 
 @router.put("/{booking_id}/status", response_model=Booking)
 def update_booking_status(booking_id: int, status_update: BookingStatusUpdate, db: Session = Depends(database.get_db)):
-    booking = db.query(models.Booking).filter(models.Booking.id == booking_id).first()
-    if not booking:
-        raise HTTPException(status_code=404, detail="Booking not found")
-    booking.status = status_update.status
-    db.commit()
-    db.refresh(booking)
-    return booking
+    return run_write(db, _update_booking_status, booking_id, status_update.status)
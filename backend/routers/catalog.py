@@ -0,0 +1,84 @@
+import asyncio
+import time
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Request, Response
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend import models, database
+from backend.cache import catalog_cache, etag_matches
+from backend.projection import RowsResponse, project, row_dicts
+from backend.routers.contents import Content
+from backend.routers.destinations import Destination
+from backend.routers.packages import Package
+from backend.routers.umkm import UMKM
+
+router = APIRouter(prefix="/catalog", tags=["catalog"])
+
+# Everything the public pages need, in one snapshot that is rebuilt only when one
+# of these tables changes and otherwise served as prebuilt JSON from memory.
+SNAPSHOT_MODELS = [models.Destination, models.Package, models.Content, models.UMKM]
+
+class CatalogPackage(BaseModel):
+    id: int
+    name: str
+    price: float
+    features: List[str]
+
+class Catalog(BaseModel):
+    version: str
+    destinations: List[Destination]
+    packages: List[CatalogPackage]
+    contents: List[Content]
+    umkm: List[UMKM]
+
+_snapshot = {"version": None, "body": None, "expires_at": 0.0}
+_build_lock = asyncio.Lock()
+
+def _current_version():
+    """The snapshot's tables' ``change_versions``, the same in every worker."""
+    return ".".join(str(catalog_cache.db_version(model.__tablename__)) for model in SNAPSHOT_MODELS)
+
+def _split_features(features):
+    return [feature.strip() for feature in (features or "").split(",") if feature.strip()]
+
+def _queries():
+    return {
+        "destinations": project(models.Destination, Destination),
+        "packages": project(models.Package, Package),
+        "contents": project(models.Content, Content).where(models.Content.is_published.is_(True)),
+        "umkm": project(models.UMKM, UMKM),
+    }
+
+def _assemble(version, rows):
+    for package in rows["packages"]:
+        package["features"] = _split_features(package["features"])
+    return RowsResponse({"version": version, **rows}).body
+
+async def _build(db: AsyncSession, version: str):
+    return _assemble(version, {name: row_dicts(await db.execute(query)) for name, query in _queries().items()})
+
+def _fresh(version):
+    return _snapshot["version"] == version and _snapshot["expires_at"] > time.monotonic()
+
+async def _snapshot_body(db: AsyncSession, version: str):
+    if not _fresh(version):
+        async with _build_lock:  # one rebuild per change, not one per waiting request
+            if not _fresh(version):
+                body = await _build(db, version)
+                _snapshot.update(version=version, body=body, expires_at=time.monotonic() + catalog_cache.ttl)
+                return body
+    return _snapshot["body"]
+
+async def catalog_snapshot(db: AsyncSession, *, if_none_match: Optional[str] = None):
+    """The catalog response; also called in-process by the embedded frontend (backend/services.py)."""
+    version = _current_version()
+    etag = f'"catalog.{version}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    body = await _snapshot_body(db, version)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@router.get("/", response_model=Catalog)
+async def read_catalog(request: Request, db: AsyncSession = Depends(database.get_async_read_db)):
+    return await catalog_snapshot(db, if_none_match=request.headers.get("if-none-match"))
@@ -0,0 +1,70 @@
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from backend import models, database
+from backend.change_log import LOGGED_TABLES
+from backend.projection import RowsResponse, row_dicts
+
+router = APIRouter(prefix="/changes", tags=["changes"])
+
+MAX_CHANGES = 1000
+
+class Change(BaseModel):
+    version: int
+    table: str
+    id: int
+    op: str  # insert, update, delete
+    row: Optional[Dict[str, Any]] = None  # current row; None for deletes
+
+class ChangeSet(BaseModel):
+    version: int
+    has_more: bool
+    changes: List[Change]
+
+def _current_rows(db: Session, table_name: str, ids):
+    table = models.Base.metadata.tables[table_name]
+    return {row["id"]: row for row in row_dicts(db.execute(select(table).where(table.c.id.in_(ids))))}
+
+@router.get("/", response_model=ChangeSet)
+def read_changes(since: int = 0, tables: Optional[str] = None, limit: int = MAX_CHANGES,
+                 db: Session = Depends(database.get_read_db)):
+    """Changes after version ``since``, newest per row; pass the returned ``version`` next time.
+
+    Inserts and updates carry the row as it is now, deletes are tombstones.
+    While ``has_more`` is true, call again with the new version.
+    """
+    limit = max(1, min(limit, MAX_CHANGES))
+    query = select(models.ChangeLog).where(models.ChangeLog.id > since)
+    if tables:
+        wanted = {name.strip() for name in tables.split(",") if name.strip()}
+        unknown = wanted - LOGGED_TABLES
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown tables: {', '.join(sorted(unknown))}")
+        query = query.where(models.ChangeLog.table_name.in_(wanted))
+    entries = db.execute(query.order_by(models.ChangeLog.id).limit(limit + 1)).scalars().all()
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    latest = {}  # (table, row id) -> newest entry in this window
+    for entry in entries:
+        latest[(entry.table_name, entry.row_id)] = entry
+
+    rows = {}
+    for table_name in {table for table, _ in latest}:
+        ids = [row_id for table, row_id in latest if table == table_name and latest[(table, row_id)].op != "delete"]
+        rows[table_name] = _current_rows(db, table_name, ids) if ids else {}
+
+    changes = []
+    for (table_name, row_id), entry in sorted(latest.items(), key=lambda item: item[1].id):
+        row = rows[table_name].get(row_id)
+        # A row deleted after this window shows as a tombstone now; its own entry follows later
+        op = entry.op if row is not None else "delete"
+        changes.append({"version": entry.id, "table": table_name, "id": row_id, "op": op, "row": row})
+
+    return RowsResponse({
+        "version": entries[-1].id if entries else since,
+        "has_more": has_more,
+        "changes": changes,
+    })
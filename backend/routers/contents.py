@@ -1,8 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
 from backend import models, database
+from backend.cache import cached_aggregate, cached_row, cached_rows, catalog_etag
+from backend.pagination import Page
+from backend.projection import Fields, project
 
 router = APIRouter(prefix="/contents", tags=["contents"])
 
@@ -30,6 +35,12 @@ class Content(ContentBase):
     class Config:
         from_attributes = True
 
+class ContentStats(BaseModel):
+    total: int
+    published: int
+    draft: int
+    pages: int
+
 @router.post("/", response_model=Content)
 def create_content(content: ContentCreate, db: Session = Depends(database.get_db)):
     db_content = models.Content(**content.dict())
@@ -38,20 +49,51 @@ def create_content(content: ContentCreate, db: Session = Depends(database.get_db
     db.refresh(db_content)
     return db_content
 
-@router.get("/", response_model=List[Content])
-def read_contents(db: Session = Depends(database.get_db), show_all: bool = True):
-    query = db.query(models.Content)
+def contents_query(page: Page, show_all: bool = True, fields: Optional[Fields] = None):
+    query = project(models.Content, Content, fields)
     if not show_all:
-        query = query.filter(models.Content.is_published.is_(True))
-    return query.all()
+        query = query.where(models.Content.is_published.is_(True))
+    return page.apply(query, models.Content.id)
 
-@router.get("/{content_id}", response_model=Content)
-def read_content(content_id: int, db: Session = Depends(database.get_db)):
-    content = db.query(models.Content).filter(models.Content.id == content_id).first()
-    if not content:
+def content_query(content_id: int):
+    return project(models.Content, Content).where(models.Content.id == content_id)
+
+# Reads, also called in-process by the embedded frontend (backend/services.py)
+async def content_list(db: AsyncSession, page: Page, fields: Fields, show_all: bool = True, *,
+                       etag: Optional[str] = None):
+    return await cached_rows(db, models.Content, ("list", show_all, fields.key, *page.key),
+                             contents_query(page, show_all, fields), etag, page)
+
+async def content_detail(db: AsyncSession, content_id: int):
+    content = await cached_row(db, models.Content, content_id, content_query(content_id))
+    if content is None:
         raise HTTPException(status_code=404, detail="Content not found")
     return content
 
+@router.get("/", response_model=List[Content])
+async def read_contents(db: AsyncSession = Depends(database.get_async_read_db), show_all: bool = True,
+                        page: Page = Depends(), fields: Fields = Depends(),
+                        etag: str = Depends(catalog_etag(models.Content))):
+    return await content_list(db, page, fields, show_all, etag=etag)
+
+async def _content_stats(db: AsyncSession):
+    published = models.Content.is_published.is_(True)
+    total, published_count, pages = (await db.execute(select(
+        func.count(models.Content.id),  # pylint: disable=not-callable
+        func.count(models.Content.id).filter(published),  # pylint: disable=not-callable
+        func.count(models.Content.id).filter(models.Content.type == "page"),  # pylint: disable=not-callable
+    ))).one()
+    return {"total": total, "published": published_count, "draft": total - published_count, "pages": pages}
+
+@router.get("/stats", response_model=ContentStats)
+async def read_content_stats(db: AsyncSession = Depends(database.get_async_read_db)):
+    """Published, draft and page counts for the CMS page, however many pages its table has."""
+    return await cached_aggregate("contents", [models.Content], lambda: _content_stats(db))
+
+@router.get("/{content_id}", response_model=Content)
+async def read_content(content_id: int, db: AsyncSession = Depends(database.get_async_read_db)):
+    return await content_detail(db, content_id)
+
 @router.put("/{content_id}", response_model=Content)
 def update_content(content_id: int, content_update: ContentUpdate, db: Session = Depends(database.get_db)):
     db_content = db.query(models.Content).filter(models.Content.id == content_id).first()
@@ -1,8 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
 from backend import models, database
+from backend.cache import cached_row, cached_rows, catalog_etag
+from backend.pagination import Page
+from backend.projection import Fields, project
 
 router = APIRouter(prefix="/destinations", tags=["destinations"])
 
@@ -40,18 +44,33 @@ def create_destination(destination: DestinationCreate, db: Session = Depends(dat
     db.refresh(db_destination)
     return db_destination
 
-@router.get("/", response_model=List[Destination])
-def read_destinations(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_db)):
-    destinations = db.query(models.Destination).offset(skip).limit(limit).all()
-    return destinations
+def destinations_query(page: Page, fields: Optional[Fields] = None):
+    return page.apply(project(models.Destination, Destination, fields), models.Destination.id)
 
-@router.get("/{destination_id}", response_model=Destination)
-def read_destination(destination_id: int, db: Session = Depends(database.get_db)):
-    destination = db.query(models.Destination).filter(models.Destination.id == destination_id).first()
-    if not destination:
+def destination_query(destination_id: int):
+    return project(models.Destination, Destination).where(models.Destination.id == destination_id)
+
+# Reads, also called in-process by the embedded frontend (backend/services.py)
+async def destination_list(db: AsyncSession, page: Page, fields: Fields, *, etag: Optional[str] = None):
+    return await cached_rows(db, models.Destination, ("list", fields.key, *page.key),
+                             destinations_query(page, fields), etag, page)
+
+async def destination_detail(db: AsyncSession, destination_id: int):
+    destination = await cached_row(db, models.Destination, destination_id, destination_query(destination_id))
+    if destination is None:
         raise HTTPException(status_code=404, detail="Destination not found")
     return destination
 
+@router.get("/", response_model=List[Destination])
+async def read_destinations(page: Page = Depends(), fields: Fields = Depends(),
+                            etag: str = Depends(catalog_etag(models.Destination)),
+                            db: AsyncSession = Depends(database.get_async_read_db)):
+    return await destination_list(db, page, fields, etag=etag)
+
+@router.get("/{destination_id}", response_model=Destination)
+async def read_destination(destination_id: int, db: AsyncSession = Depends(database.get_async_read_db)):
+    return await destination_detail(db, destination_id)
+
 @router.put("/{destination_id}", response_model=Destination)
 def update_destination(destination_id: int, update: DestinationUpdate, db: Session = Depends(database.get_db)):
     destination = db.query(models.Destination).filter(models.Destination.id == destination_id).first()
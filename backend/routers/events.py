@@ -4,6 +4,8 @@ from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 from backend import models, database
+from backend.pagination import Page
+from backend.projection import Fields, RowsResponse, project
 
 router = APIRouter(prefix="/events", tags=["events"])
 
@@ -33,21 +35,12 @@ def create_event(event: EventCreate, db: Session = Depends(database.get_db)):
     return db_event
 
 @router.get("/", response_model=List[Event])
-def read_events(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_db)):
-    events = db.query(models.Event).order_by(models.Event.event_date).offset(skip).limit(limit).all()
-    result = []
-    for event in events:
-        event_dict = {
-            "id": event.id,
-            "destination_id": event.destination_id,
-            "title": event.title,
-            "description": event.description,
-            "event_date": event.event_date,
-            "image_url": event.image_url,
-            "destination_name": event.destination.name if event.destination else None
-        }
-        result.append(event_dict)
-    return result
+def read_events(page: Page = Depends(), fields: Fields = Depends(), db: Session = Depends(database.get_read_db)):
+    # Destination names are joined in, not lazy-loaded per event
+    query = project(models.Event, Event, fields, joined=[models.Destination.name.label("destination_name")]).join_from(
+        models.Event, models.Destination, models.Destination.id == models.Event.destination_id, isouter=True)
+    rows = page.rows(db, query, models.Event.event_date, models.Event.id)
+    return RowsResponse(rows, headers=page.headers(rows))
 
 @router.delete("/{event_id}")
 def delete_event(event_id: int, db: Session = Depends(database.get_db)):
@@ -0,0 +1,93 @@
+import csv
+import datetime
+import io
+from typing import Literal, Optional
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from backend import models, database
+from backend.projection import to_json
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+# Rows fetched from SQLite and written out per chunk; memory stays at one batch
+EXPORT_BATCH = 1000
+
+# table -> (model, date column the date_from/date_to filter applies to)
+EXPORTS = {
+    "bookings": (models.Booking, models.Booking.date),
+    "tickets": (models.Ticket, models.Booking.date),  # a ticket's season is its booking's date
+    "equipment_rentals": (models.EquipmentRental, models.EquipmentRental.rental_date),
+    "guide_bookings": (models.GuideBooking, models.GuideBooking.booking_date),
+}
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+def export_query(name: str, date_from: Optional[datetime.date] = None, date_to: Optional[datetime.date] = None,
+                 status: Optional[str] = None):
+    """All columns of ``name``'s rows within the filters.
+
+    Rows come in date-column order (then id) where that column is the table's
+    own, so SQLite walks its index instead of sorting the whole export first.
+    """
+    model, date_column = EXPORTS[name]
+    table = model.__table__
+    in_range = [condition for condition in (date_column >= date_from if date_from else None,
+                                            date_column <= date_to if date_to else None)
+                if condition is not None]
+    query = select(table)
+    if date_column.table is table:
+        query = query.where(*in_range).order_by(date_column, table.c.id)
+    else:
+        if in_range:
+            query = query.where(table.c.booking_id.in_(select(models.Booking.id).where(*in_range)))
+        query = query.order_by(table.c.id)
+    if status:
+        # "status || ''" keeps SQLite on the ordering index instead of the status one plus a sort
+        query = query.where(table.c.status.concat("") == status)
+    return query
+
+def _plain(value):
+    return value.isoformat() if isinstance(value, (datetime.date, datetime.datetime)) else value
+
+def _ndjson(keys, batches):
+    for rows in batches:
+        yield b"".join(to_json(dict(zip(keys, row))) + b"\n" for row in rows)
+
+def _csv(keys, batches):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(keys)
+    for rows in batches:
+        writer.writerows([_plain(value) for value in row] for row in rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():  # header only: no rows matched
+        yield buffer.getvalue().encode("utf-8")
+
+def _stream(query, fmt):
+    """Run ``query`` on its own read-only connection and yield the export in chunks.
+
+    The connection lives as long as the response body, not the request
+    handler, and is closed when the client goes away mid-download.
+    """
+    with database.read_engine.connect() as conn:
+        result = conn.execution_options(yield_per=EXPORT_BATCH).execute(query)
+        keys = list(result.keys())
+        encode = _csv if fmt == "csv" else _ndjson
+        yield from encode(keys, result.partitions())
+
+@router.get("/{table}")
+def export_table(table: str, fmt: Literal["ndjson", "csv"] = Query("ndjson", alias="format"),
+                 date_from: Optional[datetime.date] = None, date_to: Optional[datetime.date] = None,
+                 status: Optional[str] = None):
+    """Every row of ``table`` within the filters, streamed as NDJSON (default) or CSV."""
+    if table not in EXPORTS:
+        raise HTTPException(status_code=404, detail=f"Unknown export: {table}")
+    query = export_query(table, date_from, date_to, status)
+    return StreamingResponse(
+        _stream(query, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{table}.{fmt}"'},
+    )
@@ -3,6 +3,8 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
 from backend import models, database
+from backend.pagination import Page
+from backend.projection import Fields, RowsResponse, project, row_dicts
 
 router = APIRouter(prefix="/facilities", tags=["facilities"])
 
@@ -30,6 +32,7 @@ def create_facility(facility: FacilityCreate, db: Session = Depends(database.get
     return db_facility
 
 @router.get("/", response_model=List[Facility])
-def read_facilities(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_db)):
-    facilities = db.query(models.Facility).offset(skip).limit(limit).all()
-    return facilities
+def read_facilities(page: Page = Depends(), fields: Fields = Depends(),
+                    db: Session = Depends(database.get_read_db)):
+    rows = row_dicts(db.execute(page.apply(project(models.Facility, Facility, fields), models.Facility.id)))
+    return RowsResponse(rows, headers=page.headers(rows))
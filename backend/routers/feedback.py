@@ -1,8 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 from backend import models, database
+from backend.cache import cached_aggregate
+from backend.pagination import Page
+from backend.projection import Fields, RowsResponse, project
+from backend.write_queue import run_write
 from datetime import datetime
 
 router = APIRouter(prefix="/feedback", tags=["feedback"])
@@ -29,27 +35,12 @@ class Feedback(FeedbackBase):
     class Config:
         from_attributes = True
 
-@router.post("/", response_model=Feedback)
-def create_feedback(feedback: FeedbackCreate, db: Session = Depends(database.get_db)):
+def _create_feedback(db: Session, feedback: FeedbackCreate):
     db_feedback = models.Feedback(**feedback.dict())
     db.add(db_feedback)
-    db.commit()
-    db.refresh(db_feedback)
     return db_feedback
 
-@router.get("/", response_model=List[Feedback])
-def read_feedback_list(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_db)):
-    feedback_list = db.query(models.Feedback).order_by(models.Feedback.created_at.desc()).offset(skip).limit(limit).all()
-    return feedback_list
-
-@router.get("/emergency", response_model=List[Feedback])
-def read_emergency_list(db: Session = Depends(database.get_db)):
-    """Get all emergency reports"""
-    emergencies = db.query(models.Feedback).filter(models.Feedback.type == "emergency").all()
-    return emergencies
-
-@router.put("/{feedback_id}", response_model=Feedback)
-def update_feedback(feedback_id: int, update: FeedbackUpdate, db: Session = Depends(database.get_db)):
+def _update_feedback(db: Session, feedback_id: int, update: FeedbackUpdate):
     feedback = db.query(models.Feedback).filter(models.Feedback.id == feedback_id).first()
     if not feedback:
         raise HTTPException(status_code=404, detail="Feedback not found")
@@ -58,7 +49,58 @@ def update_feedback(feedback_id: int, update: FeedbackUpdate, db: Session = Depe
         feedback.status = update.status
     if update.priority:
         feedback.priority = update.priority
-    
-    db.commit()
-    db.refresh(feedback)
     return feedback
+
+@router.post("/", response_model=Feedback)
+def create_feedback(feedback: FeedbackCreate, db: Session = Depends(database.get_db)):
+    return run_write(db, _create_feedback, feedback)
+
+@router.get("/", response_model=List[Feedback])
+def read_feedback_list(page: Page = Depends(), fields: Fields = Depends(),
+                       db: Session = Depends(database.get_read_db)):
+    query = project(models.Feedback, Feedback, fields)
+    rows = page.rows(db, query, models.Feedback.created_at, models.Feedback.id, descending=True)
+    return RowsResponse(rows, headers=page.headers(rows))
+
+class FeedbackStats(BaseModel):
+    total: int
+    emergency: int
+    open: int
+    resolved: int
+    by_type: Dict[str, int]
+    by_status: Dict[str, int]
+
+async def _feedback_stats(db: AsyncSession):
+    rows = (await db.execute(
+        select(models.Feedback.type, models.Feedback.status, func.count(models.Feedback.id))  # pylint: disable=not-callable
+        .group_by(models.Feedback.type, models.Feedback.status)
+    )).all()
+    by_type, by_status = {}, {}
+    for kind, status, count in rows:
+        by_type[kind] = by_type.get(kind, 0) + count
+        by_status[status] = by_status.get(status, 0) + count
+    return {
+        "total": sum(by_type.values()),
+        "emergency": by_type.get("emergency", 0),
+        "open": by_status.get("open", 0),
+        "resolved": by_status.get("resolved", 0),
+        "by_type": by_type,
+        "by_status": by_status,
+    }
+
+@router.get("/stats", response_model=FeedbackStats)
+async def read_feedback_stats(db: AsyncSession = Depends(database.get_async_read_db)):
+    """Counts per type and status for the admin page, from one GROUP BY."""
+    return await cached_aggregate("feedback", [models.Feedback], lambda: _feedback_stats(db))
+
+@router.get("/emergency", response_model=List[Feedback])
+def read_emergency_list(page: Page = Depends(), fields: Fields = Depends(),
+                        db: Session = Depends(database.get_read_db)):
+    """Get emergency reports, newest first"""
+    query = project(models.Feedback, Feedback, fields).where(models.Feedback.type == "emergency")
+    rows = page.rows(db, query, models.Feedback.created_at, models.Feedback.id, descending=True)
+    return RowsResponse(rows, headers=page.headers(rows))
+
+@router.put("/{feedback_id}", response_model=Feedback)
+def update_feedback(feedback_id: int, update: FeedbackUpdate, db: Session = Depends(database.get_db)):
+    return run_write(db, _update_feedback, feedback_id, update)
@@ -1,8 +1,15 @@
+from datetime import date
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel
 from backend import models, database
+from backend.cache import cached_aggregate, cached_row, cached_rows
+from backend.pagination import Page
+from backend.projection import Fields, RowsResponse, project, row_dicts
+from backend.write_queue import run_write
 
 router = APIRouter(prefix="/guides", tags=["guides"])
 
@@ -32,7 +39,7 @@ class GuideBookingBase(BaseModel):
     guide_id: int
     customer_name: str
     customer_phone: str
-    booking_date: str
+    booking_date: date
     duration_days: int = 1
     notes: Optional[str] = None
 
@@ -41,6 +48,7 @@ class GuideBookingCreate(GuideBookingBase):
 
 class GuideBooking(GuideBookingBase):
     id: int
+    booking_date: Optional[date] = None  # NULL for legacy rows whose text date didn't parse
     total_price: float
     status: str
     guide_name: Optional[str] = None
@@ -49,22 +57,94 @@ class GuideBooking(GuideBookingBase):
         from_attributes = True
 
 # --- Guide Endpoints ---
+def guides_query(page: Page, fields: Optional[Fields] = None):
+    return page.apply(project(models.TourGuide, Guide, fields), models.TourGuide.id)
+
+def available_guides_query(page: Page, fields: Optional[Fields] = None):
+    query = project(models.TourGuide, Guide, fields).where(models.TourGuide.is_available.is_(True))
+    return page.apply(query, models.TourGuide.id)
+
+def guide_query(guide_id: int):
+    return project(models.TourGuide, Guide).where(models.TourGuide.id == guide_id)
+
+# Reads, also called in-process by the embedded frontend (backend/services.py)
+async def guide_list(db: AsyncSession, page: Page, fields: Fields):
+    return await cached_rows(db, models.TourGuide, ("list", fields.key, *page.key), guides_query(page, fields),
+                             page=page)
+
+async def available_guide_list(db: AsyncSession, page: Page, fields: Fields):
+    return await cached_rows(db, models.TourGuide, ("available", fields.key, *page.key),
+                             available_guides_query(page, fields), page=page)
+
+async def guide_detail(db: AsyncSession, guide_id: int):
+    guide = await cached_row(db, models.TourGuide, guide_id, guide_query(guide_id))
+    if guide is None:
+        raise HTTPException(status_code=404, detail="Guide not found")
+    return guide
+
+def guide_booking_list(db: Session, page: Page, fields: Fields,
+                       date_from: Optional[date] = None, date_to: Optional[date] = None):
+    """Guide bookings, newest first.
+
+    The guide name comes from a join in the same query, not a lazy load per booking.
+    """
+    query = project(models.GuideBooking, GuideBooking, fields,
+                    joined=[models.TourGuide.name.label("guide_name")]).join_from(
+        models.GuideBooking, models.TourGuide, models.TourGuide.id == models.GuideBooking.guide_id, isouter=True)
+    if date_from:
+        query = query.where(models.GuideBooking.booking_date >= date_from)
+    if date_to:
+        query = query.where(models.GuideBooking.booking_date <= date_to)
+    rows = row_dicts(db.execute(page.apply(query, models.GuideBooking.id, descending=True)))
+    return RowsResponse(rows, headers=page.headers(rows))
+
 @router.get("/", response_model=List[Guide])
-def get_all_guides(db: Session = Depends(database.get_db)):
-    guides = db.query(models.TourGuide).all()
-    return guides
+async def get_all_guides(page: Page = Depends(), fields: Fields = Depends(),
+                         db: AsyncSession = Depends(database.get_async_read_db)):
+    return await guide_list(db, page, fields)
 
 @router.get("/available", response_model=List[Guide])
-def get_available_guides(db: Session = Depends(database.get_db)):
-    guides = db.query(models.TourGuide).filter(models.TourGuide.is_available.is_(True)).all()
-    return guides
+async def get_available_guides(page: Page = Depends(), fields: Fields = Depends(),
+                               db: AsyncSession = Depends(database.get_async_read_db)):
+    return await available_guide_list(db, page, fields)
+
+# --- Guide Stats ---
+ACTIVE_BOOKING_STATUSES = ("pending", "confirmed")
+REVENUE_BOOKING_STATUSES = ("confirmed", "completed")
+
+class GuideStats(BaseModel):
+    total_guides: int
+    available_guides: int
+    active_bookings: int
+    revenue: float
+    by_status: Dict[str, int]
+
+async def _guide_stats(db: AsyncSession):
+    rows = (await db.execute(
+        select(models.GuideBooking.status, func.count(models.GuideBooking.id),  # pylint: disable=not-callable
+               func.coalesce(func.sum(models.GuideBooking.total_price), 0.0))
+        .group_by(models.GuideBooking.status)
+    )).all()
+    total, available = (await db.execute(select(
+        func.count(models.TourGuide.id),  # pylint: disable=not-callable
+        func.count(models.TourGuide.id).filter(models.TourGuide.is_available.is_(True)),  # pylint: disable=not-callable
+    ))).one()
+    return {
+        "total_guides": total,
+        "available_guides": available,
+        "active_bookings": sum(count for status, count, _ in rows if status in ACTIVE_BOOKING_STATUSES),
+        "revenue": sum(revenue for status, _, revenue in rows if status in REVENUE_BOOKING_STATUSES),
+        "by_status": {status: count for status, count, _ in rows},
+    }
+
+@router.get("/stats", response_model=GuideStats)
+async def get_guide_stats(db: AsyncSession = Depends(database.get_async_read_db)):
+    """Counts and revenue for the admin page, from one GROUP BY over guide bookings."""
+    return await cached_aggregate("guides", [models.GuideBooking, models.TourGuide], lambda: _guide_stats(db))
 
 @router.get("/{guide_id}", response_model=Guide)
-def get_guide(guide_id: int, db: Session = Depends(database.get_db)):
-    guide = db.query(models.TourGuide).filter(models.TourGuide.id == guide_id).first()
-    if not guide:
-        raise HTTPException(status_code=404, detail="Guide not found")
-    return guide
+async def get_guide(guide_id: int, db: AsyncSession = Depends(database.get_async_read_db)):
+    return await guide_detail(db, guide_id)
 
 @router.post("/", response_model=Guide)
 def create_guide(guide: GuideCreate, db: Session = Depends(database.get_db)):
@@ -76,26 +156,12 @@ def create_guide(guide: GuideCreate, db: Session = Depends(database.get_db)):
 
 # --- Booking Endpoints ---
 @router.get("/bookings/", response_model=List[GuideBooking])
-def get_all_bookings(db: Session = Depends(database.get_db)):
-    bookings = db.query(models.GuideBooking).all()
-    result = []
-    for booking in bookings:
-        result.append({
-            "id": booking.id,
-            "guide_id": booking.guide_id,
-            "customer_name": booking.customer_name,
-            "customer_phone": booking.customer_phone,
-            "booking_date": booking.booking_date,
-            "duration_days": booking.duration_days,
-            "notes": booking.notes,
-            "total_price": booking.total_price,
-            "status": booking.status,
-            "guide_name": booking.guide.name if booking.guide else None
-        })
-    return result
+def get_all_bookings(page: Page = Depends(), fields: Fields = Depends(),
+                     date_from: Optional[date] = None, date_to: Optional[date] = None,
+                     db: Session = Depends(database.get_read_db)):
+    return guide_booking_list(db, page, fields, date_from, date_to)
 
-@router.post("/bookings/", response_model=GuideBooking)
-def create_booking(booking: GuideBookingCreate, db: Session = Depends(database.get_db)):
+def _create_booking(db: Session, booking: GuideBookingCreate):
     guide = db.query(models.TourGuide).filter(models.TourGuide.id == booking.guide_id).first()
     if not guide:
         raise HTTPException(status_code=404, detail="Guide not found")
@@ -107,8 +173,7 @@ def create_booking(booking: GuideBookingCreate, db: Session = Depends(database.g
         total_price=total_price
     )
     db.add(db_booking)
-    db.commit()
-    db.refresh(db_booking)
+    db.flush()
     
     return {
         **booking.dict(),
@@ -118,12 +183,18 @@ def create_booking(booking: GuideBookingCreate, db: Session = Depends(database.g
         "guide_name": guide.name
     }
 
-@router.put("/bookings/{booking_id}/status")
-def update_booking_status(booking_id: int, status: str, db: Session = Depends(database.get_db)):
+def _update_booking_status(db: Session, booking_id: int, status: str):
     booking = db.query(models.GuideBooking).filter(models.GuideBooking.id == booking_id).first()
     if not booking:
         raise HTTPException(status_code=404, detail="Booking not found")
     
     booking.status = status
-    db.commit()
     return {"message": "Booking status updated"}
+
+@router.post("/bookings/", response_model=GuideBooking)
+def create_booking(booking: GuideBookingCreate, db: Session = Depends(database.get_db)):
+    return run_write(db, _create_booking, booking)
+
+@router.put("/bookings/{booking_id}/status")
+def update_booking_status(booking_id: int, status: str, db: Session = Depends(database.get_db)):
+    return run_write(db, _update_booking_status, booking_id, status)
@@ -1,8 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
 from backend import models, database
+from backend.cache import cached_row, cached_rows, catalog_etag
+from backend.pagination import Page
+from backend.projection import Fields, project
 
 router = APIRouter(prefix="/packages", tags=["packages"])
 
@@ -28,18 +32,33 @@ def create_package(package: PackageCreate, db: Session = Depends(database.get_db
     db.refresh(db_package)
     return db_package
 
-@router.get("/", response_model=List[Package])
-def read_packages(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_db)):
-    packages = db.query(models.Package).offset(skip).limit(limit).all()
-    return packages
+def packages_query(page: Page, fields: Optional[Fields] = None):
+    return page.apply(project(models.Package, Package, fields), models.Package.id)
 
-@router.get("/{package_id}", response_model=Package)
-def read_package(package_id: int, db: Session = Depends(database.get_db)):
-    package = db.query(models.Package).filter(models.Package.id == package_id).first()
+def package_query(package_id: int):
+    return project(models.Package, Package).where(models.Package.id == package_id)
+
+# Reads, also called in-process by the embedded frontend (backend/services.py)
+async def package_list(db: AsyncSession, page: Page, fields: Fields, *, etag: Optional[str] = None):
+    return await cached_rows(db, models.Package, ("list", fields.key, *page.key), packages_query(page, fields),
+                             etag, page)
+
+async def package_detail(db: AsyncSession, package_id: int):
+    package = await cached_row(db, models.Package, package_id, package_query(package_id))
     if package is None:
         raise HTTPException(status_code=404, detail="Package not found")
     return package
 
+@router.get("/", response_model=List[Package])
+async def read_packages(page: Page = Depends(), fields: Fields = Depends(),
+                        etag: str = Depends(catalog_etag(models.Package)),
+                        db: AsyncSession = Depends(database.get_async_read_db)):
+    return await package_list(db, page, fields, etag=etag)
+
+@router.get("/{package_id}", response_model=Package)
+async def read_package(package_id: int, db: AsyncSession = Depends(database.get_async_read_db)):
+    return await package_detail(db, package_id)
+
 @router.delete("/{package_id}")
 def delete_package(package_id: int, db: Session = Depends(database.get_db)):
     package = db.query(models.Package).filter(models.Package.id == package_id).first()
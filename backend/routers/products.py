@@ -3,6 +3,8 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
 from backend import models, database
+from backend.pagination import Page
+from backend.projection import Fields, RowsResponse, project, row_dicts
 
 router = APIRouter(prefix="/products", tags=["products"])
 
@@ -31,14 +33,16 @@ def create_product(product: ProductCreate, db: Session = Depends(database.get_db
     return db_product
 
 @router.get("/", response_model=List[Product])
-def read_products(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_db)):
-    products = db.query(models.Product).offset(skip).limit(limit).all()
-    return products
+def read_products(page: Page = Depends(), fields: Fields = Depends(), db: Session = Depends(database.get_read_db)):
+    rows = row_dicts(db.execute(page.apply(project(models.Product, Product, fields), models.Product.id)))
+    return RowsResponse(rows, headers=page.headers(rows))
 
 @router.get("/umkm/{umkm_id}", response_model=List[Product])
-def read_products_by_umkm(umkm_id: int, db: Session = Depends(database.get_db)):
-    products = db.query(models.Product).filter(models.Product.umkm_id == umkm_id).all()
-    return products
+def read_products_by_umkm(umkm_id: int, page: Page = Depends(), fields: Fields = Depends(),
+                          db: Session = Depends(database.get_read_db)):
+    query = project(models.Product, Product, fields).where(models.Product.umkm_id == umkm_id)
+    rows = row_dicts(db.execute(page.apply(query, models.Product.id)))
+    return RowsResponse(rows, headers=page.headers(rows))
 
 @router.delete("/{product_id}")
 def delete_product(product_id: int, db: Session = Depends(database.get_db)):
@@ -1,9 +1,15 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import date
+from typing import Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from backend import models, database
+from backend.cache import cached_aggregate, cached_rows, catalog_etag
+from backend.pagination import Page
+from backend.projection import Fields, RowsResponse, project, row_dicts
+from backend.write_queue import run_write
 
 router = APIRouter(prefix="/rentals", tags=["rentals"])
 
@@ -32,8 +38,8 @@ class RentalBase(BaseModel):
     equipment_id: int
     customer_name: str
     customer_phone: str
-    rental_date: str
-    return_date: str
+    rental_date: date
+    return_date: date
     quantity: int = 1
 
 class RentalCreate(RentalBase):
@@ -41,6 +47,8 @@ class RentalCreate(RentalBase):
 
 class Rental(RentalBase):
     id: int
+    rental_date: Optional[date] = None  # NULL for legacy rows whose text dates didn't parse
+    return_date: Optional[date] = None
     total_price: float
     status: str
     equipment_name: Optional[str] = None
@@ -49,18 +57,35 @@ class Rental(RentalBase):
         from_attributes = True
 
 # --- Equipment Endpoints ---
-@router.get("/equipment", response_model=List[Equipment])
-def get_all_equipment(db: Session = Depends(database.get_db)):
-    equipment = db.query(models.CampingEquipment).all()
-    return equipment
+def equipment_query(page: Page, fields: Optional[Fields] = None):
+    return page.apply(project(models.CampingEquipment, Equipment, fields), models.CampingEquipment.id)
 
-@router.get("/equipment/available", response_model=List[Equipment])
-def get_available_equipment(db: Session = Depends(database.get_db)):
-    equipment = db.query(models.CampingEquipment).filter(
+def available_equipment_query(page: Page, fields: Optional[Fields] = None):
+    query = project(models.CampingEquipment, Equipment, fields).where(
         models.CampingEquipment.is_available.is_(True),
         models.CampingEquipment.available > 0
-    ).all()
-    return equipment
+    )
+    return page.apply(query, models.CampingEquipment.id)
+
+# Reads, also called in-process by the embedded frontend (backend/services.py)
+async def equipment_list(db: AsyncSession, page: Page, fields: Fields, *, etag: Optional[str] = None):
+    return await cached_rows(db, models.CampingEquipment, ("list", fields.key, *page.key),
+                             equipment_query(page, fields), etag, page)
+
+async def available_equipment_list(db: AsyncSession, page: Page, fields: Fields):
+    return await cached_rows(db, models.CampingEquipment, ("available", fields.key, *page.key),
+                             available_equipment_query(page, fields), page=page)
+
+@router.get("/equipment", response_model=List[Equipment])
+async def get_all_equipment(page: Page = Depends(), fields: Fields = Depends(),
+                            etag: str = Depends(catalog_etag(models.CampingEquipment)),
+                            db: AsyncSession = Depends(database.get_async_read_db)):
+    return await equipment_list(db, page, fields, etag=etag)
+
+@router.get("/equipment/available", response_model=List[Equipment])
+async def get_available_equipment(page: Page = Depends(), fields: Fields = Depends(),
+                                  db: AsyncSession = Depends(database.get_async_read_db)):
+    return await available_equipment_list(db, page, fields)
 
 @router.post("/equipment", response_model=Equipment)
 def create_equipment(equipment: EquipmentCreate, db: Session = Depends(database.get_db)):
@@ -81,27 +106,60 @@ def delete_equipment(equipment_id: int, db: Session = Depends(database.get_db)):
 
 # --- Rental Endpoints ---
 @router.get("/", response_model=List[Rental])
-def get_all_rentals(db: Session = Depends(database.get_db)):
-    rentals = db.query(models.EquipmentRental).all()
-    result = []
-    for rental in rentals:
-        rental_dict = {
-            "id": rental.id,
-            "equipment_id": rental.equipment_id,
-            "customer_name": rental.customer_name,
-            "customer_phone": rental.customer_phone,
-            "rental_date": rental.rental_date,
-            "return_date": rental.return_date,
-            "quantity": rental.quantity,
-            "total_price": rental.total_price,
-            "status": rental.status,
-            "equipment_name": rental.equipment.name if rental.equipment else None
-        }
-        result.append(rental_dict)
-    return result
+def get_all_rentals(page: Page = Depends(), fields: Fields = Depends(),
+                    date_from: Optional[date] = None, date_to: Optional[date] = None,
+                    db: Session = Depends(database.get_read_db)):
+    return rental_list(db, page, fields, date_from, date_to)
+
+def rental_list(db: Session, page: Page, fields: Fields, date_from: Optional[date] = None,
+                date_to: Optional[date] = None):
+    """Rentals, newest first; also called in-process by the embedded frontend (backend/services.py).
+
+    The equipment name comes from a join in the same query, not a lazy load per rental.
+    """
+    query = project(models.EquipmentRental, Rental, fields,
+                    joined=[models.CampingEquipment.name.label("equipment_name")]).join_from(
+        models.EquipmentRental, models.CampingEquipment,
+        models.CampingEquipment.id == models.EquipmentRental.equipment_id, isouter=True)
+    if date_from:
+        query = query.where(models.EquipmentRental.rental_date >= date_from)
+    if date_to:
+        query = query.where(models.EquipmentRental.rental_date <= date_to)
+    rows = row_dicts(db.execute(page.apply(query, models.EquipmentRental.id, descending=True)))
+    return RowsResponse(rows, headers=page.headers(rows))
+
+# --- Rental Stats ---
+ACTIVE_RENTAL_STATUS = "active"
+REVENUE_RENTAL_STATUSES = ("active", "returned")
+
+class RentalStats(BaseModel):
+    available_equipment: int
+    active_rentals: int
+    revenue: float
+    by_status: Dict[str, int]
+
+async def _rental_stats(db: AsyncSession):
+    rows = (await db.execute(
+        select(models.EquipmentRental.status, func.count(models.EquipmentRental.id),  # pylint: disable=not-callable
+               func.coalesce(func.sum(models.EquipmentRental.total_price), 0.0))
+        .group_by(models.EquipmentRental.status)
+    )).all()
+    available = await db.scalar(
+        select(func.count(models.CampingEquipment.id)).where(models.CampingEquipment.available > 0))  # pylint: disable=not-callable
+    return {
+        "available_equipment": available,
+        "active_rentals": sum(count for status, count, _ in rows if status == ACTIVE_RENTAL_STATUS),
+        "revenue": sum(revenue for status, _, revenue in rows if status in REVENUE_RENTAL_STATUSES),
+        "by_status": {status: count for status, count, _ in rows},
+    }
 
-@router.post("/", response_model=Rental)
-def create_rental(rental: RentalCreate, db: Session = Depends(database.get_db)):
+@router.get("/stats", response_model=RentalStats)
+async def get_rental_stats(db: AsyncSession = Depends(database.get_async_read_db)):
+    """Counts and revenue for the admin page, from one GROUP BY over rentals."""
+    return await cached_aggregate("rentals", [models.EquipmentRental, models.CampingEquipment],
+                                  lambda: _rental_stats(db))
+
+def _create_rental(db: Session, rental: RentalCreate):
     # Get equipment and calculate price
     equipment = db.query(models.CampingEquipment).filter(models.CampingEquipment.id == rental.equipment_id).first()
     if not equipment:
@@ -111,12 +169,7 @@ def create_rental(rental: RentalCreate, db: Session = Depends(database.get_db)):
         raise HTTPException(status_code=400, detail="Not enough equipment available")
     
     # Calculate total price (simple: days * price * quantity)
-    try:
-        start = datetime.strptime(rental.rental_date, "%Y-%m-%d")
-        end = datetime.strptime(rental.return_date, "%Y-%m-%d")
-        days = max((end - start).days, 1)
-    except:
-        days = 1
+    days = max((rental.return_date - rental.rental_date).days, 1)
     
     total_price = days * equipment.price_per_day * rental.quantity
     
@@ -129,9 +182,7 @@ def create_rental(rental: RentalCreate, db: Session = Depends(database.get_db)):
     
     # Update equipment availability
     equipment.available -= rental.quantity
-    
-    db.commit()
-    db.refresh(db_rental)
+    db.flush()
     
     return {
         **rental.dict(),
@@ -141,8 +192,7 @@ def create_rental(rental: RentalCreate, db: Session = Depends(database.get_db)):
         "equipment_name": equipment.name
     }
 
-@router.put("/{rental_id}/status")
-def update_rental_status(rental_id: int, status: str, db: Session = Depends(database.get_db)):
+def _update_rental_status(db: Session, rental_id: int, status: str):
     rental = db.query(models.EquipmentRental).filter(models.EquipmentRental.id == rental_id).first()
     if not rental:
         raise HTTPException(status_code=404, detail="Rental not found")
@@ -156,5 +206,12 @@ def update_rental_status(rental_id: int, status: str, db: Session = Depends(data
         if equipment:
             equipment.available += rental.quantity
     
-    db.commit()
     return {"message": "Rental status updated"}
+
+@router.post("/", response_model=Rental)
+def create_rental(rental: RentalCreate, db: Session = Depends(database.get_db)):
+    return run_write(db, _create_rental, rental)
+
+@router.put("/{rental_id}/status")
+def update_rental_status(rental_id: int, status: str, db: Session = Depends(database.get_db)):
+    return run_write(db, _update_rental_status, rental_id, status)
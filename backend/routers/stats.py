@@ -0,0 +1,102 @@
+import datetime
+from typing import Dict, List, Literal, Optional
+from fastapi import APIRouter, Depends
+from pydantic import BaseModel
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from backend import models, database
+from backend.cache import cached_aggregate
+from backend.projection import project, row_dicts
+from backend.routers.bookings import Booking
+from backend.routers.destinations import Destination
+from backend.routers.umkm import UMKM
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+ACTIVE_BOOKING_STATUSES = ("pending", "confirmed")
+
+class Dashboard(BaseModel):
+    total_visitors: int
+    active_bookings: int
+    bookings_by_status: Dict[str, int]
+    total_destinations: int
+    total_umkm: int
+    destinations: List[Destination]
+    recent_bookings: List[Booking]
+    top_umkm: List[UMKM]
+
+async def _dashboard(db: AsyncSession):
+    total_visitors, total_destinations = (await db.execute(
+        select(func.coalesce(func.sum(models.Destination.current_visitors), 0), func.count(models.Destination.id))  # pylint: disable=not-callable
+    )).one()
+    by_status = dict((await db.execute(
+        select(models.Booking.status, func.count(models.Booking.id)).group_by(models.Booking.status)  # pylint: disable=not-callable
+    )).all())
+    return {
+        "total_visitors": total_visitors,
+        "active_bookings": sum(by_status.get(status, 0) for status in ACTIVE_BOOKING_STATUSES),
+        "bookings_by_status": by_status,
+        "total_destinations": total_destinations,
+        "total_umkm": await db.scalar(select(func.count(models.UMKM.id))),  # pylint: disable=not-callable
+        "destinations": row_dicts(await db.execute(
+            project(models.Destination, Destination).order_by(models.Destination.id).limit(4))),
+        "recent_bookings": row_dicts(await db.execute(
+            project(models.Booking, Booking).order_by(models.Booking.id.desc()).limit(5))),
+        "top_umkm": row_dicts(await db.execute(
+            project(models.UMKM, UMKM).order_by(models.UMKM.rating.desc()).limit(5))),
+    }
+
+@router.get("/dashboard", response_model=Dashboard)
+async def read_dashboard(db: AsyncSession = Depends(database.get_async_read_db)):
+    """Admin dashboard figures, computed in SQL and cached until bookings, destinations or UMKM change."""
+    return await cached_aggregate("dashboard", [models.Booking, models.Destination, models.UMKM],
+                                  lambda: _dashboard(db))
+
+# --- Visitor & revenue time series (reads only the visitor_stats rollup) ---
+PERIODS = {
+    "hour": lambda: func.printf("%s %02d:00", models.VisitorStats.date, models.VisitorStats.hour),
+    "day": lambda: models.VisitorStats.date,
+    "week": lambda: func.strftime("%Y-W%W", models.VisitorStats.date),
+    "month": lambda: func.strftime("%Y-%m", models.VisitorStats.date),
+}
+
+class VisitorTotals(BaseModel):
+    visitor_count: int
+    revenue: float
+
+class VisitorPeriod(VisitorTotals):
+    period: str
+
+class VisitorSeries(BaseModel):
+    granularity: str
+    totals: VisitorTotals
+    series: List[VisitorPeriod]
+
+async def _visitor_series(db: AsyncSession, granularity, date_from, date_to, destination_id):
+    period = PERIODS[granularity]().label("period")
+    sums = [func.coalesce(func.sum(models.VisitorStats.visitor_count), 0).label("visitor_count"),
+            func.coalesce(func.sum(models.VisitorStats.revenue), 0.0).label("revenue")]
+    filters = [models.VisitorStats.date.isnot(None)]  # legacy rows whose date didn't parse
+    if date_from:
+        filters.append(models.VisitorStats.date >= date_from)
+    if date_to:
+        filters.append(models.VisitorStats.date <= date_to)
+    if destination_id is not None:
+        filters.append(models.VisitorStats.destination_id == destination_id)
+    series = row_dicts(await db.execute(select(period, *sums).where(*filters).group_by(period).order_by(period)))
+    totals = (await db.execute(select(*sums).where(*filters))).one()
+    return {
+        "granularity": granularity,
+        "totals": {"visitor_count": totals.visitor_count, "revenue": totals.revenue},
+        "series": series,
+    }
+
+@router.get("/visitors", response_model=VisitorSeries)
+async def read_visitor_series(granularity: Literal["hour", "day", "week", "month"] = "day",
+                              date_from: Optional[datetime.date] = None, date_to: Optional[datetime.date] = None,
+                              destination_id: Optional[int] = None,
+                              db: AsyncSession = Depends(database.get_async_read_db)):
+    """Check-in visitors and confirmed revenue per period, from the hourly rollups."""
+    key = ("visitors", granularity, date_from, date_to, destination_id)
+    return await cached_aggregate(key, [models.VisitorStats],
+                                  lambda: _visitor_series(db, granularity, date_from, date_to, destination_id))
@@ -1,8 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
 from backend import models, database
+from backend.pagination import Page
+from backend.projection import Fields, RowsResponse, project, row_dicts
+from backend.write_queue import run_write, run_write_async
 from datetime import datetime
 import uuid
 
@@ -26,37 +31,20 @@ class Ticket(TicketBase):
 class CheckInRequest(BaseModel):
     qr_code: str
 
-@router.post("/", response_model=Ticket)
-def create_ticket(ticket: TicketCreate, db: Session = Depends(database.get_db)):
+def _create_ticket(db: Session, booking_id: int):
     # Generate unique QR code
-    qr_code = f"PH-{ticket.booking_id}-{uuid.uuid4().hex[:8].upper()}"
+    qr_code = f"PH-{booking_id}-{uuid.uuid4().hex[:8].upper()}"
     
     db_ticket = models.Ticket(
-        booking_id=ticket.booking_id,
+        booking_id=booking_id,
         qr_code=qr_code,
         status="valid"
     )
     db.add(db_ticket)
-    db.commit()
-    db.refresh(db_ticket)
     return db_ticket
 
-@router.get("/", response_model=List[Ticket])
-def read_tickets(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_db)):
-    tickets = db.query(models.Ticket).offset(skip).limit(limit).all()
-    return tickets
-
-@router.get("/booking/{booking_id}", response_model=Ticket)
-def get_ticket_by_booking(booking_id: int, db: Session = Depends(database.get_db)):
-    ticket = db.query(models.Ticket).filter(models.Ticket.booking_id == booking_id).first()
-    if not ticket:
-        raise HTTPException(status_code=404, detail="Ticket not found for this booking")
-    return ticket
-
-@router.post("/check-in")
-def check_in_ticket(request: CheckInRequest, db: Session = Depends(database.get_db)):
-    """Process check-in using QR code"""
-    ticket = db.query(models.Ticket).filter(models.Ticket.qr_code == request.qr_code).first()
+def _check_in(db: Session, qr_code: str):
+    ticket = db.query(models.Ticket).filter(models.Ticket.qr_code == qr_code).first()
     
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
@@ -80,8 +68,6 @@ def check_in_ticket(request: CheckInRequest, db: Session = Depends(database.get_
             if destination:
                 destination.current_visitors += booking.num_visitors if booking.num_visitors else 1
     
-    db.commit()
-    
     return {
         "success": True,
         "message": "Check-in successful!",
@@ -89,15 +75,37 @@ def check_in_ticket(request: CheckInRequest, db: Session = Depends(database.get_
         "check_in_time": str(ticket.check_in_time)
     }
 
+@router.post("/", response_model=Ticket)
+def create_ticket(ticket: TicketCreate, db: Session = Depends(database.get_db)):
+    return run_write(db, _create_ticket, ticket.booking_id)
+
+@router.get("/", response_model=List[Ticket])
+def read_tickets(page: Page = Depends(), fields: Fields = Depends(), db: Session = Depends(database.get_read_db)):
+    rows = row_dicts(db.execute(page.apply(project(models.Ticket, Ticket, fields), models.Ticket.id)))
+    return RowsResponse(rows, headers=page.headers(rows))
+
+@router.get("/booking/{booking_id}", response_model=Ticket)
+def get_ticket_by_booking(booking_id: int, db: Session = Depends(database.get_read_db)):
+    ticket = db.query(models.Ticket).filter(models.Ticket.booking_id == booking_id).first()
+    if not ticket:
+        raise HTTPException(status_code=404, detail="Ticket not found for this booking")
+    return ticket
+
+@router.post("/check-in")
+async def check_in_ticket(request: CheckInRequest, db: AsyncSession = Depends(database.get_async_db)):
+    """Process check-in using QR code"""
+    return await run_write_async(db, _check_in, request.qr_code)
+
 @router.get("/validate/{qr_code}")
-def validate_ticket(qr_code: str, db: Session = Depends(database.get_db)):
+async def validate_ticket(qr_code: str, db: AsyncSession = Depends(database.get_async_read_db)):
     """Validate a ticket without checking in"""
-    ticket = db.query(models.Ticket).filter(models.Ticket.qr_code == qr_code).first()
+    result = await db.execute(select(models.Ticket).where(models.Ticket.qr_code == qr_code))
+    ticket = result.scalars().first()
     
     if not ticket:
         return {"valid": False, "message": "Ticket not found"}
     
-    booking = db.query(models.Booking).filter(models.Booking.id == ticket.booking_id).first()
+    booking = await db.get(models.Booking, ticket.booking_id)
     
     return {
         "valid": ticket.status == "valid",
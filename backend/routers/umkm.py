@@ -1,8 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
 from backend import models, database
+from backend.cache import cached_row, cached_rows, catalog_etag
+from backend.pagination import Page
+from backend.projection import Fields, project
 
 router = APIRouter(prefix="/umkm", tags=["umkm"])
 
@@ -33,18 +37,33 @@ def create_umkm(umkm: UMKMCreate, db: Session = Depends(database.get_db)):
     db.refresh(db_umkm)
     return db_umkm
 
-@router.get("/", response_model=List[UMKM])
-def read_umkm_list(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_db)):
-    umkm_list = db.query(models.UMKM).offset(skip).limit(limit).all()
-    return umkm_list
+def umkm_list_query(page: Page, fields: Optional[Fields] = None):
+    return page.apply(project(models.UMKM, UMKM, fields), models.UMKM.id)
 
-@router.get("/{umkm_id}", response_model=UMKM)
-def read_umkm(umkm_id: int, db: Session = Depends(database.get_db)):
-    umkm = db.query(models.UMKM).filter(models.UMKM.id == umkm_id).first()
-    if not umkm:
+def umkm_query(umkm_id: int):
+    return project(models.UMKM, UMKM).where(models.UMKM.id == umkm_id)
+
+# Reads, also called in-process by the embedded frontend (backend/services.py)
+async def umkm_list(db: AsyncSession, page: Page, fields: Fields, *, etag: Optional[str] = None):
+    return await cached_rows(db, models.UMKM, ("list", fields.key, *page.key), umkm_list_query(page, fields),
+                             etag, page)
+
+async def umkm_detail(db: AsyncSession, umkm_id: int):
+    umkm = await cached_row(db, models.UMKM, umkm_id, umkm_query(umkm_id))
+    if umkm is None:
         raise HTTPException(status_code=404, detail="UMKM not found")
     return umkm
 
+@router.get("/", response_model=List[UMKM])
+async def read_umkm_list(page: Page = Depends(), fields: Fields = Depends(),
+                         etag: str = Depends(catalog_etag(models.UMKM)),
+                         db: AsyncSession = Depends(database.get_async_read_db)):
+    return await umkm_list(db, page, fields, etag=etag)
+
+@router.get("/{umkm_id}", response_model=UMKM)
+async def read_umkm(umkm_id: int, db: AsyncSession = Depends(database.get_async_read_db)):
+    return await umkm_detail(db, umkm_id)
+
 @router.delete("/{umkm_id}")
 def delete_umkm(umkm_id: int, db: Session = Depends(database.get_db)):
     umkm = db.query(models.UMKM).filter(models.UMKM.id == umkm_id).first()
@@ -5,8 +5,10 @@ from typing import Optional, List
 from datetime import datetime
 import hashlib
 
-from backend.database import get_db
+from backend.database import get_db, get_read_db
 from backend.models import User
+from backend.pagination import Page
+from backend.projection import Fields, RowsResponse, project, row_dicts
 
 router = APIRouter(prefix="/users", tags=["users"])
 
@@ -128,14 +130,16 @@ def login_user(credentials: UserLogin, db: Session = Depends(get_db)):
     }
 
 @router.get("/", response_model=List[UserResponse])
-def list_users(skip: int = 0, limit: int = 100, role: Optional[str] = None, db: Session = Depends(get_db)):
-    query = db.query(User)
+def list_users(page: Page = Depends(), fields: Fields = Depends(), role: Optional[str] = None,
+               db: Session = Depends(get_read_db)):
+    query = project(User, UserResponse, fields)
     if role:
-        query = query.filter(User.role == role)
-    return query.offset(skip).limit(limit).all()
+        query = query.where(User.role == role)
+    rows = row_dicts(db.execute(page.apply(query, User.id)))
+    return RowsResponse(rows, headers=page.headers(rows))
 
 @router.get("/{user_id}", response_model=UserResponse)
-def get_user(user_id: int, db: Session = Depends(get_db)):
+def get_user(user_id: int, db: Session = Depends(get_read_db)):
     user = db.query(User).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User tidak ditemukan")
@@ -199,7 +203,7 @@ def delete_user(user_id: int, db: Session = Depends(get_db)):
 
 # --- Stats Endpoint ---
 @router.get("/stats/overview")
-def get_user_stats(db: Session = Depends(get_db)):
+def get_user_stats(db: Session = Depends(get_read_db)):
     total = db.query(User).count()
     active = db.query(User).filter(User.is_active.is_(True)).count()
     by_role = {}
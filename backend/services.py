@@ -0,0 +1,102 @@
+"""Read endpoints as plain function calls, for callers inside the API process.
+
+The catalog, the catalog lists and the admin lists are served by read
+functions in their routers (``destination_list``, ``booking_list``, ...) that
+take a session and the parsed parameters and return the response; the GET
+handlers only gather those parameters and await them. The embedded frontend
+(``API_MODE=embedded``) calls the same functions through ``call``: no HTTP
+request, no socket, no ASGI stack.
+
+``call`` finds the route for a GET path among the app's own routes and binds
+the read's parameters from the path and query string, validated against the
+read's annotations as FastAPI would. Paths without a read here (or parameters
+that don't validate) give None; send those through the app instead.
+"""
+import inspect
+import json
+from functools import lru_cache
+from urllib.parse import parse_qsl
+
+from fastapi import HTTPException
+from pydantic import TypeAdapter, ValidationError
+from starlette.concurrency import run_in_threadpool
+from starlette.routing import Match
+
+from backend import database
+from backend.main import app
+from backend.pagination import Page
+from backend.projection import Fields
+from backend.routers import bookings, catalog, contents, destinations, guides, packages, rentals, umkm
+
+# route path -> read function
+READS = {
+    "/catalog/": catalog.catalog_snapshot,
+    "/destinations/": destinations.destination_list,
+    "/destinations/{destination_id}": destinations.destination_detail,
+    "/packages/": packages.package_list,
+    "/packages/{package_id}": packages.package_detail,
+    "/umkm/": umkm.umkm_list,
+    "/umkm/{umkm_id}": umkm.umkm_detail,
+    "/contents/": contents.content_list,
+    "/contents/{content_id}": contents.content_detail,
+    "/guides/": guides.guide_list,
+    "/guides/available": guides.available_guide_list,
+    "/guides/{guide_id}": guides.guide_detail,
+    "/guides/bookings/": guides.guide_booking_list,
+    "/rentals/equipment": rentals.equipment_list,
+    "/rentals/equipment/available": rentals.available_equipment_list,
+    "/rentals/": rentals.rental_list,
+    "/bookings/": bookings.booking_list,
+}
+
+@lru_cache(maxsize=None)
+def _adapter(annotation):
+    return TypeAdapter(annotation)
+
+def _parameters(function):
+    """Parameters of ``function`` bound from the request; keyword-only ones are left to the router."""
+    return [parameter for name, parameter in inspect.signature(function).parameters.items()
+            if name != "db" and parameter.kind is not inspect.Parameter.KEYWORD_ONLY]
+
+def _bind(function, values):
+    arguments = {}
+    for parameter in _parameters(function):
+        if parameter.annotation in (Page, Fields):  # dependency classes: built from their own parameters
+            arguments[parameter.name] = parameter.annotation(**_bind(parameter.annotation, values))
+        elif parameter.name in values:
+            arguments[parameter.name] = _adapter(parameter.annotation).validate_python(values[parameter.name])
+    return arguments
+
+def _resolve(path):
+    """The route path and path parameters the app would route a GET of ``path`` to."""
+    scope = {"type": "http", "method": "GET", "path": path, "root_path": ""}
+    for route in app.router.routes:
+        match, child_scope = route.matches(scope)
+        if match is Match.FULL:
+            return route.path, child_scope["path_params"]
+    return None, None
+
+def _result(response):
+    return response.status_code, response.body, response.headers
+
+async def call(path):
+    """``(status, body bytes, headers)`` for a GET of ``path``, or None if it has no read here."""
+    path, _, query_string = path.partition("?")
+    route_path, path_params = _resolve(path)
+    read = READS.get(route_path)
+    if read is None:
+        return None
+    try:
+        arguments = _bind(read, {**dict(parse_qsl(query_string)), **path_params})
+        if inspect.iscoroutinefunction(read):
+            async with database.AsyncReadSessionLocal() as db:
+                return _result(await read(db, **arguments))
+        return _result(await run_in_threadpool(_call_sync, read, arguments))
+    except ValidationError:
+        return None  # let the API answer the validation error
+    except HTTPException as exc:
+        return exc.status_code, json.dumps({"detail": exc.detail}).encode(), exc.headers or {}
+
+def _call_sync(read, arguments):
+    with database.ReadSessionLocal() as db:
+        return read(db, **arguments)
@@ -0,0 +1,66 @@
+"""Warm start for the API lifespan.
+
+Checks that the schema is migrated, opens the read pools up front, loads
+``change_versions`` and fills the response caches with the first page of each
+catalog list and the ``/catalog/`` snapshot, so the first real requests don't
+pay for connection setup (pragmas, mmap), cold SQLite pages or JSON encoding.
+"""
+import asyncio
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from backend import database
+from backend.cache import sync_change_versions
+from backend.migrations import pending_versions
+from backend.pagination import Page
+from backend.projection import Fields
+from backend.routers import catalog, contents, destinations, guides, packages, rentals, umkm
+
+logger = logging.getLogger(__name__)
+
+# Default-page list reads whose responses go through ``cached_rows``
+HOT_READS = [
+    destinations.destination_list, packages.package_list, umkm.umkm_list,
+    contents.content_list, guides.guide_list, rentals.equipment_list,
+]
+
+def _warm_sync_pools():
+    database.engine.connect().close()
+    connections = [database.read_engine.connect() for _ in range(database.READ_POOL_SIZE)]
+    for conn in connections:
+        conn.execute(text("SELECT 1"))
+        conn.close()
+
+async def _warm_async_pool():
+    connections = [await database.async_read_engine.connect() for _ in range(database.READ_POOL_SIZE)]
+    for conn in connections:
+        await conn.execute(text("SELECT 1"))
+        await conn.close()
+
+async def _warm_list(read):
+    async with database.AsyncReadSessionLocal() as db:
+        await read(db, Page(), Fields())
+
+async def _warm_catalog():
+    async with database.AsyncReadSessionLocal() as db:
+        await catalog.catalog_snapshot(db)
+
+async def warm_up():
+    """Return True once the API is ready to serve."""
+    try:
+        pending = await asyncio.to_thread(pending_versions, database.read_engine)
+    except OperationalError as exc:  # e.g. no database file yet
+        logger.error("Database unavailable (%s); run `python -m backend.migrations`", exc)
+        return False
+    if pending:
+        logger.error("Pending migrations %s; run `python -m backend.migrations`", pending)
+        return False
+
+    await asyncio.to_thread(_warm_sync_pools)
+    await _warm_async_pool()
+    # ETags and cache versions come from change_versions: load it before caching anything
+    await sync_change_versions()
+    await asyncio.gather(*(_warm_list(read) for read in HOT_READS), _warm_catalog())
+    return True
@@ -0,0 +1,127 @@
+"""Single-writer group-commit queue for SQLite mutations.
+
+SQLite allows one writer at a time, so under load many request threads each
+calling ``db.commit()`` mostly wait on the lock and retry. With
+``DB_WRITE_QUEUE=1`` the routers hand their mutation to one writer thread
+instead. It drains every job waiting in the queue, runs each in its own
+SAVEPOINT (a failing job rolls back alone), commits the whole batch once and
+hands each caller its own result or exception.
+"""
+import asyncio
+import queue
+import threading
+from concurrent.futures import Future
+
+from sqlalchemy.orm import sessionmaker
+
+from backend import database
+
+class WriteQueue:
+    def __init__(self, session_factory, max_batch=64):
+        self._session_factory = session_factory
+        self._max_batch = max_batch
+        self._jobs = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.jobs = 0
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+                self._thread.start()
+
+    def stop(self, timeout=5):
+        if self._thread is not None:
+            self._jobs.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, fn, *args):
+        """Queue ``fn(session, *args)`` and return a Future for its result."""
+        self.start()
+        future = Future()
+        self._jobs.put((future, fn, args))
+        return future
+
+    def run(self, fn, *args):
+        """Queue ``fn(session, *args)`` and block until its batch is committed."""
+        return self.submit(fn, *args).result()
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            batch = [job]
+            while len(batch) < self._max_batch:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    self._jobs.put(None)  # stop after this batch
+                    break
+                batch.append(job)
+            self._commit_batch(batch)
+
+    def _commit_batch(self, batch):
+        session = self._session_factory()
+        done = []
+        try:
+            for future, fn, args in batch:
+                try:
+                    with session.begin_nested():
+                        result = fn(session, *args)
+                except Exception as exc:
+                    future.set_exception(exc)
+                else:
+                    done.append((future, result))
+            session.commit()
+            # Results outlive the writer session; detach them with their loaded state.
+            session.expunge_all()
+        except Exception as exc:
+            session.rollback()
+            for future, _ in done:
+                future.set_exception(exc)
+            return
+        finally:
+            session.close()
+            self.batches += 1
+            self.jobs += len(batch)
+        for future, result in done:
+            future.set_result(result)
+
+write_queue = WriteQueue(
+    sessionmaker(autoflush=False, expire_on_commit=False, bind=database.create_writer_engine()),
+    max_batch=database.WRITE_QUEUE_MAX_BATCH,
+) if database.WRITE_QUEUE_ENABLED else None
+
+def run_write(db, fn, *args):
+    """Run ``fn(session, *args)`` as a write transaction and return its result.
+
+    Goes through the shared writer thread when the write queue is enabled,
+    otherwise runs on the request's own session and commits it.
+    """
+    if write_queue is not None:
+        return write_queue.run(fn, *args)
+    try:
+        result = fn(db, *args)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return result
+
+async def run_write_async(db, fn, *args):
+    """``run_write`` for ``AsyncSession`` handlers; ``fn`` stays a plain sync function."""
+    if write_queue is not None:
+        return await asyncio.wrap_future(write_queue.submit(fn, *args))
+    try:
+        result = await db.run_sync(fn, *args)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return result
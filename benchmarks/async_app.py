@@ -0,0 +1,20 @@
+"""The API plus the pre-async threadpool handlers, mounted under /_bench/sync for comparison."""
+from typing import List
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from backend import database, models
+from backend.main import app
+from backend.routers import destinations, packages
+
+def sync_read_destinations(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_read_db)):
+    return db.query(models.Destination).offset(skip).limit(limit).all()
+
+def sync_read_packages(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_read_db)):
+    return db.query(models.Package).offset(skip).limit(limit).all()
+
+app.add_api_route("/_bench/sync/destinations/", sync_read_destinations,
+                  response_model=List[destinations.Destination], include_in_schema=False)
+app.add_api_route("/_bench/sync/packages/", sync_read_packages,
+                  response_model=List[packages.Package], include_in_schema=False)
@@ -0,0 +1,51 @@
+"""Async (aiosqlite) handlers vs the sync threadpool path at rising concurrency.
+
+Sync handlers each hold one of the threadpool's 40 slots while they wait on SQLite,
+and keep their pooled connection until the response model is serialized, which needs
+a threadpool slot again. Past ~40 requests in flight the sync path therefore stalls
+until QueuePool times out (30 s, reported as errors); async handlers wait on the event
+loop instead. The run reports req/s and tail latency of both versions of the
+destinations and packages lists at each concurrency level.
+
+    python -m benchmarks.bench_async --concurrency 16,64,256 --requests 2000
+"""
+import argparse
+import threading
+
+import requests
+
+from benchmarks.common import hammer, init_database, print_table, run_server, temp_database
+
+_local = threading.local()
+
+def _session():
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+    return _local.session
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", default="16,64,256")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=100)
+    args = parser.parse_args()
+
+    env = {"DATABASE_PATH": temp_database()}
+    init_database(env)
+    with run_server(env, app="benchmarks.async_app:app") as base_url:
+        for i in range(args.rows):
+            requests.post(f"{base_url}/destinations/", json={"name": f"Island {i}", "description": "x" * 500})
+            requests.post(f"{base_url}/packages/", json={"name": f"Package {i}", "price": 1000, "features": "a,b,c"})
+
+        rows = []
+        for concurrency in (int(c) for c in args.concurrency.split(",")):
+            for label, path in (("async", "/destinations/"), ("sync", "/_bench/sync/destinations/"),
+                                ("async", "/packages/"), ("sync", "/_bench/sync/packages/")):
+                def call(_i, path=path):
+                    return _session().get(base_url + path, timeout=60).status_code == 200
+                rows.append((f"c={concurrency} {label} {path.rsplit('/', 2)[-2]}",
+                             hammer(call, args.requests, concurrency)))
+    print_table(f"{args.rows} rows per list, 1 uvicorn worker", rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Catalog read throughput with and without the in-process catalog cache.
+
+Serves the same seeded database twice, once with ``CATALOG_CACHE_TTL=0`` (cache
+off) and once with the default TTL. Each run hammers the public catalog lists and
+reports req/s, tail latency and the server's ``/cache/stats`` hit ratio.
+
+    python -m benchmarks.bench_cache --requests 2000 --concurrency 32
+"""
+import argparse
+import threading
+
+import requests
+
+from benchmarks.common import hammer, init_database, print_table, run_server, temp_database
+
+CATALOG_PATHS = ["/destinations/", "/packages/", "/contents/", "/umkm/", "/guides/", "/rentals/equipment"]
+
+_local = threading.local()
+
+def _session():
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+    return _local.session
+
+def seed(base_url, rows):
+    for i in range(rows):
+        requests.post(f"{base_url}/destinations/", json={"name": f"Island {i}", "description": "x" * 500})
+        requests.post(f"{base_url}/packages/", json={"name": f"Package {i}", "price": 1000, "features": "a,b,c"})
+        requests.post(f"{base_url}/umkm/", json={"name": f"UMKM {i}", "description": "y" * 200, "category": "kuliner"})
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--rows", type=int, default=100)
+    args = parser.parse_args()
+
+    env = {"DATABASE_PATH": temp_database()}
+    init_database(env)
+    with run_server(env) as base_url:
+        seed(base_url, args.rows)
+
+    rows = []
+    for label, ttl in (("cache off", "0"), ("cache on", "30")):
+        with run_server({**env, "CATALOG_CACHE_TTL": ttl}) as base_url:
+            def call(i, base_url=base_url):
+                path = CATALOG_PATHS[i % len(CATALOG_PATHS)]
+                return _session().get(base_url + path, timeout=60).status_code == 200
+            summary = hammer(call, args.requests, args.concurrency)
+            ratio = requests.get(f"{base_url}/cache/stats").json()["hit_ratio"]
+            rows.append((f"{label} (hit ratio {ratio:.2f})", summary))
+    print_table(f"catalog lists, {args.rows} rows each, c={args.concurrency}", rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Catalog list size and throughput: identity, gzip per request, gzip cached per version.
+
+Seeds destinations with realistic descriptions, then fetches ``/destinations/``
+(``--limit`` rows) from one uvicorn worker three ways: without compression,
+gzipped on every request (``COMPRESSED_CACHE_SIZE=0``), and gzipped once per
+table version (the default). Also prints how long one body takes to transfer
+over a slow link (``--link-kbps``, default 1000, an island 3G connection).
+
+    python -m benchmarks.bench_compression --rows 500 --requests 2000
+"""
+import argparse
+import threading
+
+import requests
+
+from benchmarks.common import hammer, init_database, print_table, run_server, temp_database
+
+_local = threading.local()
+
+def _session():
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+    return _local.session
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--link-kbps", type=int, default=1000)
+    args = parser.parse_args()
+
+    env = {"DATABASE_PATH": temp_database()}
+    init_database(env)
+    results, sizes = [], {}
+    for label, encoding, cache_size in (("identity", "identity", "256"), ("gzip per request", "gzip", "0"),
+                                        ("gzip cached per version", "gzip", "256")):
+        with run_server({**env, "COMPRESSED_CACHE_SIZE": cache_size}) as base_url:
+            if not sizes:
+                for i in range(args.rows):
+                    requests.post(f"{base_url}/destinations/", json={
+                        "name": f"Pulau {i}", "type": "alam", "image_url": f"/static/img/destinations/{i}.jpg",
+                        "description": f"Pulau {i} di Kepulauan Seribu: pantai pasir putih, snorkeling di "
+                                       "terumbu karang, dermaga kayu dan homestay warga. " * 3})
+            url = f"{base_url}/destinations/?limit={args.limit}"
+            headers = {"Accept-Encoding": encoding}
+            with requests.get(url, headers=headers, stream=True) as response:
+                sizes[label] = len(response.raw.read())
+
+            def call(_i, url=url, headers=headers):
+                return _session().get(url, headers=headers, timeout=60).ok
+            results.append((label, hammer(call, args.requests, args.concurrency)))
+
+    print_table(f"/destinations/ with {args.limit} rows, concurrency {args.concurrency}, 1 uvicorn worker", results)
+    print(f"\n{'case':<34}{'bytes':>10}{'transfer @ ' + str(args.link_kbps) + ' kbps':>24}")
+    for label, size in sizes.items():
+        print(f"{label:<34}{size:>10}{size * 8 / args.link_kbps:>21.0f} ms")
+
+if __name__ == "__main__":
+    main()
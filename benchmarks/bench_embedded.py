@@ -0,0 +1,85 @@
+"""Page render cost of the Flask frontend: API over HTTP vs embedded in-process.
+
+Seeds a database, then renders the same pages through the Flask test client
+twice: once calling a uvicorn API over loopback HTTP (``API_MODE=http``), once
+with the API embedded in the frontend process (``API_MODE=embedded``). Reports
+per-page latency and the CPU spent per page, frontend and API process together.
+
+    python -m benchmarks.bench_embedded --renders 200
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+import requests
+
+from benchmarks.common import (PROJECT_ROOT, cpu_seconds, init_database, percentile, run_server,
+                               run_server_process, temp_database)
+
+PAGES = ["/", "/destinations", "/marketplace", "/destination/1", "/admin", "/admin/rentals", "/admin/guides"]
+
+def seed(base_url, rows):
+    for i in range(rows):
+        requests.post(f"{base_url}/destinations/", json={"name": f"Island {i}", "description": "x" * 300})
+        requests.post(f"{base_url}/packages/", json={"name": f"Package {i}", "price": 1000, "features": "a,b,c"})
+        requests.post(f"{base_url}/umkm/", json={"name": f"UMKM {i}", "description": "y" * 200, "category": "kuliner"})
+        requests.post(f"{base_url}/contents/", json={"type": "news", "title": f"News {i}", "body": "z" * 200})
+
+def render(frontend, renders):
+    """Render every page ``renders`` times; returns (latencies in ms per page, CPU seconds of this process)."""
+    client = frontend.test_client()
+    with client.session_transaction() as session:
+        session["admin_logged_in"] = True
+    for page in PAGES:  # warm up: first requests, caches, embedded startup
+        assert client.get(page).status_code == 200, page
+    latencies = {page: [] for page in PAGES}
+    cpu_started = time.process_time()
+    for _ in range(renders):
+        for page in PAGES:
+            started = time.perf_counter()
+            client.get(page)
+            latencies[page].append((time.perf_counter() - started) * 1000)
+    return latencies, time.process_time() - cpu_started
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--renders", type=int, default=200)
+    parser.add_argument("--rows", type=int, default=50)
+    args = parser.parse_args()
+
+    env = {"DATABASE_PATH": temp_database()}
+    init_database(env)
+    with run_server(env) as base_url:
+        seed(base_url, args.rows)
+
+    # The frontend and the embedded backend are imported in this process
+    os.environ.update(env)
+    sys.path[:0] = [os.path.join(PROJECT_ROOT, "frontend"), PROJECT_ROOT]
+    import app as frontend_app  # pylint: disable=import-outside-toplevel
+    import backend_client  # pylint: disable=import-outside-toplevel
+    logging.getLogger("backend_client").setLevel(logging.ERROR)  # pages tolerate e.g. no facilities
+
+    results = []
+    with run_server_process(env) as (server, base_url):
+        frontend_app.api = backend_client.BackendClient(base_url)
+        server_cpu = cpu_seconds(server.pid)
+        latencies, cpu = render(frontend_app.app, args.renders)
+        results.append(("http", latencies, cpu, cpu_seconds(server.pid) - server_cpu))
+    frontend_app.api = backend_client.EmbeddedClient()
+    latencies, cpu = render(frontend_app.app, args.renders)
+    results.append(("embedded", latencies, cpu, 0.0))
+
+    total = args.renders * len(PAGES)
+    print(f"\n{args.renders} renders of {len(PAGES)} pages, {args.rows} rows per catalog table")
+    print(f"{'page':<18}" + "".join(f"{mode + ' p50':>14}{mode + ' p99':>14}" for mode, *_ in results))
+    for page in PAGES:
+        print(f"{page:<18}" + "".join(f"{percentile(lat[page], 50):>14.2f}{percentile(lat[page], 99):>14.2f}"
+                                      for _, lat, *_ in results))
+    for mode, _, cpu, api_cpu in results:
+        print(f"{mode:<9} CPU per page: {(cpu + api_cpu) / total * 1000:.2f} ms "
+              f"(frontend process {cpu / total * 1000:.2f}, API server {api_cpu / total * 1000:.2f})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Peak API memory while streaming ``/export/bookings`` at growing table sizes.
+
+Each size gets a fresh database and a fresh uvicorn process, so the reported
+peak RSS is what one export costs the server. With streaming it should stay
+about flat while the export grows. SQLite's page cache and mmap window
+(``SQLITE_CACHE_SIZE``, ``SQLITE_MMAP_SIZE``) still fill up to their limits as
+the file is read; run with ``SQLITE_CACHE_SIZE=-2000 SQLITE_MMAP_SIZE=0`` to
+see the export's own footprint.
+
+    python -m benchmarks.bench_export --sizes 10000 100000 300000
+"""
+import argparse
+import sqlite3
+import time
+from datetime import date, timedelta
+
+import requests
+
+from benchmarks.common import init_database, peak_rss_mb, run_server_process, temp_database
+
+def fill(path, rows):
+    start = date(2025, 1, 1)
+    with sqlite3.connect(path) as conn:
+        conn.executemany(
+            "INSERT INTO bookings (customer_name, email, package_id, date, status, num_visitors, total_price, "
+            "created_at) VALUES (?, ?, NULL, ?, ?, 2, 350000, '2025-01-01 00:00:00')",
+            [(f"Guest {i}", f"guest{i}@example.com", (start + timedelta(days=i % 365)).isoformat(),
+              "confirmed" if i % 3 else "pending") for i in range(rows)],
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 300000])
+    args = parser.parse_args()
+
+    print(f"\n{'rows':>10}{'format':>8}{'MB sent':>10}{'seconds':>10}{'API RSS before':>16}{'API RSS peak':>14}")
+    for rows in args.sizes:
+        env = {"DATABASE_PATH": temp_database()}
+        init_database(env)
+        fill(env["DATABASE_PATH"], rows)
+        for fmt in ("ndjson", "csv"):
+            with run_server_process(env) as (server, base_url):
+                before = peak_rss_mb(server.pid)
+                started = time.perf_counter()
+                sent = 0
+                with requests.get(f"{base_url}/export/bookings", params={"format": fmt}, stream=True) as response:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        sent += len(chunk)
+                elapsed = time.perf_counter() - started
+                print(f"{rows:>10}{fmt:>8}{sent / 1e6:>10.1f}{elapsed:>10.2f}"
+                      f"{before:>16.1f}{peak_rss_mb(server.pid):>14.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Req/s of the large admin lists: validated ORM rows vs trusted rows encoded with orjson.
+
+Seeds bookings, tickets, feedback and users, then requests full pages
+(``limit``, default 500) of each list from one uvicorn worker, both through
+the new handlers (Core rows written by ``RowsResponse``) and through the old
+validate-then-encode handlers mounted by ``benchmarks/json_app.py``.
+
+    python -m benchmarks.bench_json --rows 2000 --requests 400 --concurrency 8
+"""
+import argparse
+import sqlite3
+import threading
+
+import requests
+
+from benchmarks.common import hammer, init_database, print_table, run_server, temp_database
+
+LISTS = ("bookings", "tickets", "feedback", "users")
+
+_local = threading.local()
+
+def _session():
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+    return _local.session
+
+def fill(path, rows):
+    with sqlite3.connect(path) as conn:
+        conn.execute("INSERT INTO packages (id, name, price, features) VALUES (1, 'Snorkeling', 175000, 'Boat')")
+        conn.executemany(
+            "INSERT INTO bookings (id, customer_name, email, package_id, date, status, num_visitors, total_price, "
+            "created_at) VALUES (?, ?, ?, 1, '2026-03-01', 'confirmed', 2, 350000, '2026-01-01 08:00:00')",
+            [(i, f"Guest {i}", f"guest{i}@example.com") for i in range(1, rows + 1)])
+        conn.executemany("INSERT INTO tickets (booking_id, qr_code, status) VALUES (?, ?, 'valid')",
+                         [(i, f"PH-{i}-BENCH") for i in range(1, rows + 1)])
+        conn.executemany(
+            "INSERT INTO feedbacks (type, subject, message, status, priority, created_at) "
+            "VALUES ('review', ?, 'Airnya jernih, pemandu ramah', 'open', 'normal', ?)",
+            [(f"Subject {i}", f"2026-01-01 08:{i // 60 % 60:02d}:{i % 60:02d}") for i in range(rows)])
+        conn.executemany(
+            "INSERT INTO users (username, email, password_hash, name, role, is_active, created_at) "
+            "VALUES (?, ?, 'x', ?, 'visitor', 1, '2026-01-01 08:00:00')",
+            [(f"user{i}", f"user{i}@example.com", f"User {i}") for i in range(rows)])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    env = {"DATABASE_PATH": temp_database()}
+    init_database(env)
+    fill(env["DATABASE_PATH"], args.rows)
+    results = []
+    with run_server(env, app="benchmarks.json_app:app") as base_url:
+        for name in LISTS:
+            for label, path in (("validated", f"/_bench/validated/{name}/"), ("orjson rows", f"/{name}/")):
+                def call(_i, path=path):
+                    return _session().get(base_url + path, params={"limit": args.limit}, timeout=60).ok
+                call(0)  # warm up
+                results.append((f"{name:<10}{label}", hammer(call, args.requests, args.concurrency)))
+    print_table(f"{args.limit} rows per response, concurrency {args.concurrency}, 1 uvicorn worker", results)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Offset versus keyset (cursor) pages at increasing depth.
+
+Fills a throwaway database with feedback rows, then times fetching one page
+at several depths of the newest-first feedback list, once with
+``offset(skip)`` and once with a ``Page`` cursor positioned at the same row.
+
+    python -m benchmarks.bench_pagination --rows 200000 --limit 50
+"""
+import argparse
+import os
+import time
+from datetime import datetime, timedelta
+
+from benchmarks.common import init_database, temp_database
+
+def fill(engine, rows):
+    start = datetime(2020, 1, 1)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO feedbacks (type, subject, message, status, priority, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+            [("review", f"Subject {i}", "Pantai bersih, dermaga ramai", "open", "normal",
+              start + timedelta(minutes=i)) for i in range(rows)],
+        )
+
+def timed(engine, query, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with engine.connect() as conn:
+            conn.execute(query).all()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    os.environ["DATABASE_PATH"] = temp_database()
+    init_database({"DATABASE_PATH": os.environ["DATABASE_PATH"]})
+    from sqlalchemy import select  # pylint: disable=import-outside-toplevel
+    from backend import database, models  # pylint: disable=import-outside-toplevel
+    from backend.pagination import Page, encode_cursor  # pylint: disable=import-outside-toplevel
+    fill(database.engine, args.rows)
+
+    keys = (models.Feedback.created_at, models.Feedback.id)
+    newest_first = [key.desc() for key in keys]
+    print(f"\n{args.rows} feedback rows, pages of {args.limit}, best of {args.repeat}")
+    print(f"{'depth (rows)':>14}{'offset ms':>12}{'cursor ms':>12}")
+    for depth in (0, args.rows // 10, args.rows // 2, args.rows - args.limit):
+        offset_query = select(models.Feedback).order_by(*newest_first).offset(depth).limit(args.limit)
+        with database.engine.connect() as conn:
+            boundary = conn.execute(select(*keys).order_by(*newest_first).offset(depth - 1).limit(1)).first() \
+                if depth else None
+        page = Page(limit=args.limit, cursor=encode_cursor(list(boundary)) if boundary else None)
+        cursor_query = page.apply(select(models.Feedback), *keys, descending=True)
+        print(f"{depth:>14}{timed(database.engine, offset_query, args.repeat):>12.2f}"
+              f"{timed(database.engine, cursor_query, args.repeat):>12.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""ORM + Pydantic versus the Core projection path for list endpoints.
+
+Fills a throwaway database with destinations and UMKM, then serializes each
+listing both ways in-process: ORM objects validated through the response
+schema (the old path) and ``project`` + ``row_dicts`` + ``RowsResponse``.
+Reports time and peak Python allocations per 10k rows.
+
+    python -m benchmarks.bench_projection --rows 10000 --repeat 5
+"""
+import argparse
+import os
+import time
+import tracemalloc
+from typing import List
+
+from pydantic import TypeAdapter
+
+from backend.projection import RowsResponse, project, row_dicts
+from benchmarks.common import init_database, temp_database
+
+def fill(session_factory, models, rows):
+    with session_factory() as db:
+        db.add_all(models.Destination(name=f"Destination {i}", description="Pantai dan terumbu karang " * 4,
+                                      image_url=f"/static/img/{i}.jpg", latitude=-5.7, longitude=106.6)
+                   for i in range(rows))
+        db.add_all(models.UMKM(name=f"UMKM {i}", description="Kerajinan kerang", category="kerajinan",
+                               location="Pulau Pramuka", rating=4.5)
+                   for i in range(rows))
+        db.commit()
+
+def orm_path(session_factory, model, schema):
+    adapter = TypeAdapter(List[schema])
+    with session_factory() as db:
+        rows = db.query(model).all()
+        return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+def projection_path(session_factory, model, schema):
+    with session_factory() as db:
+        return RowsResponse(row_dicts(db.execute(project(model, schema)))).body
+
+def measure(fn, repeat):
+    """Best wall time and peak traced allocation (MiB) over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak / 2**20
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    env = {"DATABASE_PATH": temp_database()}
+    init_database(env)
+    os.environ.update(env)  # the backend reads DATABASE_PATH at import
+    from backend import database, models
+    from backend.routers.destinations import Destination
+    from backend.routers.umkm import UMKM
+
+    fill(database.SessionLocal, models, args.rows)
+    per_10k = 10000 / args.rows
+
+    print(f"\n{args.rows} rows per listing, best of {args.repeat}; figures scaled to 10k rows")
+    print(f"{'listing':<16}{'path':<12}{'ms':>10}{'peak MiB':>12}")
+    for model, schema in [(models.Destination, Destination), (models.UMKM, UMKM)]:
+        for label, path in [("orm", orm_path), ("projection", projection_path)]:
+            seconds, peak = measure(lambda p=path: p(database.ReadSessionLocal, model, schema), args.repeat)
+            print(f"{model.__tablename__:<16}{label:<12}{seconds * 1000 * per_10k:>10.1f}{peak * per_10k:>12.1f}")
+
+if __name__ == "__main__":
+    main()
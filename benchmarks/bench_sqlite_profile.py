@@ -0,0 +1,91 @@
+"""Write throughput / p99 latency for POST /bookings/ and POST /tickets/check-in.
+
+Runs the API under several uvicorn workers twice, once with ``SQLITE_PROFILE=default``
+(stock SQLite) and once with ``SQLITE_PROFILE=production`` (WAL, synchronous=NORMAL,
+busy_timeout, ...), each against a fresh database file. ``--write-queue`` adds a run
+of the production profile with the group-commit writer (``DB_WRITE_QUEUE=1``).
+
+    python -m benchmarks.bench_sqlite_profile --workers 4 --requests 1000 --concurrency 32
+"""
+import argparse
+import threading
+
+import requests
+
+from benchmarks.common import hammer, init_database, print_table, run_server, temp_database
+
+_local = threading.local()
+
+def _session():
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+    return _local.session
+
+def get_all(url):
+    """Every row of a cursor-paged list, following ``X-Next-Cursor`` page by page.
+
+    One request can't ask for them all: ``limit`` is capped at ``MAX_PAGE_SIZE``.
+    """
+    rows, params = [], {}
+    while True:
+        res = requests.get(url, params=params)
+        rows += res.json()
+        cursor = res.headers.get("X-Next-Cursor")
+        if not cursor:
+            return rows
+        params["cursor"] = cursor
+
+def run_profile(profile, args, extra_env=None):
+    env = {"SQLITE_PROFILE": profile, "DATABASE_PATH": temp_database(), **(extra_env or {})}
+    init_database(env)
+    with run_server(env, workers=args.workers) as base_url:
+        package = requests.post(f"{base_url}/packages/", json={
+            "name": "Bench Package", "price": 100000, "features": "a,b",
+        }).json()
+
+        def book(i):
+            res = _session().post(f"{base_url}/bookings/", json={
+                "customer_name": f"Bench {i}", "email": f"bench{i}@example.com",
+                "package_id": package["id"], "date": "2026-01-20", "num_visitors": 2,
+            }, timeout=30)
+            return res.status_code == 200
+
+        bookings = hammer(book, args.requests, args.concurrency)
+
+        # Tickets for the check-in run are issued up front and not timed.
+        booking_ids = [b["id"] for b in get_all(f"{base_url}/bookings/")]
+        qr_codes = [
+            requests.post(f"{base_url}/tickets/", json={"booking_id": booking_id}).json()["qr_code"]
+            for booking_id in booking_ids
+        ]
+
+        def check_in(i):
+            res = _session().post(f"{base_url}/tickets/check-in",
+                                  json={"qr_code": qr_codes[i % len(qr_codes)]}, timeout=30)
+            return res.status_code == 200
+
+        check_ins = hammer(check_in, len(qr_codes), args.concurrency)
+    return bookings, check_ins
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--profiles", default="default,production")
+    parser.add_argument("--write-queue", action="store_true")
+    args = parser.parse_args()
+
+    rows = []
+    for profile in args.profiles.split(","):
+        bookings, check_ins = run_profile(profile, args)
+        rows.append((f"{profile}: POST /bookings/", bookings))
+        rows.append((f"{profile}: POST /tickets/check-in", check_ins))
+    if args.write_queue:
+        bookings, check_ins = run_profile("production", args, {"DB_WRITE_QUEUE": "1"})
+        rows.append(("write queue: POST /bookings/", bookings))
+        rows.append(("write queue: POST /tickets/check-in", check_ins))
+    print_table(f"{args.workers} uvicorn workers, concurrency {args.concurrency}", rows)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Time from process start to the first served request.
+
+Starts uvicorn against a migrated database several times and polls
+GET /destinations/ every few milliseconds until it answers 200.
+
+    python -m benchmarks.bench_startup --runs 5 --workers 1
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import requests
+
+from benchmarks.common import PROJECT_ROOT, free_port, init_database, temp_database
+
+def time_to_first_request(env, workers, path):
+    port = free_port()
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend.main:app", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=PROJECT_ROOT, env={**os.environ, "PYTHONPATH": PROJECT_ROOT, **env},
+    )
+    try:
+        while time.perf_counter() - started < 60:
+            try:
+                if requests.get(f"http://127.0.0.1:{port}{path}", timeout=1).status_code == 200:
+                    return time.perf_counter() - started
+            except requests.RequestException:
+                pass
+            time.sleep(0.005)
+        raise RuntimeError("server did not answer within 60s")
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--path", default="/destinations/")
+    args = parser.parse_args()
+
+    env = {"DATABASE_PATH": temp_database()}
+    init_database(env)
+    samples = [time_to_first_request(env, args.workers, args.path) * 1000 for _ in range(args.runs)]
+    print(f"\nstart -> first 200 on {args.path} ({args.workers} worker(s), {args.runs} runs)")
+    print(f"min {min(samples):.0f} ms   median {statistics.median(samples):.0f} ms   max {max(samples):.0f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Shared helpers for the benchmark scripts in this folder.
+
+Run benchmarks from the project root, e.g. ``python -m benchmarks.bench_sqlite_profile``.
+The database and server process helpers live with the tests (``tests/_servers.py``)
+and are re-exported here.
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from tests._servers import (PROJECT_ROOT, free_port, init_database, run_server, run_server_process,
+                            temp_database)
+
+def cpu_seconds(pid):
+    """User + system CPU time used so far by process ``pid`` (Linux, from /proc)."""
+    with open(f"/proc/{pid}/stat", encoding="ascii") as stat:
+        fields = stat.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+def peak_rss_mb(pid):
+    """Peak resident memory of process ``pid`` so far, in MB (Linux, from /proc)."""
+    with open(f"/proc/{pid}/status", encoding="ascii") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+def hammer(call, total, concurrency):
+    """Run ``call(i)`` ``total`` times from ``concurrency`` threads.
+
+    ``call`` returns a truthy value on success. Returns a summary dict with
+    throughput (ok requests per second) and latency percentiles in ms.
+    """
+    def timed(i):
+        start = time.perf_counter()
+        try:
+            ok = bool(call(i))
+        except requests.RequestException:
+            ok = False
+        return ok, (time.perf_counter() - start) * 1000
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(timed, range(total)))
+    elapsed = time.perf_counter() - started
+
+    latencies = [ms for ok, ms in results if ok]
+    return {
+        "ok": len(latencies),
+        "errors": total - len(latencies),
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p99_ms": percentile(latencies, 99),
+    }
+
+def print_table(title, rows):
+    """Print ``rows`` (label, summary) as a small fixed-width table."""
+    print(f"\n{title}")
+    print(f"{'case':<34}{'ok':>7}{'err':>6}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for label, summary in rows:
+        print(f"{label:<34}{summary['ok']:>7}{summary['errors']:>6}{summary['rps']:>10.1f}"
+              f"{summary['p50_ms']:>10.1f}{summary['p99_ms']:>10.1f}")
@@ -0,0 +1,27 @@
+"""The API plus the old validated list handlers, mounted under /_bench/validated for comparison.
+
+These return ORM objects, so FastAPI validates every row against the
+response model and encodes it with the stdlib ``json`` module.
+"""
+from typing import List
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from backend import database, models
+from backend.main import app
+from backend.routers import bookings, feedback, tickets, users
+
+def _validated(model, order_by):
+    def read(skip: int = 0, limit: int = 100, db: Session = Depends(database.get_read_db)):
+        return db.query(model).order_by(*order_by).offset(skip).limit(limit).all()
+    return read
+
+for name, model, schema, order_by in (
+    ("bookings", models.Booking, bookings.Booking, [models.Booking.id]),
+    ("tickets", models.Ticket, tickets.Ticket, [models.Ticket.id]),
+    ("feedback", models.Feedback, feedback.Feedback, [models.Feedback.created_at.desc(), models.Feedback.id.desc()]),
+    ("users", models.User, users.UserResponse, [models.User.id]),
+):
+    app.add_api_route(f"/_bench/validated/{name}/", _validated(model, order_by),
+                      response_model=List[schema], include_in_schema=False)
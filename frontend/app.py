@@ -1,13 +1,50 @@
-import requests
 import secrets
 from flask import Flask, render_template, request, redirect, url_for, session, flash, jsonify
 from functools import wraps
+from urllib.parse import urlencode
 
 import os
 
+from backend_client import api
+
 app = Flask(__name__)
 app.secret_key = os.environ.get("SECRET_KEY", secrets.token_hex(16))
-API_URL = os.environ.get("API_URL", "http://localhost:8000")
+
+# Admin tables show one page of the newest rows; counts come from the API's /stats endpoints
+ADMIN_PAGE_SIZE = int(os.environ.get("ADMIN_PAGE_SIZE", 50))
+
+def _cursor_args(name):
+    """Query args carrying a table's cursor and trail; ``name`` tells apart two pagers on one page."""
+    return (f"{name}_cursor", f"{name}_trail") if name else ("cursor", "trail")
+
+def page_params(name=None):
+    """``limit``/``cursor`` query string for the page of the current admin request."""
+    cursor_arg, _ = _cursor_args(name)
+    params = {"limit": ADMIN_PAGE_SIZE}
+    if request.args.get(cursor_arg):
+        params["cursor"] = request.args[cursor_arg]
+    return urlencode(params)
+
+def pager(next_cursor, name=None):
+    """Previous/next links of a cursor-paged admin table.
+
+    Cursors only lead forward, so the cursors of the pages before this one
+    travel in ``trail`` (comma-separated; cursors are URL-safe base64) for
+    the previous link. The first page has no cursor. Links keep the other
+    query args, so a second named pager on the page stays where it is.
+    """
+    cursor_arg, trail_arg = _cursor_args(name)
+    cursor = request.args.get(cursor_arg)
+    trail = [c for c in request.args.get(trail_arg, '').split(',') if c]
+    others = {k: v for k, v in request.args.items() if k not in (cursor_arg, trail_arg)}
+
+    def link(to, to_trail):
+        args = {**others, cursor_arg: to, trail_arg: ','.join(to_trail)}
+        return url_for(request.endpoint, **{k: v for k, v in args.items() if v})
+
+    prev_url = link(trail[-1] if trail else None, trail[:-1]) if cursor else None
+    next_url = link(next_cursor, trail + [cursor] if cursor else []) if next_cursor else None
+    return {"prev_url": prev_url, "next_url": next_url}
 
 # --- Admin Authentication ---
 def login_required(f):
@@ -72,37 +109,30 @@ def user_auth_status():
 @app.route('/admin')
 @login_required
 def admin_dashboard():
+    # Totals, counts and top lists are computed (and cached) by the API
     try:
-        bookings = requests.get(f"{API_URL}/bookings/").json()
-        destinations = requests.get(f"{API_URL}/destinations/").json()
-        umkm_list = requests.get(f"{API_URL}/umkm/").json()
+        stats = api.get_json("/stats/dashboard")
     except:
-        bookings, destinations, umkm_list = [], [], []
-    
-    total_visitors = sum(d.get('current_visitors', 0) for d in destinations)
-    active_bookings = sum(1 for b in bookings if b.get('status') in ['pending', 'confirmed'])
+        stats = {}
     
     return render_template('admin_dashboard.html',
         title="Dashboard",
         subtitle="Overview platform pariwisata Pulau Harapan",
-        total_visitors=total_visitors,
-        active_bookings=active_bookings,
-        total_destinations=len(destinations),
-        total_umkm=len(umkm_list),
-        destinations=destinations[:4],
-        recent_bookings=bookings[:5],
-        top_umkm=sorted(umkm_list, key=lambda x: x.get('rating', 0), reverse=True)[:5]
+        total_visitors=stats.get('total_visitors', 0),
+        active_bookings=stats.get('active_bookings', 0),
+        total_destinations=stats.get('total_destinations', 0),
+        total_umkm=stats.get('total_umkm', 0),
+        destinations=stats.get('destinations', []),
+        recent_bookings=stats.get('recent_bookings', []),
+        top_umkm=stats.get('top_umkm', [])
     )
 
 # --- Destinations ---
 @app.route('/admin/destinations')
 @login_required
 def admin_destinations():
-    try:
-        destinations = requests.get(f"{API_URL}/destinations/").json()
-        facilities = requests.get(f"{API_URL}/facilities/").json()
-    except:
-        destinations, facilities = [], []
+    data = api.fetch_json({"destinations": "/destinations/", "facilities": "/facilities/"})
+    destinations, facilities = data["destinations"], data["facilities"]
     
     return render_template('admin_destinations.html',
         title="Destinasi",
@@ -115,9 +145,9 @@ def admin_destinations():
 @login_required
 def toggle_destination_status(destination_id):
     try:
-        dest = requests.get(f"{API_URL}/destinations/{destination_id}").json()
+        dest = api.get(f"/destinations/{destination_id}").json()
         new_status = 'closed' if dest.get('status') == 'open' else 'open'
-        requests.put(f"{API_URL}/destinations/{destination_id}", json={"status": new_status})
+        api.put(f"/destinations/{destination_id}", json={"status": new_status})
     except Exception as e:
         flash(f"Error: {e}", "error")
     return redirect(url_for('admin_destinations'))
@@ -126,7 +156,7 @@ def toggle_destination_status(destination_id):
 @login_required
 def delete_destination(destination_id):
     try:
-        requests.delete(f"{API_URL}/destinations/{destination_id}")
+        api.delete(f"/destinations/{destination_id}")
     except:
         flash("Error deleting destination", "error")
     return redirect(url_for('admin_destinations'))
@@ -134,15 +164,13 @@ def delete_destination(destination_id):
 # --- Public Destination Detail ---
 @app.route('/destination/<int:destination_id>')
 def destination_detail(destination_id):
-    try:
-        destination = requests.get(f"{API_URL}/destinations/{destination_id}").json()
-        facilities = requests.get(f"{API_URL}/facilities/destination/{destination_id}").json()
-        all_destinations = requests.get(f"{API_URL}/destinations/").json()
-        related = [d for d in all_destinations if d['id'] != destination_id][:3]
-    except:
-        destination = {}
-        facilities = []
-        related = []
+    data = api.fetch_json({
+        "destination": f"/destinations/{destination_id}",
+        "facilities": f"/facilities/destination/{destination_id}",
+        "all_destinations": "/destinations/",
+    }, defaults={"destination": {}})
+    destination, facilities = data["destination"], data["facilities"]
+    related = [d for d in data["all_destinations"] if d['id'] != destination_id][:3]
     
     return render_template('destination_detail.html',
         destination=destination,
@@ -155,7 +183,7 @@ def destination_detail(destination_id):
 @login_required
 def admin_bookings():
     try:
-        bookings = requests.get(f"{API_URL}/bookings/").json()
+        bookings = api.get("/bookings/").json()
     except:
         bookings = []
     
@@ -177,7 +205,7 @@ def admin_bookings():
 def update_booking_status(booking_id):
     new_status = request.form.get('status')
     try:
-        requests.put(f"{API_URL}/bookings/{booking_id}/status", json={"status": new_status})
+        api.put(f"/bookings/{booking_id}/status", json={"status": new_status})
     except:
         flash("Error updating status", "error")
     return redirect(url_for('admin_bookings'))
@@ -187,7 +215,7 @@ def update_booking_status(booking_id):
 @login_required
 def admin_umkm():
     try:
-        umkm_list = requests.get(f"{API_URL}/umkm/").json()
+        umkm_list = api.get_json("/umkm/")
     except:
         umkm_list = []
     
@@ -201,32 +229,28 @@ def admin_umkm():
 @app.route('/admin/analytics')
 @login_required
 def admin_analytics():
-    try:
-        bookings = requests.get(f"{API_URL}/bookings/").json()
-        destinations = requests.get(f"{API_URL}/destinations/").json()
-    except:
-        bookings, destinations = [], []
-    
-    total_visitors = sum(d.get('current_visitors', 0) for d in destinations)
-    total_revenue = sum(b.get('total_price', 500000) for b in bookings if b.get('status') == 'confirmed')
+    # Revenue comes from the visitor_stats rollups, never from the raw bookings
+    data = api.fetch_json(
+        {"dashboard": "/stats/dashboard", "visitors": "/stats/visitors?granularity=month"},
+        defaults={"dashboard": {}, "visitors": {}},
+    )
     
     return render_template('admin_analytics.html',
         title="Analytics",
         subtitle="Insight dan statistik platform",
-        total_visitors=total_visitors,
-        total_revenue=total_revenue
+        total_visitors=data["dashboard"].get('total_visitors', 0),
+        total_revenue=data["visitors"].get('totals', {}).get('revenue', 0)
     )
 
 # --- User Management ---
 @app.route('/admin/users')
 @login_required
 def admin_users():
-    try:
-        users = requests.get(f"{API_URL}/users/").json()
-        roles = requests.get(f"{API_URL}/users/roles").json()
-        stats = requests.get(f"{API_URL}/users/stats/overview").json()
-    except:
-        users, roles, stats = [], {}, {"total":0, "active":0, "inactive":0, "by_role":{}}
+    data = api.fetch_json(
+        {"users": "/users/", "roles": "/users/roles", "stats": "/users/stats/overview"},
+        defaults={"roles": {}, "stats": {"total": 0, "active": 0, "inactive": 0, "by_role": {}}},
+    )
+    users, roles, stats = data["users"], data["roles"], data["stats"]
     
     return render_template('admin_users.html',
         title="Manajemen Pengguna",
@@ -250,7 +274,7 @@ def create_user():
         "profile_image": request.form.get('profile_image')
     }
     try:
-        requests.post(f"{API_URL}/users/register", json=data)
+        api.post("/users/register", json=data)
         flash("User berhasil dibuat!", "success")
     except:
         flash("Error creating user", "error")
@@ -274,9 +298,9 @@ def update_user_frontend(user_id):
     
     try:
         # Update profile (includes password, name, phone, etc)
-        requests.put(f"{API_URL}/users/{user_id}", json=profile_data)
+        api.put(f"/users/{user_id}", json=profile_data)
         # Update role (includes role and assigned_area)
-        requests.put(f"{API_URL}/users/{user_id}/role", json=role_data)
+        api.put(f"/users/{user_id}/role", json=role_data)
         flash("User berhasil diupdate!", "success")
     except:
         flash("Error updating user", "error")
@@ -286,7 +310,7 @@ def update_user_frontend(user_id):
 @login_required
 def toggle_user_active(user_id):
     try:
-        requests.put(f"{API_URL}/users/{user_id}/toggle-active")
+        api.put(f"/users/{user_id}/toggle-active")
         flash("Status user diupdate!", "success")
     except:
         flash("Error updating status", "error")
@@ -296,7 +320,7 @@ def toggle_user_active(user_id):
 @login_required
 def get_user_api(user_id):
     try:
-        user = requests.get(f"{API_URL}/users/{user_id}").json()
+        user = api.get(f"/users/{user_id}").json()
         return jsonify(user)
     except:
         return jsonify({}), 404
@@ -305,22 +329,22 @@ def get_user_api(user_id):
 @app.route('/admin/cms')
 @login_required
 def admin_cms():
-    try:
-        contents = requests.get(f"{API_URL}/contents/").json()
-    except:
-        contents = []
-    
-    published = sum(1 for c in contents if c.get('is_published'))
-    draft = len(contents) - published
-    pages = sum(1 for c in contents if c.get('type') == 'page')
+    data = api.fetch_json(
+        {"contents": f"/contents/?{page_params()}", "stats": "/contents/stats"},
+        defaults={"stats": {}},
+        paged=("contents",),
+    )
+    stats = data["stats"]
     
     return render_template('admin_cms.html',
         title="CMS Management",
         subtitle="Kelola semua konten website",
-        contents=contents,
-        published_count=published,
-        draft_count=draft,
-        page_count=pages
+        contents=data["contents"]["items"],
+        pager=pager(data["contents"]["next_cursor"]),
+        total_count=stats.get('total', 0),
+        published_count=stats.get('published', 0),
+        draft_count=stats.get('draft', 0),
+        page_count=stats.get('pages', 0)
     )
 
 @app.route('/admin/cms/create', methods=['POST'])
@@ -334,7 +358,7 @@ def create_content():
         "is_published": request.form.get('is_active') == 'true'
     }
     try:
-        requests.post(f"{API_URL}/contents/", json=data)
+        api.post("/contents/", json=data)
         flash("Konten berhasil ditambahkan!", "success")
     except:
         flash("Error creating content", "error")
@@ -351,7 +375,7 @@ def update_content(content_id):
         "is_published": request.form.get('is_active') == 'true'
     }
     try:
-        requests.put(f"{API_URL}/contents/{content_id}", json=data)
+        api.put(f"/contents/{content_id}", json=data)
         flash("Konten berhasil diupdate!", "success")
     except:
         flash("Error updating content", "error")
@@ -361,7 +385,7 @@ def update_content(content_id):
 @login_required
 def delete_content(content_id):
     try:
-        requests.delete(f"{API_URL}/contents/{content_id}")
+        api.delete(f"/contents/{content_id}")
         flash("Konten berhasil dihapus!", "success")
     except:
         flash("Error deleting content", "error")
@@ -370,7 +394,7 @@ def delete_content(content_id):
 @app.route('/api/contents/<int:content_id>')
 def get_content_api(content_id):
     try:
-        content = requests.get(f"{API_URL}/contents/{content_id}").json()
+        content = api.get(f"/contents/{content_id}").json()
         return jsonify(content)
     except:
         return jsonify({}), 404
@@ -379,37 +403,35 @@ def get_content_api(content_id):
 @app.route('/admin/content')
 @login_required
 def admin_content():
-    try:
-        contents = requests.get(f"{API_URL}/contents/").json()
-    except:
-        contents = []
+    data = api.fetch_json({"contents": f"/contents/?{page_params()}"}, paged=("contents",))
     
     return render_template('admin_content.html',
         title="Konten & Promo",
         subtitle="Kelola konten digital",
-        contents=contents
+        contents=data["contents"]["items"],
+        pager=pager(data["contents"]["next_cursor"])
     )
 
 # --- Feedback ---
 @app.route('/admin/feedback')
 @login_required
 def admin_feedback():
-    try:
-        feedback_list = requests.get(f"{API_URL}/feedback/").json()
-    except:
-        feedback_list = []
-    
-    emergency_count = sum(1 for f in feedback_list if f.get('type') == 'emergency')
-    pending_count = sum(1 for f in feedback_list if f.get('status') == 'open')
-    resolved_count = sum(1 for f in feedback_list if f.get('status') == 'resolved')
+    data = api.fetch_json(
+        {"feedback": f"/feedback/?{page_params()}", "stats": "/feedback/stats"},
+        defaults={"stats": {}},
+        paged=("feedback",),
+    )
+    stats = data["stats"]
     
     return render_template('admin_feedback.html',
         title="Feedback",
         subtitle="Monitor laporan dan feedback pengunjung",
-        feedback_list=feedback_list,
-        emergency_count=emergency_count,
-        pending_count=pending_count,
-        resolved_count=resolved_count
+        feedback_list=data["feedback"]["items"],
+        pager=pager(data["feedback"]["next_cursor"]),
+        total_count=stats.get('total', 0),
+        emergency_count=stats.get('emergency', 0),
+        pending_count=stats.get('open', 0),
+        resolved_count=stats.get('resolved', 0)
     )
 
 @app.route('/admin/feedback/<int:feedback_id>/update', methods=['POST'])
@@ -417,7 +439,7 @@ def admin_feedback():
 def update_feedback_status(feedback_id):
     new_status = request.form.get('status')
     try:
-        requests.put(f"{API_URL}/feedback/{feedback_id}", json={"status": new_status})
+        api.put(f"/feedback/{feedback_id}", json={"status": new_status})
     except:
         flash("Error updating feedback", "error")
     return redirect(url_for('admin_feedback'))
@@ -432,7 +454,7 @@ def emergency_page():
 @login_required
 def admin_events():
     try:
-        events = requests.get(f"{API_URL}/events/").json()
+        events = api.get("/events/").json()
     except:
         events = []
     
@@ -446,24 +468,29 @@ def admin_events():
 @app.route('/admin/rentals')
 @login_required
 def admin_rentals():
-    try:
-        equipment_list = requests.get(f"{API_URL}/rentals/equipment").json()
-        rentals = requests.get(f"{API_URL}/rentals/").json()
-    except:
-        equipment_list, rentals = [], []
-    
-    available_count = sum(1 for eq in equipment_list if eq.get('available', 0) > 0)
-    rented_count = sum(1 for r in rentals if r.get('status') == 'active')
-    total_revenue = sum(r.get('total_price', 0) for r in rentals if r.get('status') in ['active', 'returned'])
+    data = api.fetch_json(
+        {
+            # The card grid shows no descriptions, so don't fetch them
+            "equipment": "/rentals/equipment?fields=name,category,image_url,stock,available,price_per_day&"
+                         + page_params("equipment"),
+            "rentals": f"/rentals/?{page_params()}",
+            "stats": "/rentals/stats",
+        },
+        defaults={"stats": {}},
+        paged=("equipment", "rentals"),
+    )
+    stats = data["stats"]
     
     return render_template('admin_rentals.html',
         title="Sewa Alat Camping",
         subtitle="Kelola penyewaan peralatan camping",
-        equipment_list=equipment_list,
-        rentals=rentals,
-        available_count=available_count,
-        rented_count=rented_count,
-        total_revenue=total_revenue
+        equipment_list=data["equipment"]["items"],
+        equipment_pager=pager(data["equipment"]["next_cursor"], "equipment"),
+        rentals=data["rentals"]["items"],
+        pager=pager(data["rentals"]["next_cursor"]),
+        available_count=stats.get('available_equipment', 0),
+        rented_count=stats.get('active_rentals', 0),
+        total_revenue=stats.get('revenue', 0)
     )
 
 @app.route('/admin/rental/<int:rental_id>/update', methods=['POST'])
@@ -471,7 +498,7 @@ def admin_rentals():
 def update_rental_status(rental_id):
     new_status = request.form.get('status')
     try:
-        requests.put(f"{API_URL}/rentals/{rental_id}/status?status={new_status}")
+        api.put(f"/rentals/{rental_id}/status?status={new_status}")
     except:
         flash("Error updating rental", "error")
     return redirect(url_for('admin_rentals'))
@@ -479,8 +506,9 @@ def update_rental_status(rental_id):
 # --- Public Rental Page ---
 @app.route('/rental')
 def rental_page():
+    # Every available item, in id order, however many pages the API splits them into
     try:
-        equipment = requests.get(f"{API_URL}/rentals/equipment/available").json()
+        equipment = api.get_all("/rentals/equipment/available")
     except:
         equipment = []
     return render_template('rental.html', equipment=equipment)
@@ -489,24 +517,29 @@ def rental_page():
 @app.route('/admin/guides')
 @login_required
 def admin_guides():
-    try:
-        guides = requests.get(f"{API_URL}/guides/").json()
-        bookings = requests.get(f"{API_URL}/guides/bookings/").json()
-    except:
-        guides, bookings = [], []
-    
-    available_count = sum(1 for g in guides if g.get('is_available'))
-    active_bookings = sum(1 for b in bookings if b.get('status') in ['pending', 'confirmed'])
-    total_revenue = sum(b.get('total_price', 0) for b in bookings if b.get('status') in ['confirmed', 'completed'])
+    data = api.fetch_json(
+        {
+            "guides": "/guides/?fields=name,specialty,languages,rating,price_per_day,image_url,is_available&"
+                      + page_params("guides"),
+            "bookings": f"/guides/bookings/?{page_params()}",
+            "stats": "/guides/stats",
+        },
+        defaults={"stats": {}},
+        paged=("guides", "bookings"),
+    )
+    stats = data["stats"]
     
     return render_template('admin_guides.html',
         title="Tour Guide",
         subtitle="Kelola pemandu wisata",
-        guides=guides,
-        bookings=bookings,
-        available_count=available_count,
-        active_bookings=active_bookings,
-        total_revenue=total_revenue
+        guides=data["guides"]["items"],
+        guides_pager=pager(data["guides"]["next_cursor"], "guides"),
+        bookings=data["bookings"]["items"],
+        pager=pager(data["bookings"]["next_cursor"]),
+        total_guides=stats.get('total_guides', 0),
+        available_count=stats.get('available_guides', 0),
+        active_bookings=stats.get('active_bookings', 0),
+        total_revenue=stats.get('revenue', 0)
     )
 
 @app.route('/admin/guide/<int:booking_id>/update', methods=['POST'])
@@ -514,7 +547,7 @@ def admin_guides():
 def update_guide_booking_status(booking_id):
     new_status = request.form.get('status')
     try:
-        requests.put(f"{API_URL}/guides/bookings/{booking_id}/status?status={new_status}")
+        api.put(f"/guides/bookings/{booking_id}/status?status={new_status}")
     except:
         flash("Error updating booking", "error")
     return redirect(url_for('admin_guides'))
@@ -522,8 +555,9 @@ def update_guide_booking_status(booking_id):
 # --- Public Guides Page ---
 @app.route('/guides')
 def guides_page():
+    # Every available guide, in id order, however many pages the API splits them into
     try:
-        guides = requests.get(f"{API_URL}/guides/available").json()
+        guides = api.get_all("/guides/available")
     except:
         guides = []
     return render_template('guides.html', guides=guides)
@@ -541,8 +575,8 @@ def admin_gate():
 @app.route('/ticket/<int:booking_id>')
 def view_ticket(booking_id):
     try:
-        booking_res = requests.get(f"{API_URL}/bookings/{booking_id}")
-        ticket_res = requests.get(f"{API_URL}/tickets/booking/{booking_id}")
+        booking_res = api.get(f"/bookings/{booking_id}")
+        ticket_res = api.get(f"/tickets/booking/{booking_id}")
         
         if booking_res.status_code != 200:
             return "Booking not found", 404
@@ -551,7 +585,7 @@ def view_ticket(booking_id):
         
         if ticket_res.status_code != 200:
             # Create ticket if not exists
-            ticket_create = requests.post(f"{API_URL}/tickets/", json={"booking_id": booking_id})
+            ticket_create = api.post("/tickets/", json={"booking_id": booking_id})
             ticket = ticket_create.json()
         else:
             ticket = ticket_res.json()
@@ -559,7 +593,7 @@ def view_ticket(booking_id):
         # Get package info
         package = None
         if booking.get('package_id'):
-            pkg_res = requests.get(f"{API_URL}/packages/{booking['package_id']}")
+            pkg_res = api.get(f"/packages/{booking['package_id']}")
             if pkg_res.status_code == 200:
                 package = pkg_res.json()
         
@@ -570,30 +604,24 @@ def view_ticket(booking_id):
 # --- Public Routes ---
 @app.route('/')
 def home():
+    # One snapshot of the public catalog; package features arrive as lists
     try:
-        destinations = requests.get(f"{API_URL}/destinations/").json()
-        packages = requests.get(f"{API_URL}/packages/").json()
-        contents = requests.get(f"{API_URL}/contents/").json()
-        umkm_list = requests.get(f"{API_URL}/umkm/").json()
+        catalog = api.get_json("/catalog/")
     except:
-        destinations, packages, contents, umkm_list = [], [], [], []
-
-    for p in packages:
-        if 'features' in p and isinstance(p['features'], str):
-            p['features'] = p['features'].split(',')
+        catalog = {}
 
     return render_template('index.html',
-        destinations=destinations,
-        packages=packages,
-        contents=contents,
-        umkm_list=umkm_list[:4]
+        destinations=catalog.get('destinations', []),
+        packages=catalog.get('packages', []),
+        contents=catalog.get('contents', []),
+        umkm_list=catalog.get('umkm', [])[:4]
     )
 
 # --- All Destinations Page ---
 @app.route('/destinations')
 def all_destinations():
     try:
-        destinations = requests.get(f"{API_URL}/destinations/").json()
+        destinations = api.get_json("/destinations/")
     except:
         destinations = []
     
@@ -602,7 +630,7 @@ def all_destinations():
 @app.route('/package/<int:package_id>')
 def package_details(package_id):
     try:
-        response = requests.get(f"{API_URL}/packages/{package_id}")
+        response = api.get(f"/packages/{package_id}")
         if response.status_code == 200:
             package = response.json()
             if package.get('features'):
@@ -616,7 +644,7 @@ def package_details(package_id):
 @app.route('/marketplace')
 def marketplace():
     try:
-        umkm_list = requests.get(f"{API_URL}/umkm/").json()
+        umkm_list = api.get_json("/umkm/")
     except:
         umkm_list = []
     return render_template('marketplace.html', umkm_list=umkm_list)
@@ -624,12 +652,12 @@ def marketplace():
 @app.route('/umkm/<int:umkm_id>')
 def umkm_detail(umkm_id):
     try:
-        umkm_res = requests.get(f"{API_URL}/umkm/{umkm_id}")
+        umkm_res = api.get(f"/umkm/{umkm_id}")
         if umkm_res.status_code != 200:
             return "UMKM not found", 404
         
         umkm = umkm_res.json()
-        products = requests.get(f"{API_URL}/products/umkm/{umkm_id}").json()
+        products = api.get_all(f"/products/umkm/{umkm_id}")
         
         return render_template('umkm_detail.html', umkm=umkm, products=products)
     except Exception as e:
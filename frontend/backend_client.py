@@ -0,0 +1,240 @@
+"""Shared HTTP client for the backend API.
+
+One ``requests.Session`` for the whole Flask process, so calls reuse keep-alive
+connections instead of opening a TCP connection each time. Every call has a
+connect and a read timeout, so a slow backend can't hold a Flask worker forever.
+GETs are retried a couple of times on connection errors and 502/503/504;
+writes are not retried. Each call's latency is logged, at INFO above
+``API_SLOW_MS``.
+
+``fetch_json`` runs a view's independent GETs concurrently, so a page costs
+about its slowest call instead of the sum, and one failing call leaves the
+others' results intact.
+
+With ``API_MODE=embedded`` the frontend runs the API inside its own process
+instead (``EmbeddedClient``): catalog and list GETs call the routers' read
+functions directly (see ``backend.services``), everything else goes through
+the ASGI app in-process with ``httpx.ASGITransport``. No loopback socket, no
+HTTP parsing on either side.
+
+Settings: ``API_MODE`` (``http`` or ``embedded``), ``API_URL``,
+``API_CONNECT_TIMEOUT`` / ``API_READ_TIMEOUT`` (seconds), ``API_GET_RETRIES``,
+``API_POOL_SIZE``, ``API_SLOW_MS`` and ``API_FANOUT_WORKERS``.
+"""
+import asyncio
+import atexit
+import contextlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+API_MODE = os.environ.get("API_MODE", "http")
+API_URL = os.environ.get("API_URL", "http://localhost:8000")
+CONNECT_TIMEOUT = float(os.environ.get("API_CONNECT_TIMEOUT", 2))
+READ_TIMEOUT = float(os.environ.get("API_READ_TIMEOUT", 10))
+GET_RETRIES = int(os.environ.get("API_GET_RETRIES", 2))
+POOL_SIZE = int(os.environ.get("API_POOL_SIZE", 20))
+SLOW_MS = float(os.environ.get("API_SLOW_MS", 500))
+FANOUT_WORKERS = int(os.environ.get("API_FANOUT_WORKERS", 16))
+
+_fanout = ThreadPoolExecutor(max_workers=FANOUT_WORKERS, thread_name_prefix="api-fanout")
+
+class BackendClient:
+    def __init__(self, base_url=API_URL, timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+                 retries=GET_RETRIES, pool_size=POOL_SIZE):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._etags = {}  # url -> (etag, body)
+
+    def request(self, method, path, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        started = time.perf_counter()
+        status = "error"
+        try:
+            response = self.session.request(method, self.base_url + path, **kwargs)
+            status = response.status_code
+            return response
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            level = logging.INFO if elapsed_ms >= SLOW_MS else logging.DEBUG
+            logger.log(level, "%s %s -> %s in %.1f ms", method, path, status, elapsed_ms)
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def get_json(self, path):
+        """GET ``path`` as JSON, revalidating the last body with If-None-Match.
+
+        Catalog lists carry ETags, so an unchanged list costs the backend a 304
+        and no query.
+        """
+        cached = self._etags.get(path)
+        response = self.get(path, headers={"If-None-Match": cached[0]} if cached else {})
+        if response.status_code == 304 and cached:
+            return json.loads(cached[1])  # fresh copy: views modify what they get
+        response.raise_for_status()
+        if "ETag" in response.headers:
+            self._etags[path] = (response.headers["ETag"], response.content)
+        return response.json()
+
+    def get_page(self, path):
+        """GET one page of a cursor-paged list: ``{"items": rows, "next_cursor": cursor or None}``."""
+        response = self.get(path)
+        response.raise_for_status()
+        return {"items": response.json(), "next_cursor": response.headers.get("X-Next-Cursor")}
+
+    def get_all(self, path):
+        """Every row of a cursor-paged list, following ``X-Next-Cursor`` one page at a time.
+
+        For the public pages that list a whole (small) catalog table; admin
+        tables show one page with a pager instead.
+        """
+        rows, cursor = [], None
+        separator = "&" if "?" in path else "?"
+        while True:
+            page = self.get_page(path + (separator + urlencode({"cursor": cursor}) if cursor else ""))
+            rows += page["items"]
+            cursor = page["next_cursor"]
+            if not cursor:
+                return rows
+
+    def fetch_json(self, paths, defaults=None, paged=()):
+        """GET every ``{name: path}`` concurrently and return ``{name: json}``.
+
+        Names in ``paged`` are fetched with ``get_page`` instead, so their
+        result also carries the list's next-page cursor. A call that fails
+        (connection error, timeout, error status, bad JSON) is logged and
+        replaced by ``defaults[name]`` (``[]``, or an empty page, when not given).
+        """
+        defaults = {**{name: {"items": [], "next_cursor": None} for name in paged}, **(defaults or {})}
+        futures = {name: _fanout.submit(self.get_page if name in paged else self.get_json, path)
+                   for name, path in paths.items()}
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except (requests.RequestException, ValueError) as exc:
+                logger.warning("GET %s failed: %s", paths[name], exc)
+                results[name] = defaults.get(name, [])
+        return results
+
+class EmbeddedResponse:
+    """The parts of ``requests.Response`` the views use, for in-process calls."""
+
+    def __init__(self, status_code, content, headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+
+class EmbeddedClient(BackendClient):
+    """Calls the API inside this process; see the module docstring.
+
+    The app gets its own event loop thread: its lifespan runs there, and the
+    views' calls (from Flask and fan-out threads) are scheduled onto it.
+    """
+
+    def __init__(self):  # pylint: disable=super-init-not-called
+        self._etags = {}
+        self._services = None
+        self._asgi = None
+        self._stack = None
+        self._loop = None
+        self._start_lock = threading.Lock()
+
+    def _start(self):
+        # Imported on first use so HTTP mode never loads the backend
+        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        import httpx  # pylint: disable=import-outside-toplevel
+        from backend import services  # pylint: disable=import-outside-toplevel
+        from backend.main import app  # pylint: disable=import-outside-toplevel
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="embedded-api", daemon=True).start()
+        stack = contextlib.AsyncExitStack()
+        # Entering runs the lifespan: readiness check, cache invalidation watcher
+        self._run(stack.enter_async_context(app.router.lifespan_context(app)))
+        # In-process bodies need no gzip round trip
+        self._asgi = self._run(stack.enter_async_context(httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app, raise_app_exceptions=False),
+            base_url="http://embedded", headers={"Accept-Encoding": "identity"})))
+        self._stack, self._services = stack, services
+        atexit.register(self.close)
+
+    def close(self):
+        """Run the app's shutdown and stop its event loop."""
+        with self._start_lock:
+            if self._loop is None:
+                return
+            self._run(self._stack.aclose())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+
+    def _run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    async def _request(self, method, path, **kwargs):
+        result = await self._services.call(path) if method == "GET" else None
+        if result is not None:
+            return EmbeddedResponse(*result)
+        asgi_response = await self._asgi.request(method, path, **kwargs)
+        return EmbeddedResponse(asgi_response.status_code, asgi_response.content, asgi_response.headers)
+
+    def request(self, method, path, **kwargs):
+        with self._start_lock:  # fan-out threads may all make the first call
+            if self._loop is None:
+                self._start()
+        kwargs.pop("timeout", None)
+        started = time.perf_counter()
+        status = "error"
+        try:
+            response = self._run(self._request(method, path, **kwargs))
+            status = response.status_code
+            return response
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            level = logging.INFO if elapsed_ms >= SLOW_MS else logging.DEBUG
+            logger.log(level, "%s %s -> %s in %.1f ms (embedded)", method, path, status, elapsed_ms)
+
+def make_client(mode=API_MODE):
+    if mode == "embedded":
+        return EmbeddedClient()
+    return BackendClient()
+
+api = make_client()
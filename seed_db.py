@@ -4,12 +4,13 @@ import hashlib
 from datetime import datetime, timedelta
 from backend.database import SessionLocal, engine, Base
 from backend import models
+from backend.migrations import migrate
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 # Create all tables
 Base.metadata.drop_all(bind=engine)
-Base.metadata.create_all(bind=engine)
+migrate(engine)
 
 db = SessionLocal()
 
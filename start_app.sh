@@ -3,6 +3,9 @@
 # Activate virtual environment
 source venv/bin/activate
 
+# Create / migrate the database schema
+python -m backend.migrations
+
 # Start Backend
 echo "Starting Backend on port 8000..."
 uvicorn backend.main:app --port 8000 &
@@ -0,0 +1,65 @@
+"""Process helpers shared by the tests and the benchmark scripts.
+
+Create a throwaway, migrated SQLite file and run the API under uvicorn in a
+subprocess, as deployments do. Tests that need more than one worker process
+(see ``test_change_versions.py``) use them, and ``benchmarks/common.py``
+re-exports them for the benchmarks.
+"""
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+import requests
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+def temp_database():
+    """Return a path for a throwaway SQLite file."""
+    return os.path.join(tempfile.mkdtemp(prefix="ph-db-"), "app.db")
+
+def init_database(env):
+    """Create and migrate the schema, as deployments do before starting the API."""
+    subprocess.run([sys.executable, "-m", "backend.migrations"], cwd=PROJECT_ROOT, check=True,
+                   env={**os.environ, "PYTHONPATH": PROJECT_ROOT, **env})
+
+@contextmanager
+def run_server_process(env=None, workers=1, app="backend.main:app", ready_path="/"):
+    """Start uvicorn in a subprocess and yield ``(process, base_url)`` once it answers."""
+    port = free_port()
+    proc_env = {**os.environ, "PYTHONPATH": PROJECT_ROOT, **(env or {})}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", app, "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=PROJECT_ROOT, env=proc_env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.time() + 30
+        while True:
+            try:
+                if requests.get(base_url + ready_path, timeout=1).status_code < 500:
+                    break
+            except requests.RequestException:
+                pass
+            if time.time() > deadline or proc.poll() is not None:
+                raise RuntimeError("server did not start")
+            time.sleep(0.1)
+        yield proc, base_url
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+@contextmanager
+def run_server(env=None, workers=1, app="backend.main:app", ready_path="/"):
+    """Start uvicorn in a subprocess and yield its base URL once it answers."""
+    with run_server_process(env, workers, app, ready_path) as (_, base_url):
+        yield base_url
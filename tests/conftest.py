@@ -1,32 +1,32 @@
 import pytest
 import os
 import sys
+import tempfile
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
 
 # Add project root to sys.path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from backend.main import app
-from backend.database import Base, get_db
-
-# Use an in-memory SQLite database for testing
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# Use a throwaway SQLite file for testing. It has to be set before the backend is
+# imported so the sync, read-only and async engines all point at it.
+os.environ["DATABASE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="ph-test-"), "test.db")
+# One process here: local invalidation covers every write, so don't poll change_versions.
+os.environ["CHANGE_POLL_INTERVAL"] = "0"
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+from backend.main import app
+from backend.cache import catalog_cache
+from backend.database import Base, engine, SessionLocal
+from backend.migrations import migrate
 
 @pytest.fixture(scope="function")
 def db_session():
     """Create a fresh database for each test."""
-    Base.metadata.create_all(bind=engine)
-    db = TestingSessionLocal()
+    migrate(engine)
+    catalog_cache.clear()
+    db = SessionLocal()
     try:
         yield db
     finally:
@@ -36,13 +36,42 @@ def db_session():
 @pytest.fixture(scope="function")
 def client(db_session):
     """Create a test client that uses the test database."""
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
-    
-    app.dependency_overrides[get_db] = override_get_db
     with TestClient(app) as test_client:
         yield test_client
-    app.dependency_overrides.clear()
+
+@pytest.fixture(scope="session")
+def legacy_engine():
+    """``legacy_engine(directory)``: a database there, created before the indexes existed in the models."""
+    def make(directory):
+        engine = create_engine(f"sqlite:///{directory / 'legacy.db'}")
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            for (name,) in conn.execute(text(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+            )).all():
+                conn.execute(text(f"DROP INDEX {name}"))
+        return engine
+    return make
+
+@pytest.fixture
+def max_queries():
+    """``with max_queries(2): client.get(...)`` fails if the block runs more SQL statements.
+
+    Counts statements on every engine (sync, read-only, aiosqlite, writer), so
+    an endpoint that lazy-loads a relationship per row (N+1) trips it.
+    """
+    @contextmanager
+    def guard(limit):
+        statements = []
+
+        def record(_conn, _cursor, statement, *_):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(Engine, "before_cursor_execute", record)
+        assert len(statements) <= limit, f"{len(statements)} statements, at most {limit} allowed:\n" + \
+            "\n".join(statements)
+    return guard
@@ -0,0 +1,82 @@
+from backend.cache import CatalogCache, catalog_cache, sync_change_versions
+
+def test_repeat_reads_hit_cache(client):
+    client.post("/packages/", json={"name": "Snorkeling", "price": 150000, "features": "Boat"})
+    before = client.get("/cache/stats").json()  # warm_up's own misses are already counted
+    first = client.get("/packages/").json()
+    assert client.get("/packages/").json() == first
+
+    stats = client.get("/cache/stats").json()
+    assert stats["hits"] - before["hits"] == 1 and stats["misses"] - before["misses"] == 1
+
+def test_writes_invalidate_immediately(client):
+    created = client.post("/destinations/", json={"name": "Pulau Harapan", "description": "Dermaga"}).json()
+    assert client.get(f"/destinations/{created['id']}").json()["status"] == "open"
+
+    client.put(f"/destinations/{created['id']}", json={"status": "closed"})
+    assert client.get(f"/destinations/{created['id']}").json()["status"] == "closed"
+    assert client.get("/destinations/").json()[0]["status"] == "closed"
+
+    client.delete(f"/destinations/{created['id']}")
+    assert client.get(f"/destinations/{created['id']}").status_code == 404
+    assert client.get("/destinations/").json() == []
+
+def test_rental_invalidates_equipment_availability(client):
+    equipment = client.post("/rentals/equipment", json={
+        "name": "Tenda", "description": "2P", "category": "tent", "price_per_day": 50000, "stock": 1,
+    }).json()
+    assert len(client.get("/rentals/equipment/available").json()) == 1
+
+    client.post("/rentals/", json={
+        "equipment_id": equipment["id"], "customer_name": "Dewi", "customer_phone": "0812",
+        "rental_date": "2026-06-01", "return_date": "2026-06-02",
+    })
+    assert client.get("/rentals/equipment/available").json() == []
+
+def test_stale_read_is_not_stored():
+    cache = CatalogCache(maxsize=2, ttl=60)
+    version = cache.version("packages")
+    cache.invalidate("packages")  # a write committed while the read was running
+    cache.set("packages", "list", b"[]", version)
+    assert cache.get("packages", "list") is None
+
+def test_size_and_ttl_bounds():
+    cache = CatalogCache(maxsize=2, ttl=60)
+    for key in "abc":
+        cache.set("umkm", key, key.encode(), 0)
+    assert cache.get("umkm", "a") is None
+    assert cache.get("umkm", "c") == b"c"
+
+    expired = CatalogCache(ttl=-1)
+    expired.set("umkm", "a", b"a", 0)
+    assert expired.get("umkm", "a") is None
+
+def test_unchanged_collection_revalidates_with_304(client):
+    client.post("/umkm/", json={"name": "Kerupuk Ikan", "description": "Oleh-oleh", "category": "kuliner"})
+    first = client.get("/umkm/")
+    etag = first.headers["etag"]
+    lookups = client.get("/cache/stats").json()["misses"]
+
+    again = client.get("/umkm/", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["etag"] == etag
+    assert client.get("/cache/stats").json()["misses"] == lookups  # answered before any read
+
+    assert client.get("/umkm/?limit=1").headers["etag"] != etag
+
+    client.post("/umkm/", json={"name": "Batik", "description": "Kain", "category": "kerajinan"})
+    changed = client.get("/umkm/", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert len(changed.json()) == 2
+    assert changed.headers["etag"] != etag
+
+def test_etag_survives_restart(client):
+    client.post("/umkm/", json={"name": "Kerupuk Ikan", "description": "Oleh-oleh", "category": "kuliner"})
+    etag = client.get("/umkm/").headers["etag"]
+    catalog = client.get("/catalog/").json()["version"]
+
+    catalog_cache.clear()  # a restarted worker: nothing in memory
+    client.portal.call(sync_change_versions)  # what the lifespan does before serving
+    assert client.get("/umkm/", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/catalog/").json()["version"] == catalog
@@ -0,0 +1,27 @@
+def _seed(client):
+    client.post("/destinations/", json={"name": "Pulau Harapan", "description": "Dermaga"})
+    client.post("/packages/", json={"name": "Snorkeling", "price": 150000, "features": "Boat, Lunch,Guide"})
+    client.post("/contents/", json={"type": "news", "title": "Festival", "body": "Segera"})
+    client.post("/contents/", json={"type": "news", "title": "Draft", "body": "-", "is_published": False})
+    client.post("/umkm/", json={"name": "Kerupuk Ikan", "description": "Oleh-oleh", "category": "kuliner"})
+
+def test_catalog_snapshot(client):
+    _seed(client)
+    catalog = client.get("/catalog/").json()
+
+    assert [d["name"] for d in catalog["destinations"]] == ["Pulau Harapan"]
+    assert catalog["packages"][0]["features"] == ["Boat", "Lunch", "Guide"]
+    assert [c["title"] for c in catalog["contents"]] == ["Festival"]
+    assert [u["name"] for u in catalog["umkm"]] == ["Kerupuk Ikan"]
+
+def test_catalog_rebuilt_only_on_change(client):
+    _seed(client)
+    first = client.get("/catalog/")
+    assert client.get("/catalog/").json()["version"] == first.json()["version"]
+    assert client.get("/catalog/", headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+
+    client.post("/packages/", json={"name": "Island hopping", "price": 250000, "features": "Boat"})
+    changed = client.get("/catalog/", headers={"If-None-Match": first.headers["etag"]})
+    assert changed.status_code == 200
+    assert changed.json()["version"] != first.json()["version"]
+    assert len(changed.json()["packages"]) == 2
@@ -0,0 +1,43 @@
+import time
+
+import requests
+from sqlalchemy import text
+
+from backend.database import engine
+from tests._servers import init_database, run_server, temp_database
+
+def _versions():
+    with engine.connect() as conn:
+        return dict(conn.execute(text("SELECT table_name, version FROM change_versions")).all())
+
+def test_writes_bump_change_versions(client):
+    client.post("/packages/", json={"name": "Snorkeling", "price": 150000, "features": "Boat"})
+    assert _versions() == {"packages": 1}
+
+    package = client.get("/packages/").json()[0]
+    client.delete(f"/packages/{package['id']}")
+    assert _versions() == {"packages": 2}
+
+def _wait_for(predicate, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+def test_write_in_one_worker_invalidates_the_other():
+    # Long TTL: only change_versions can make worker A drop its cached list
+    env = {"DATABASE_PATH": temp_database(), "CATALOG_CACHE_TTL": "600", "CHANGE_POLL_INTERVAL": "0.1"}
+    init_database(env)
+    with run_server(env, ready_path="/ready") as worker_a, run_server(env, ready_path="/ready") as worker_b:
+        assert requests.get(f"{worker_a}/packages/").json() == []
+        etag = requests.get(f"{worker_a}/packages/").headers["etag"]
+        assert requests.get(f"{worker_b}/packages/").headers["etag"] == etag  # same version, same tag
+
+        requests.post(f"{worker_b}/packages/", json={"name": "Island hopping", "price": 250000, "features": "Boat"})
+
+        assert _wait_for(lambda: len(requests.get(f"{worker_a}/packages/").json()) == 1)
+        assert requests.get(f"{worker_a}/packages/", headers={"If-None-Match": etag}).status_code == 200
+        assert requests.get(f"{worker_a}/catalog/").json()["version"] == \
+            requests.get(f"{worker_b}/catalog/").json()["version"]
@@ -0,0 +1,46 @@
+from backend.change_log import compact_change_log
+from backend.database import engine
+
+def _destination(client, name):
+    return client.post("/destinations/", json={"name": name, "description": "-"}).json()
+
+def test_changes_since_version(client):
+    island = _destination(client, "Pulau Harapan")
+    package = client.post("/packages/", json={"name": "Snorkeling", "price": 150000, "features": "Boat"}).json()
+    start = client.get("/changes/").json()
+    assert [(c["table"], c["op"]) for c in start["changes"]] == [("destinations", "insert"), ("packages", "insert")]
+
+    client.put(f"/destinations/{island['id']}", json={"status": "closed"})
+    client.delete(f"/packages/{package['id']}")
+
+    delta = client.get("/changes/", params={"since": start["version"]}).json()
+    assert [(c["table"], c["id"], c["op"]) for c in delta["changes"]] == [
+        ("destinations", island["id"], "update"), ("packages", package["id"], "delete"),
+    ]
+    assert delta["changes"][0]["row"]["status"] == "closed"
+    assert delta["changes"][1]["row"] is None
+    assert client.get("/changes/", params={"since": delta["version"]}).json()["changes"] == []
+
+def test_changes_filter_and_paging(client):
+    for name in ("A", "B", "C"):
+        _destination(client, name)
+    client.post("/feedback/", json={"type": "review", "subject": "Bagus", "message": "Pantainya bersih"})
+
+    feedback = client.get("/changes/", params={"tables": "feedbacks"}).json()
+    assert [c["table"] for c in feedback["changes"]] == ["feedbacks"]
+    assert client.get("/changes/", params={"tables": "users"}).status_code == 400
+
+    page = client.get("/changes/", params={"limit": 2}).json()
+    assert page["has_more"] is True and len(page["changes"]) == 2
+    rest = client.get("/changes/", params={"since": page["version"]}).json()
+    assert rest["has_more"] is False and len(rest["changes"]) == 2
+
+def test_compaction_keeps_latest_change_per_row(client):
+    island = _destination(client, "Pulau Kelapa")
+    start = client.get("/changes/").json()["version"]
+    for visitors in (10, 20, 30):
+        client.put(f"/destinations/{island['id']}", json={"current_visitors": visitors})
+
+    assert compact_change_log(engine) == 3
+    [change] = client.get("/changes/", params={"since": start}).json()["changes"]
+    assert change["op"] == "update" and change["row"]["current_visitors"] == 30
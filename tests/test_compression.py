@@ -0,0 +1,76 @@
+import asyncio
+import gzip
+
+from backend.compression import CompressedCache, CompressionMiddleware, _accepts_gzip, compressed_cache
+
+GZIP = {"Accept-Encoding": "gzip"}
+
+def _destinations(client, count):
+    for i in range(count):
+        client.post("/destinations/", json={"name": f"Pulau {i}", "description": "Terumbu karang dan pasir putih " * 5})
+
+def test_collection_compressed_once_per_version(client):
+    compressed_cache.clear()
+    _destinations(client, 20)
+
+    first = client.get("/destinations/", headers=GZIP)
+    assert first.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in first.headers["vary"]
+    assert int(first.headers["content-length"]) < len(first.content)  # content is decoded by the client
+    second = client.get("/destinations/", headers=GZIP)
+    assert second.json() == first.json()
+    assert compressed_cache.stats()["hits"] == 1
+
+    # A write changes the ETag, so the new version is compressed again
+    client.post("/destinations/", json={"name": "Pulau Baru", "description": "-"})
+    third = client.get("/destinations/", headers=GZIP)
+    assert third.headers["etag"] != first.headers["etag"]
+    assert len(third.json()) == 21
+    assert compressed_cache.stats() == {"size": 2, "maxsize": compressed_cache.maxsize, "hits": 1, "misses": 2}
+
+def test_gzip_variant_has_its_own_etag(client):
+    _destinations(client, 20)
+
+    plain = client.get("/destinations/", headers={"Accept-Encoding": "identity"}).headers["etag"]
+    gzipped = client.get("/destinations/", headers=GZIP).headers["etag"]
+    assert gzipped == plain[:-1] + '-gz"'
+
+    revalidated = client.get("/destinations/", headers={**GZIP, "If-None-Match": gzipped})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == gzipped
+    revalidated = client.get("/destinations/", headers={"Accept-Encoding": "identity", "If-None-Match": plain})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == plain
+
+def test_accept_encoding_q_values():
+    def accepts(value):
+        return _accepts_gzip({"headers": [(b"accept-encoding", value.encode())]})
+
+    assert accepts("gzip") and accepts("br, gzip;q=0.5") and accepts("*") and accepts("deflate, *;q=0.1")
+    assert not accepts("gzip;q=0") and not accepts("gzip; q=0.0, *") and not accepts("identity")
+    assert not accepts("br, *;q=0") and not _accepts_gzip({"headers": []})
+
+def test_identity_small_and_streaming_responses_untouched(client):
+    _destinations(client, 20)
+
+    assert "content-encoding" not in client.get("/destinations/", headers={"Accept-Encoding": "identity"}).headers
+    assert "content-encoding" not in client.get("/ready", headers=GZIP).headers
+    assert "content-encoding" not in client.get("/export/bookings", headers=GZIP).headers
+
+def test_stale_body_under_same_etag_is_recompressed():
+    """Rows written outside the app change the body before the ETag; the CRC catches it."""
+    sent = []
+
+    async def app(scope, receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"etag", b'"v1"')]})
+        await send({"type": "http.response.body", "body": scope["state"]["body"]})
+
+    async def send(message):
+        sent.append(message)
+
+    middleware = CompressionMiddleware(app, minimum_size=10, cache=CompressedCache())
+    for body in (b"a" * 100, b"b" * 100):
+        scope = {"type": "http", "path": "/x", "query_string": b"", "headers": [(b"accept-encoding", b"gzip")],
+                 "state": {"body": body}}
+        asyncio.run(middleware(scope, None, send))
+        assert gzip.decompress(sent[-1]["body"]) == body
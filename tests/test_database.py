@@ -0,0 +1,35 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from backend.database import configure_engine, create_read_engine
+
+def _pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.execute(text(f"PRAGMA {name}")).scalar()
+
+def test_production_profile_applies_pragmas(tmp_path):
+    engine = configure_engine(create_engine(f"sqlite:///{tmp_path / 'prod.db'}"), profile="production")
+    assert _pragma(engine, "journal_mode").lower() == "wal"
+    assert _pragma(engine, "synchronous") == 1  # NORMAL
+    assert _pragma(engine, "busy_timeout") == 5000
+    assert _pragma(engine, "temp_store") == 2  # MEMORY
+
+def test_default_profile_leaves_sqlite_defaults(tmp_path):
+    engine = configure_engine(create_engine(f"sqlite:///{tmp_path / 'plain.db'}"), profile="default")
+    assert _pragma(engine, "journal_mode").lower() == "delete"
+    assert _pragma(engine, "synchronous") == 2  # FULL
+
+def test_read_engine_rejects_writes(tmp_path):
+    path = tmp_path / "ro.db"
+    writer = configure_engine(create_engine(f"sqlite:///{path}"), profile="production")
+    with writer.begin() as conn:
+        conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        conn.execute(text("INSERT INTO t VALUES (1)"))
+
+    reader = create_read_engine(path)
+    with reader.connect() as conn:
+        assert conn.execute(text("SELECT x FROM t")).scalar() == 1
+        assert conn.execute(text("PRAGMA query_only")).scalar() == 1
+        with pytest.raises(OperationalError):
+            conn.execute(text("INSERT INTO t VALUES (2)"))
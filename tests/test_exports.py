@@ -0,0 +1,49 @@
+import csv
+import datetime
+import io
+import json
+
+from backend import models
+from backend.routers import exports
+
+def _bookings(db_session):
+    for i, (day, status) in enumerate([("2026-02-01", "confirmed"), ("2026-01-15", "pending"),
+                                       ("2026-03-10", "confirmed"), ("2026-01-20", "cancelled")]):
+        booking = models.Booking(customer_name=f"Guest {i}", email=f"g{i}@example.com",
+                                 date=datetime.date.fromisoformat(day), status=status, num_visitors=2)
+        db_session.add(booking)
+        db_session.flush()
+        db_session.add(models.Ticket(booking_id=booking.id, qr_code=f"PH-{booking.id}", status="valid"))
+    db_session.commit()
+
+def test_export_ndjson_filtered(client, db_session, monkeypatch):
+    _bookings(db_session)
+    monkeypatch.setattr(exports, "EXPORT_BATCH", 1)  # one chunk per row
+
+    response = client.get("/export/bookings", params={"date_from": "2026-01-16", "date_to": "2026-02-28"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [(row["customer_name"], row["date"]) for row in rows] == [
+        ("Guest 3", "2026-01-20"), ("Guest 0", "2026-02-01")]
+
+    confirmed = client.get("/export/bookings", params={"status": "confirmed"}).text.splitlines()
+    assert [json.loads(line)["customer_name"] for line in confirmed] == ["Guest 0", "Guest 2"]
+
+def test_export_csv_tickets_by_booking_date(client, db_session):
+    _bookings(db_session)
+
+    response = client.get("/export/tickets", params={"format": "csv", "date_from": "2026-02-01"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert 'filename="tickets.csv"' in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["qr_code"] for row in rows] == ["PH-1", "PH-3"]
+    assert rows[0]["check_in_time"] == ""
+
+def test_export_empty_and_unknown(client, db_session):
+    assert client.get("/export/guide_bookings", params={"format": "csv"}).text.splitlines() == [
+        "id,guide_id,customer_name,customer_phone,booking_date,duration_days,notes,total_price,status,created_at"]
+    assert client.get("/export/equipment_rentals").text == ""
+    assert client.get("/export/users").status_code == 404
+    assert client.get("/export/bookings", params={"format": "xml"}).status_code == 422
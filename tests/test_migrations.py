@@ -0,0 +1,111 @@
+from sqlalchemy import create_engine, inspect, text
+
+from backend import models
+from backend.cache import catalog_cache
+from backend.database import Base
+from backend.migrations import MIGRATIONS, run_migrations
+from backend.routers import catalog
+
+MIGRATED_INDEXES = {"ix_tickets_booking_id", "ix_products_umkm_id", "ix_events_event_date",
+                    "ix_feedbacks_type_created_at", "ix_equipment_rentals_equipment_id_status"}
+
+def _index_names(engine):
+    inspector = inspect(engine)
+    return {ix["name"] for table in inspector.get_table_names() for ix in inspector.get_indexes(table)}
+
+def test_migrations_add_indexes_to_existing_tables(tmp_path, legacy_engine):
+    engine = legacy_engine(tmp_path)
+    assert not MIGRATED_INDEXES & _index_names(engine)
+
+    assert run_migrations(engine) == [version for version, _, _ in MIGRATIONS]
+    assert MIGRATED_INDEXES <= _index_names(engine)
+
+def test_migrations_run_once(tmp_path, legacy_engine):
+    engine = legacy_engine(tmp_path)
+    run_migrations(engine)
+    assert not run_migrations(engine)
+
+def test_migrations_are_safe_on_fresh_schema(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    Base.metadata.create_all(bind=engine)
+    run_migrations(engine)
+    with engine.connect() as conn:
+        versions = conn.execute(text("SELECT version FROM schema_migrations")).scalars().all()
+    assert versions == [version for version, _, _ in MIGRATIONS]
+
+def test_ready_once_migrated_and_warm(client):
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+    # warm_up filled the list cache and the catalog snapshot: the first requests are hits
+    misses = catalog_cache.stats()["misses"]
+    assert client.get("/destinations/").status_code == 200
+    assert client.get("/rentals/equipment").status_code == 200
+    assert catalog_cache.stats()["misses"] == misses
+    assert client.get("/catalog/").headers["etag"] == f'"catalog.{catalog._current_version()}"'
+    assert catalog._fresh(catalog._current_version())
+
+def test_date_migration_backfills_and_retypes(tmp_path, legacy_engine):
+    engine = legacy_engine(tmp_path)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE bookings"))
+        conn.execute(text(
+            "CREATE TABLE bookings (id INTEGER PRIMARY KEY, customer_name VARCHAR, email VARCHAR, "
+            "package_id INTEGER, date VARCHAR, status VARCHAR, num_visitors INTEGER, "
+            "total_price FLOAT, created_at DATETIME)"
+        ))
+        conn.execute(text(
+            "INSERT INTO bookings (id, date) VALUES (1, '2026-02-01'), (2, '03/02/2026'), (3, 'next week')"
+        ))
+
+    run_migrations(engine)
+
+    columns = {col["name"]: str(col["type"]) for col in inspect(engine).get_columns("bookings")}
+    assert columns["date"] == "DATE"
+    assert "ix_bookings_date" in _index_names(engine)
+    with engine.connect() as conn:
+        dates = conn.execute(text("SELECT date FROM bookings ORDER BY id")).scalars().all()
+    assert dates == ["2026-02-01", "2026-02-03", None]
+    with engine.connect() as conn:
+        backup = conn.execute(text("SELECT table_name, column_name, row_id, raw_value FROM legacy_date_values")).all()
+    assert backup == [("bookings", "date", 3, "next week")]
+
+def test_booking_with_unparsed_legacy_date_still_served(client, db_session):
+    db_session.add(models.Package(id=1, name="Snorkeling", price=100))
+    db_session.add(models.Booking(id=1, customer_name="Legacy", email="l@example.com", package_id=1,
+                                  date=None, status="pending", num_visitors=1))
+    db_session.commit()
+
+    assert client.get("/bookings/1").json()["date"] is None
+    response = client.put("/bookings/1/status", json={"status": "confirmed"})
+    assert response.status_code == 200
+    assert response.json()["date"] is None
+    assert client.get("/bookings/").status_code == 200
+
+def test_visitor_rollup_migration_backfills_history(tmp_path, legacy_engine):
+    engine = legacy_engine(tmp_path)
+    with engine.begin() as conn:
+        conn.execute(text("DROP TABLE visitor_stats"))
+        conn.execute(text(
+            "CREATE TABLE visitor_stats (id INTEGER PRIMARY KEY, destination_id INTEGER, date VARCHAR, "
+            "visitor_count INTEGER, revenue FLOAT)"
+        ))
+        conn.execute(text("INSERT INTO packages (id, price, destination_id) VALUES (1, 100, 7)"))
+        conn.execute(text(
+            "INSERT INTO bookings (id, package_id, status, num_visitors, total_price, created_at) VALUES "
+            "(1, 1, 'confirmed', 2, 500, '2026-03-01 09:15:00'), (2, 1, 'confirmed', 3, NULL, '2026-03-01 09:40:00'), "
+            "(3, 1, 'pending', 1, 900, '2026-03-01 10:00:00')"
+        ))
+        conn.execute(text(
+            "INSERT INTO tickets (id, booking_id, qr_code, status, check_in_time) VALUES "
+            "(1, 1, 'A', 'used', '2026-03-02 08:05:00'), (2, 2, 'B', 'valid', NULL)"
+        ))
+
+    run_migrations(engine)
+
+    assert "hour" in {col["name"] for col in inspect(engine).get_columns("visitor_stats")}
+    with engine.connect() as conn:
+        rows = conn.execute(text(
+            "SELECT destination_id, date, hour, visitor_count, revenue FROM visitor_stats ORDER BY date, hour"
+        )).all()
+    assert rows == [(7, "2026-03-01", 9, 0, 800.0), (7, "2026-03-02", 8, 2, 0.0)]
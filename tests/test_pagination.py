@@ -0,0 +1,86 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import update
+
+from backend import models, pagination
+
+def _walk(client, path, **params):
+    """Every row of ``path``, following X-Next-Cursor; returns (rows, number of pages)."""
+    rows, pages, cursor = [], 0, None
+    while True:
+        response = client.get(path, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        rows += response.json()
+        pages += 1
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            return rows, pages
+
+def test_catalog_list_cursor_walk(client):
+    for i in range(7):
+        client.post("/destinations/", json={"name": f"Island {i}", "description": "-"})
+
+    rows, pages = _walk(client, "/destinations/", limit=3)
+    assert [row["name"] for row in rows] == [f"Island {i}" for i in range(7)]
+    assert pages == 3
+    # Cached pages keep their cursor
+    assert client.get("/destinations/", params={"limit": 3}).headers["x-next-cursor"]
+
+def test_composite_key_walk_newest_first(client):
+    for i in range(5):
+        client.post("/feedback/", json={"type": "emergency" if i % 2 else "complaint", "subject": f"S{i}",
+                                        "message": "-"})
+
+    rows, pages = _walk(client, "/feedback/", limit=2)
+    assert [row["subject"] for row in rows] == ["S4", "S3", "S2", "S1", "S0"]
+    assert pages == 3
+    emergencies, _ = _walk(client, "/feedback/emergency", limit=1)
+    assert [row["subject"] for row in emergencies] == ["S3", "S1"]
+
+def test_events_walk_by_date(client):
+    destination = client.post("/destinations/", json={"name": "Pulau Harapan", "description": "-"}).json()
+    for day in ("2026-03-03", "2026-03-01", "2026-03-02"):
+        client.post("/events/", json={"destination_id": destination["id"], "title": day, "description": "-",
+                                      "event_date": f"{day}T10:00:00"})
+    rows, _ = _walk(client, "/events/", limit=1)
+    assert [row["title"] for row in rows] == ["2026-03-01", "2026-03-02", "2026-03-03"]
+
+def test_null_sort_keys_are_walked(client, db_session):
+    for i, created in enumerate([None, "2026-01-02", None, "2026-01-01", "2026-01-03"]):
+        db_session.add(models.Feedback(type="emergency", subject=f"S{i}", message="-",
+                                       created_at=datetime.fromisoformat(created or "2026-01-01")))
+    db_session.add(models.Destination(id=1, name="Pulau Harapan", description="-"))
+    for i, day in enumerate([None, "2026-03-02", None, "2026-03-01"]):
+        db_session.add(models.Event(destination_id=1, title=f"E{i}", description="-",
+                                    event_date=day and datetime.fromisoformat(day)))
+    db_session.commit()
+    db_session.execute(update(models.Feedback).where(models.Feedback.subject.in_(["S0", "S2"])).values(created_at=None))
+    db_session.commit()
+
+    # Newest first, undated last (by id); every page size crosses into the NULL keys differently
+    for limit in (1, 2, 3, 10):
+        rows, _ = _walk(client, "/feedback/", limit=limit)
+        assert [row["subject"] for row in rows] == ["S4", "S1", "S3", "S2", "S0"]
+        emergencies, _ = _walk(client, "/feedback/emergency", limit=limit)
+        assert [row["subject"] for row in emergencies] == ["S4", "S1", "S3", "S2", "S0"]
+        # Ascending, undated first
+        events, _ = _walk(client, "/events/", limit=limit)
+        assert [row["title"] for row in events] == ["E0", "E2", "E3", "E1"]
+
+def test_page_size_is_capped(client, monkeypatch):
+    monkeypatch.setattr(pagination, "MAX_PAGE_SIZE", 2)
+    for i in range(3):
+        client.post("/feedback/", json={"type": "review", "subject": f"S{i}", "message": "-"})
+    response = client.get("/feedback/", params={"limit": 1000})
+    assert len(response.json()) == 2
+    assert "x-next-cursor" in response.headers
+
+@pytest.mark.parametrize("cursor", ["not base64!", pagination.encode_cursor([]), pagination.encode_cursor([1, 2])])
+def test_invalid_cursor(client, cursor):
+    assert client.get("/tickets/", params={"cursor": cursor}).status_code == 400
+
+def test_skip_still_works(client):
+    for i in range(3):
+        client.post("/destinations/", json={"name": f"Island {i}", "description": "-"})
+    assert [row["name"] for row in client.get("/destinations/", params={"skip": 1}).json()] == ["Island 1", "Island 2"]
@@ -0,0 +1,71 @@
+import datetime
+
+from backend import models, projection
+from backend.pagination import Page
+from backend.projection import Fields, RowsResponse, columns_for
+from backend.routers import destinations
+from backend.routers.bookings import Booking
+
+def test_list_rows_match_detail_schema(client):
+    created = client.post("/destinations/", json={"name": "Pulau Pari", "description": "Pasir putih"}).json()
+
+    listed = client.get("/destinations/").json()
+    assert listed == [created]
+    assert client.get(f"/destinations/{created['id']}").json() == created
+
+def test_booking_list_serializes_dates(client):
+    pkg = client.post("/packages/", json={"name": "Day trip", "price": 100000, "features": "Boat"}).json()
+    client.post("/bookings/", json={
+        "customer_name": "Ayu", "email": "ayu@example.com", "package_id": pkg["id"], "date": "2026-05-02",
+    })
+    [booking] = client.get("/bookings/").json()
+    assert booking["date"] == "2026-05-02"
+    assert booking["total_price"] is None
+
+def test_projection_selects_only_schema_columns():
+    names = [column.name for column in columns_for(models.Booking, Booking)]
+    assert set(names) == set(Booking.model_fields)
+    assert "created_at" not in names
+
+def test_rows_response_encodes_dates():
+    body = RowsResponse([{"at": datetime.datetime(2026, 1, 2, 3, 4), "on": datetime.date(2026, 1, 2)}]).body
+    assert body == b'[{"at":"2026-01-02T03:04:00","on":"2026-01-02"}]'
+
+def test_to_json_matches_stdlib_encoder(monkeypatch):
+    content = {"rows": [{"id": 1, "name": "Pulau Kelapa ☀",
+                         "price": 150000.0, "rating": 4.5, "on": datetime.date(2026, 1, 2),
+                         "at": datetime.datetime(2026, 1, 2, 3, 4, 5, 600), "image_url": None, "active": True}],
+               "by_status": {"confirmed": 2, None: 1}}
+    fast = projection.to_json(content)
+    monkeypatch.setattr(projection, "orjson", None)
+    assert projection.to_json(content) == fast
+
+def test_fast_lists_keep_their_openapi_schema(client):
+    paths = client.get("/openapi.json").json()["paths"]
+    for path, schema in (("/tickets/", "Ticket"), ("/feedback/", "Feedback"), ("/users/", "UserResponse")):
+        items = paths[path]["get"]["responses"]["200"]["content"]["application/json"]["schema"]["items"]
+        assert items == {"$ref": f"#/components/schemas/{schema}"}
+
+def test_sparse_fields_select_only_those_columns(client):
+    client.post("/destinations/", json={"name": "Pulau Pari", "description": "Pasir putih " * 50})
+
+    assert client.get("/destinations/", params={"fields": "name, status"}).json() == [
+        {"id": 1, "name": "Pulau Pari", "status": "open"}]
+    # Cached separately from the full rows
+    assert client.get("/destinations/").json()[0]["description"].startswith("Pasir putih")
+    sql = str(destinations.destinations_query(Page(), Fields("name")))
+    assert "description" not in sql and "destinations.name" in sql
+
+    response = client.get("/destinations/", params={"fields": "name,secret"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown fields: secret"
+
+def test_sparse_fields_keep_the_cursor_keys(client):
+    for i in range(3):
+        client.post("/feedback/", json={"type": "review", "subject": f"S{i}", "message": "-"})
+
+    first = client.get("/feedback/", params={"fields": "subject", "limit": 2})
+    assert [set(row) for row in first.json()] == [{"id", "subject", "created_at"}] * 2
+    rest = client.get("/feedback/", params={"fields": "subject", "limit": 2,
+                                            "cursor": first.headers["x-next-cursor"]})
+    assert [row["subject"] for row in first.json() + rest.json()] == ["S2", "S1", "S0"]
@@ -0,0 +1,55 @@
+"""Statement budgets for list endpoints: each list is one query, however many rows it holds."""
+import datetime
+
+import pytest
+
+from backend import models
+
+ROWS = 5
+
+def _seed(db_session):
+    for i in range(ROWS):
+        destination = models.Destination(name=f"Pulau {i}", description="-")
+        equipment = models.CampingEquipment(name=f"Tenda {i}", description="-", category="tent",
+                                            price_per_day=50000, stock=3, available=3)
+        guide = models.TourGuide(name=f"Budi {i}", description="-", specialty="diving", languages="ID",
+                                 price_per_day=300000)
+        db_session.add_all([destination, equipment, guide])
+        db_session.flush()
+        day = datetime.date(2026, 3, 1 + i)
+        db_session.add_all([
+            models.Event(destination_id=destination.id, title=f"Festival {i}", description="-",
+                         event_date=datetime.datetime(2026, 3, 1 + i, 9)),
+            models.EquipmentRental(equipment_id=equipment.id, customer_name="Ani", customer_phone="0812",
+                                   rental_date=day, return_date=day, total_price=50000, status="active"),
+            models.GuideBooking(guide_id=guide.id, customer_name="Ani", customer_phone="0812", booking_date=day,
+                                total_price=300000, status="confirmed"),
+            models.Booking(customer_name="Ani", email="ani@example.com", date=day, status="pending"),
+        ])
+    db_session.commit()
+
+@pytest.mark.parametrize("path", ["/rentals/", "/guides/bookings/", "/events/", "/bookings/", "/feedback/",
+                                  "/destinations/"])
+def test_list_statement_budget(client, db_session, max_queries, path):
+    _seed(db_session)
+    with max_queries(1):
+        response = client.get(path)
+    assert response.status_code == 200
+
+def test_related_names_are_joined(client, db_session):
+    _seed(db_session)
+
+    assert [row["equipment_name"] for row in client.get("/rentals/").json()] == [
+        f"Tenda {i}" for i in reversed(range(ROWS))]
+    assert client.get("/guides/bookings/").json()[0]["guide_name"] == f"Budi {ROWS - 1}"
+    [event] = client.get("/events/", params={"limit": 1}).json()
+    assert (event["destination_name"], event["event_date"]) == ("Pulau 0", "2026-03-01T09:00:00")
+    assert client.get("/events/", params={"fields": "title,destination_name", "limit": 1}).json() == [
+        {"id": 1, "title": "Festival 0", "destination_name": "Pulau 0", "event_date": "2026-03-01T09:00:00"}]
+
+def test_max_queries_catches_n_plus_one(client, db_session, max_queries):
+    _seed(db_session)
+    with pytest.raises(AssertionError, match="6 statements"):
+        with max_queries(1):
+            for rental in db_session.query(models.EquipmentRental).all():
+                assert rental.equipment.name
@@ -0,0 +1,62 @@
+"""EXPLAIN QUERY PLAN checks: hot router queries must not fall back to full table scans."""
+import datetime
+import re
+
+import pytest
+from sqlalchemy import func, select
+
+from backend import models
+from backend.migrations import run_migrations
+from backend.pagination import Page, encode_cursor
+from backend.routers.exports import export_query
+
+ROUTER_QUERIES = {
+    "tickets.get_ticket_by_booking": select(models.Ticket).where(models.Ticket.booking_id == 1),
+    "tickets.check_in (ticket)": select(models.Ticket).where(models.Ticket.qr_code == "PH-1-X"),
+    "tickets.check_in (booking)": select(models.Booking).where(models.Booking.id == 1),
+    "bookings by package": select(models.Booking).where(models.Booking.package_id == 1),
+    "products.read_products_by_umkm": select(models.Product).where(models.Product.umkm_id == 1),
+    "facilities by destination": select(models.Facility).where(models.Facility.destination_id == 1),
+    "events.read_events": select(models.Event).order_by(models.Event.event_date).limit(100),
+    "feedback.read_feedback_list": select(models.Feedback).order_by(models.Feedback.created_at.desc()).limit(100),
+    "feedback.read_emergency_list": select(models.Feedback).where(models.Feedback.type == "emergency"),
+    "rentals by equipment and status": select(models.EquipmentRental).where(
+        models.EquipmentRental.equipment_id == 1, models.EquipmentRental.status == "active"),
+    "rentals by status": select(models.EquipmentRental).where(models.EquipmentRental.status == "active"),
+    "guide bookings by guide": select(models.GuideBooking).where(models.GuideBooking.guide_id == 1),
+    "stats dashboard (bookings by status)": select(models.Booking.status, func.count(models.Booking.id))
+    .group_by(models.Booking.status),
+    "stats dashboard (top UMKM)": select(models.UMKM).order_by(models.UMKM.rating.desc()).limit(5),
+    "feedback page after cursor": Page(cursor=encode_cursor(["2026-01-01T00:00:00", 5])).apply(
+        select(models.Feedback), models.Feedback.created_at, models.Feedback.id, descending=True),
+    "emergency page after cursor": Page(cursor=encode_cursor(["2026-01-01T00:00:00", 5])).apply(
+        select(models.Feedback).where(models.Feedback.type == "emergency"),
+        models.Feedback.created_at, models.Feedback.id, descending=True),
+    "events page after cursor": Page(cursor=encode_cursor(["2026-01-01", 5])).apply(
+        select(models.Event), models.Event.event_date, models.Event.id),
+    "feedback page among undated rows": Page(cursor=encode_cursor([None, 5])).apply(
+        select(models.Feedback), models.Feedback.created_at, models.Feedback.id, descending=True),
+    "events page among undated rows": Page(cursor=encode_cursor([None, 5])).apply(
+        select(models.Event), models.Event.event_date, models.Event.id),
+    "products of UMKM after cursor": Page(cursor=encode_cursor([5])).apply(
+        select(models.Product).where(models.Product.umkm_id == 1), models.Product.id),
+    "export bookings by date": export_query("bookings", datetime.date(2026, 1, 1), datetime.date(2026, 3, 31)),
+    "export rentals by date": export_query("equipment_rentals", datetime.date(2026, 1, 1), status="active"),
+    "export guide bookings by date": export_query("guide_bookings", date_to=datetime.date(2026, 3, 31)),
+}
+
+# A plan step that reads a whole table: "SCAN tickets" with no "USING ..." index.
+FULL_SCAN = re.compile(r"^SCAN \w+$")
+
+@pytest.fixture(scope="module")
+def migrated_engine(tmp_path_factory, legacy_engine):
+    engine = legacy_engine(tmp_path_factory.mktemp("plans"))
+    run_migrations(engine)
+    return engine
+
+@pytest.mark.parametrize("name", sorted(ROUTER_QUERIES))
+def test_router_query_uses_index(migrated_engine, name):
+    sql = str(ROUTER_QUERIES[name].compile(migrated_engine, compile_kwargs={"literal_binds": True}))
+    with migrated_engine.connect() as conn:
+        plan = [row[3] for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+    assert not [step for step in plan if FULL_SCAN.match(step) or "TEMP B-TREE" in step], plan
@@ -70,3 +70,28 @@ def test_insufficient_stock(client):
     )
     assert rental_res.status_code == 400
     assert "Not enough equipment available" in rental_res.json()["detail"]
+
+def test_rental_days_and_date_range(client):
+    equipment = client.post("/rentals/equipment", json={
+        "name": "Hammock",
+        "description": "Single",
+        "category": "hammock",
+        "price_per_day": 20000,
+        "stock": 4,
+    }).json()
+    for start, end in [("2026-03-01", "2026-03-04"), ("2026-04-10", "2026-04-11")]:
+        response = client.post("/rentals/", json={
+            "equipment_id": equipment["id"],
+            "customer_name": "Rina",
+            "customer_phone": "0812",
+            "rental_date": start,
+            "return_date": end,
+            "quantity": 1,
+        })
+        assert response.status_code == 200
+    assert response.json()["total_price"] == 20000
+
+    march = client.get("/rentals/", params={"date_from": "2026-03-01", "date_to": "2026-03-31"}).json()
+    assert [r["rental_date"] for r in march] == ["2026-03-01"]
+    assert march[0]["total_price"] == 60000
+    assert client.get("/rentals/", params={"date_from": "bad"}).status_code == 422
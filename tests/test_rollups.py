@@ -0,0 +1,91 @@
+import os
+import subprocess
+import sys
+from datetime import date, datetime
+
+from sqlalchemy import select
+
+from backend import models
+
+def _booking(client, package_id, status="pending", total_price=None, num_visitors=2):
+    return client.post("/bookings/", json={"customer_name": "Budi", "email": "b@x.id", "package_id": package_id,
+                                           "date": "2024-05-01", "status": status, "num_visitors": num_visitors,
+                                           "total_price": total_price}).json()
+
+def _setup(client, db_session):
+    destination = client.post("/destinations/", json={"name": "Pulau Harapan", "description": "-"}).json()
+    package = client.post("/packages/", json={"name": "Snorkeling", "price": 100000, "features": "Boat"}).json()
+    db_session.get(models.Package, package["id"]).destination_id = destination["id"]  # not settable via the API
+    db_session.commit()
+    return destination, package
+
+def test_confirmations_and_check_ins_roll_up(client, db_session):
+    destination, package = _setup(client, db_session)
+    paid = _booking(client, package["id"], total_price=250000)
+    unpriced = _booking(client, package["id"], status="confirmed", num_visitors=3)
+    client.put(f"/bookings/{paid['id']}/status", json={"status": "confirmed"})
+    ticket = client.post("/tickets/", json={"booking_id": paid["id"]}).json()
+    client.post("/tickets/check-in", json={"qr_code": ticket["qr_code"]})
+    client.post("/tickets/check-in", json={"qr_code": ticket["qr_code"]})  # rejected, counts nothing
+
+    rows = db_session.execute(select(models.VisitorStats)).scalars().all()
+    assert {row.destination_id for row in rows} == {destination["id"]}
+    assert sum(row.revenue for row in rows) == 250000 + 3 * 100000
+    assert sum(row.visitor_count for row in rows) == 2
+
+    client.put(f"/bookings/{unpriced['id']}/status", json={"status": "cancelled"})
+    db_session.expire_all()
+    assert sum(row.revenue for row in db_session.execute(select(models.VisitorStats)).scalars()) == 250000
+
+def test_visitor_series_reads_rollups(client, db_session):
+    destination, package = _setup(client, db_session)
+    _booking(client, package["id"], status="confirmed", total_price=150000)
+    today = date.today().isoformat()
+
+    series = client.get("/stats/visitors", params={"granularity": "day"}).json()
+    assert series["totals"] == {"visitor_count": 0, "revenue": 150000}
+    assert [point["period"] for point in series["series"]] == [today]
+
+    hourly = client.get("/stats/visitors", params={"granularity": "hour", "destination_id": destination["id"]})
+    assert hourly.json()["series"][0]["period"].startswith(today + " ")
+    assert client.get("/stats/visitors", params={"date_to": "2000-01-01"}).json()["totals"]["revenue"] == 0
+    assert client.get("/stats/visitors", params={"granularity": "year"}).status_code == 422
+
+    # Cached until the rollup changes
+    _booking(client, package["id"], status="confirmed", total_price=50000)
+    assert client.get("/stats/visitors").json()["totals"]["revenue"] == 200000
+
+def test_revenue_is_filed_at_booking_creation(client, db_session):
+    destination, package = _setup(client, db_session)
+    booking = _booking(client, package["id"], total_price=400000)
+    db_session.get(models.Booking, booking["id"]).created_at = datetime(2026, 3, 1, 9, 15)
+    db_session.commit()
+
+    # Confirmed and cancelled today, filed and taken back at creation, where migration 6 backfills it
+    client.put(f"/bookings/{booking['id']}/status", json={"status": "confirmed"})
+    row = db_session.execute(select(models.VisitorStats)).scalar_one()
+    assert (row.destination_id, row.date, row.hour, row.revenue) == (destination["id"], date(2026, 3, 1), 9, 400000)
+
+    client.put(f"/bookings/{booking['id']}/status", json={"status": "cancelled"})
+    db_session.expire_all()
+    assert db_session.execute(select(models.VisitorStats.revenue)).scalars().all() == [0]
+
+_WRITE_WITHOUT_THE_API = """
+import sys
+from backend import models
+from backend.database import SessionLocal, engine
+from backend.migrations import migrate
+migrate(engine)
+with SessionLocal() as db:
+    db.add(models.Package(id=1, name="Snorkeling", price=100000))
+    db.add(models.Booking(customer_name="Budi", email="b@x.id", package_id=1, status="confirmed", num_visitors=2))
+    db.commit()
+    print("backend.main" in sys.modules, db.query(models.VisitorStats.revenue).scalar())
+"""
+
+def test_rollups_kept_by_scripts_that_skip_the_api(tmp_path):
+    # A fresh interpreter: this one already imported backend.main through conftest
+    result = subprocess.run([sys.executable, "-c", _WRITE_WITHOUT_THE_API], capture_output=True, text=True, check=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            env={**os.environ, "DATABASE_PATH": str(tmp_path / "script.db")})
+    assert result.stdout.split() == ["False", "200000.0"]
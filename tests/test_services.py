@@ -0,0 +1,75 @@
+import json
+import os
+import re
+import sys
+
+import pytest
+
+from backend import services
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "frontend"))
+from backend_client import EmbeddedClient  # pylint: disable=wrong-import-position
+
+def _seed(client):
+    client.post("/destinations/", json={"name": "Pulau Harapan", "description": "Dermaga"})
+    client.post("/packages/", json={"name": "Snorkeling", "price": 150000, "features": "Boat, Lunch"})
+    client.post("/contents/", json={"type": "news", "title": "Festival", "body": "Segera"})
+    client.post("/umkm/", json={"name": "Kerupuk Ikan", "description": "Oleh-oleh", "category": "kuliner"})
+    client.post("/guides/", json={"name": "Budi", "description": "Pemandu", "specialty": "diving",
+                                     "languages": "ID", "price_per_day": 300000})
+    client.post("/rentals/equipment", json={"name": "Tenda", "description": "4 orang", "category": "tent",
+                                            "price_per_day": 50000, "stock": 2})
+
+def _call(client, path):
+    return client.portal.call(services.call, path)  # on the app's event loop, like the embedded client
+
+PATHS = [re.sub(r"\{\w+\}", "1", path) for path in services.READS] + [
+    "/destinations/99", "/umkm/99", "/rentals/equipment?fields=name,stock", "/guides/?fields=nope",
+    "/contents/?show_all=false", "/rentals/?date_from=2024-01-01"]
+
+@pytest.mark.parametrize("path", PATHS)
+def test_call_matches_http(client, path):
+    _seed(client)
+    expected = client.get(path)
+    status, body, _ = _call(client, path)
+    assert status == expected.status_code
+    assert json.loads(body) == expected.json()
+
+def test_call_skips_other_routes_and_invalid_parameters(client):
+    assert _call(client, "/users/") is None
+    assert _call(client, "/guides/stats") is None  # routed before /guides/{guide_id}, as in the app
+    assert _call(client, "/destinations/abc") is None
+    assert _call(client, "/destinations/?limit=many") is None
+    assert _call(client, "/destinations/?cursor=bogus")[0] == 400
+
+def test_call_pages_admin_lists(client):
+    _seed(client)
+    for day in ("2024-06-01", "2024-06-02"):
+        client.post("/guides/bookings/", json={"guide_id": 1, "customer_name": "Ani", "customer_phone": "0813",
+                                               "booking_date": day, "duration_days": 2})
+    status, body, headers = _call(client, "/guides/bookings/?skip=0&limit=1")
+    expected = client.get("/guides/bookings/", params={"skip": 0, "limit": 1})
+    assert status == 200
+    assert json.loads(body) == expected.json()
+    assert headers["X-Next-Cursor"] == expected.headers["x-next-cursor"]
+    assert json.loads(_call(client, "/guides/bookings/?skip=2")[1]) == []
+
+def test_call_sees_writes(client):
+    _seed(client)
+    assert len(json.loads(_call(client, "/destinations/")[1])) == 1
+    client.post("/destinations/", json={"name": "Pulau Pari", "description": "Pantai"})
+    assert len(json.loads(_call(client, "/destinations/")[1])) == 2
+
+def test_embedded_client_reads_and_writes(db_session):
+    api = EmbeddedClient()
+    try:
+        _use_embedded(api)
+    finally:
+        api.close()
+
+def _use_embedded(api):
+    api.post("/destinations/", json={"name": "Pulau Harapan", "description": "Dermaga"})
+    assert [row["name"] for row in api.get_json("/destinations/")] == ["Pulau Harapan"]
+    assert api.get("/destinations/1").json()["name"] == "Pulau Harapan"
+    assert api.get("/destinations/abc").status_code == 422  # answered by the app
+    assert api.get("/stats/dashboard").status_code == 200
@@ -0,0 +1,87 @@
+def _seed(client):
+    client.post("/destinations/", json={"name": "Pulau Harapan", "description": "Dermaga", "current_visitors": 40})
+    client.post("/destinations/", json={"name": "Pulau Pari", "description": "Pantai", "current_visitors": 2})
+    package = client.post("/packages/", json={"name": "Snorkeling", "price": 150000, "features": "Boat"}).json()
+    for status in ("pending", "confirmed", "confirmed", "cancelled"):
+        client.post("/bookings/", json={"customer_name": "Budi", "email": "b@x.id", "package_id": package["id"],
+                                        "date": "2024-05-01", "status": status})
+    for i in range(7):
+        client.post("/umkm/", json={"name": f"UMKM {i}", "description": "-", "category": "kuliner", "rating": i})
+
+def test_dashboard_figures(client):
+    _seed(client)
+    stats = client.get("/stats/dashboard").json()
+
+    assert stats["total_visitors"] == 42
+    assert stats["active_bookings"] == 3
+    assert stats["bookings_by_status"] == {"pending": 1, "confirmed": 2, "cancelled": 1}
+    assert stats["total_destinations"] == 2
+    assert stats["total_umkm"] == 7
+    assert [b["status"] for b in stats["recent_bookings"]] == ["cancelled", "confirmed", "confirmed", "pending"]
+    assert [u["rating"] for u in stats["top_umkm"]] == [6, 5, 4, 3, 2]
+
+def test_dashboard_empty(client):
+    stats = client.get("/stats/dashboard").json()
+    assert stats["total_visitors"] == 0 and stats["active_bookings"] == 0 and stats["top_umkm"] == []
+
+def test_dashboard_cached_until_write(client):
+    _seed(client)
+    first = client.get("/stats/dashboard").json()
+    hits = client.get("/cache/stats").json()["hits"]
+    assert client.get("/stats/dashboard").json() == first
+    assert client.get("/cache/stats").json()["hits"] == hits + 1
+
+    client.put("/bookings/1/status", json={"status": "cancelled"})
+    assert client.get("/stats/dashboard").json()["active_bookings"] == 2
+
+def test_rental_stats(client):
+    tent = client.post("/rentals/equipment", json={"name": "Tenda", "description": "4P", "category": "tent",
+                                                   "price_per_day": 100000, "stock": 2}).json()
+    client.post("/rentals/equipment", json={"name": "Kompor", "description": "Gas", "category": "cooking",
+                                            "price_per_day": 20000, "stock": 1})
+    for _ in range(2):
+        client.post("/rentals/", json={"equipment_id": tent["id"], "customer_name": "Budi", "customer_phone": "0812",
+                                       "rental_date": "2026-01-20", "return_date": "2026-01-21", "quantity": 1})
+    client.put("/rentals/1/status", params={"status": "returned"})
+    client.put("/rentals/2/status", params={"status": "active"})
+
+    stats = client.get("/rentals/stats").json()
+    assert stats == {"available_equipment": 2, "active_rentals": 1, "revenue": 200000,
+                     "by_status": {"active": 1, "returned": 1}}
+
+def test_guide_stats(client):
+    guide = client.post("/guides/", json={"name": "Budi", "description": "-", "specialty": "diving",
+                                          "languages": "ID", "price_per_day": 300000}).json()
+    for days in (1, 2):
+        client.post("/guides/bookings/", json={"guide_id": guide["id"], "customer_name": "Ani",
+                                               "customer_phone": "0813", "booking_date": "2026-02-01",
+                                               "duration_days": days})
+    client.put("/guides/bookings/2/status", params={"status": "completed"})
+
+    stats = client.get("/guides/stats").json()
+    assert stats["total_guides"] == 1
+    assert stats["available_guides"] == 1
+    assert stats["active_bookings"] == 1
+    assert stats["revenue"] == 600000
+    assert client.get("/guides/bookings/", params={"limit": 1}).json()[0]["id"] == 2  # newest first
+
+def test_content_stats_count_past_one_page(client):
+    for i in range(5):
+        client.post("/contents/", json={"type": "page" if i < 2 else "promo", "title": f"T{i}", "body": "-",
+                                        "is_published": i % 2 == 0})
+
+    assert len(client.get("/contents/", params={"limit": 2}).json()) == 2
+    assert client.get("/contents/stats").json() == {"total": 5, "published": 3, "draft": 2, "pages": 2}
+
+    client.put("/contents/2", json={"is_published": True})
+    assert client.get("/contents/stats").json()["published"] == 4
+
+def test_feedback_stats(client):
+    for kind in ("emergency", "complaint", "complaint"):
+        client.post("/feedback/", json={"type": kind, "subject": "-", "message": "-"})
+    client.put("/feedback/2", json={"status": "resolved"})
+
+    stats = client.get("/feedback/stats").json()
+    assert stats["total"] == 3 and stats["emergency"] == 1
+    assert stats["open"] == 2 and stats["resolved"] == 1
+    assert stats["by_type"] == {"emergency": 1, "complaint": 2}
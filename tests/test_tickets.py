@@ -0,0 +1,51 @@
+import pytest
+
+def _create_ticket(client):
+    pkg_res = client.post("/packages/", json={"name": "Snorkeling", "price": 150000, "features": "Boat,Lunch"})
+    booking_res = client.post(
+        "/bookings/",
+        json={
+            "customer_name": "Siti",
+            "email": "siti@example.com",
+            "package_id": pkg_res.json()["id"],
+            "date": "2026-02-01",
+            "num_visitors": 3
+        },
+    )
+    ticket_res = client.post("/tickets/", json={"booking_id": booking_res.json()["id"]})
+    assert ticket_res.status_code == 200
+    return ticket_res.json()
+
+def test_validate_ticket(client):
+    ticket = _create_ticket(client)
+
+    response = client.get(f"/tickets/validate/{ticket['qr_code']}")
+    assert response.status_code == 200
+    assert response.json()["valid"] is True
+    assert response.json()["booking"]["customer_name"] == "Siti"
+
+def test_check_in_flow(client):
+    ticket = _create_ticket(client)
+
+    response = client.post("/tickets/check-in", json={"qr_code": ticket["qr_code"]})
+    assert response.status_code == 200
+    assert response.json()["ticket_id"] == ticket["id"]
+
+    # Second scan is rejected and the ticket no longer validates
+    again = client.post("/tickets/check-in", json={"qr_code": ticket["qr_code"]})
+    assert again.status_code == 400
+    assert client.get(f"/tickets/validate/{ticket['qr_code']}").json()["status"] == "used"
+
+def test_check_in_unknown_ticket(client):
+    response = client.post("/tickets/check-in", json={"qr_code": "PH-0-NOPE"})
+    assert response.status_code == 404
+
+def test_ticket_list_includes_checked_in_tickets(client):
+    ticket = _create_ticket(client)
+    client.post("/tickets/check-in", json={"qr_code": ticket["qr_code"]})
+
+    response = client.get("/tickets/")
+    assert response.status_code == 200
+    [listed] = response.json()
+    assert listed["status"] == "used"
+    assert listed["check_in_time"].startswith("20")
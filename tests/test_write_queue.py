@@ -0,0 +1,61 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from backend import models
+from backend.database import Base, create_writer_engine
+from backend.write_queue import WriteQueue
+
+@pytest.fixture
+def write_queue(tmp_path):
+    engine = create_writer_engine(f"sqlite:///{tmp_path / 'writer.db'}")
+    Base.metadata.create_all(bind=engine)
+    queue = WriteQueue(sessionmaker(autoflush=False, expire_on_commit=False, bind=engine))
+    yield queue
+    queue.stop()
+    engine.dispose()
+
+def _add_feedback(db, subject):
+    if subject == "boom":
+        raise ValueError("rejected")
+    feedback = models.Feedback(type="suggestion", subject=subject, message="m")
+    db.add(feedback)
+    return feedback
+
+def test_concurrent_writes_all_commit(write_queue):
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(lambda i: write_queue.run(_add_feedback, f"s{i}"), range(100)))
+
+    assert sorted(f.subject for f in results) == sorted(f"s{i}" for i in range(100))
+    assert all(f.id is not None and f.status == "open" for f in results)
+    assert write_queue.jobs == 100
+
+def test_jobs_queued_behind_a_busy_writer_share_one_commit(write_queue):
+    started, release = threading.Event(), threading.Event()
+
+    def hold(db):
+        started.set()
+        release.wait(5)
+
+    blocker = write_queue.submit(hold)
+    assert started.wait(5)
+    futures = [write_queue.submit(_add_feedback, f"s{i}") for i in range(20)]
+    release.set()
+
+    assert [future.result().subject for future in futures] == [f"s{i}" for i in range(20)]
+    blocker.result()
+    assert write_queue.jobs == 21
+    assert write_queue.batches == 2  # the blocking job, then all 20 queued behind it
+
+def test_failing_job_rolls_back_alone(write_queue):
+    futures = [write_queue.submit(_add_feedback, subject) for subject in ("ok-1", "boom", "ok-2")]
+
+    assert futures[0].result().subject == "ok-1"
+    with pytest.raises(ValueError):
+        futures[1].result()
+    assert futures[2].result().subject == "ok-2"
+
+    stored = write_queue.run(lambda db: [f.subject for f in db.query(models.Feedback).all()])
+    assert sorted(stored) == ["ok-1", "ok-2"]